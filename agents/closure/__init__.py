@@ -0,0 +1 @@
+"""Closure agents - destruction agents and orchestrators for account closure"""
@@ -1,20 +1,130 @@
 #!/usr/bin/env python3
 """
 Complete Account Closure Orchestrator - Coordinates all destruction agents
+
+One orchestrator, two modes: parallel=True runs the comprehensive nuke
+(parallel agents + region-by-region annihilation + verification), while
+parallel=False runs the original phased closure (storage+compute, then
+infrastructure, then a human-readable report).
 """
 
+import contextlib
+import importlib
 import json
-import subprocess
+import logging
+
+import boto3
+
+try:
+    import orjson  # Rust JSON encoder - much faster on multi-MB stdout blobs
+except ImportError:
+    orjson = None
+
 import concurrent.futures
+import multiprocessing
+import threading
 from datetime import datetime
+from pathlib import Path
 import os
 import sys
 import time
 
+# Phase workers fork from a preloaded forkserver, so each agent process
+# starts with boto3/botocore (and friends) already imported instead of
+# paying the ~0.5-1s import cost per phase
+_MP_CONTEXT = multiprocessing.get_context('forkserver')
+_MP_CONTEXT.set_forkserver_preload(['boto3', 'botocore', 'json', 'datetime'])
+
+
+# Resolved once relative to this file; env vars override for runs outside
+# the repo checkout
+AGENTS_DIR = Path(os.environ.get('CLOSURE_AGENTS_DIR', Path(__file__).resolve().parent))
+RESULTS_DIR = Path(os.environ.get('CLOSURE_RESULTS_DIR', AGENTS_DIR / 'results'))
+
+
+def _run_agent_task(agent_script: str, phase_name: str, profile_name: str) -> dict:
+    """Run one destruction agent in-process and return its phase record.
+
+    Importing the agent module and calling run() skips a cold python3
+    interpreter (and a second boto3 import) per phase. Module-level so a
+    ProcessPoolExecutor can pickle it.
+    """
+    print(f"\n🚀 STARTING PHASE: {phase_name}")
+    print(f"   Agent: {agent_script}")
+
+    stamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+    stdout_path = str(RESULTS_DIR / f"{phase_name.lower()}_{stamp}.stdout.log")
+    stderr_path = str(RESULTS_DIR / f"{phase_name.lower()}_{stamp}.stderr.log")
+
+    try:
+        start_time = datetime.utcnow()
+
+        agents_dir = os.path.dirname(os.path.abspath(agent_script))
+        if agents_dir not in sys.path:
+            sys.path.insert(0, agents_dir)
+        module_name = os.path.basename(agent_script)
+        module_name = module_name[:-3] if module_name.endswith('.py') else module_name
+        module = importlib.import_module(module_name)
+
+        # The agents log through a QueueHandler whose listener bound the real
+        # stdout at import time, so redirecting stdout alone captures nothing.
+        # A handler writing straight into the phase log guarantees every
+        # record emitted during run() is on disk before the file closes; the
+        # redirect still catches stray prints and tracebacks.
+        with open(stdout_path, 'w') as out, open(stderr_path, 'w') as err, \
+                contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            capture = logging.StreamHandler(out)
+            capture.setFormatter(logging.Formatter('%(message)s'))
+            root_logger = logging.getLogger()
+            root_logger.addHandler(capture)
+            try:
+                destruction_log = module.run(profile_name)
+            finally:
+                root_logger.removeHandler(capture)
+                capture.flush()
+
+        end_time = datetime.utcnow()
+        duration = (end_time - start_time).total_seconds()
+
+        summary = destruction_log.get('summary', {})
+        failed_count = summary.get('failed', 0)
+        destroyed_count = sum(count for key, count in summary.items() if key != 'failed')
+
+        print(f"✅ PHASE COMPLETE: {phase_name} ({duration:.1f}s)")
+        return {
+            'status': 'success',
+            'start_time': start_time.isoformat(),
+            'end_time': end_time.isoformat(),
+            'duration_seconds': duration,
+            'summary': summary,
+            'resources_destroyed': destroyed_count,
+            'failures': failed_count,
+            'stdout_path': stdout_path,
+            'stderr_path': stderr_path
+        }
+    except Exception as e:
+        print(f"💥 PHASE ERROR: {phase_name} - {e}")
+        return {
+            'status': 'error',
+            'stdout_path': stdout_path,
+            'stderr_path': stderr_path,
+            'error': str(e)
+        }
+
+
 class ClosureOrchestrator:
-    def __init__(self, profile_name: str):
+    def __init__(self, profile_name: str, parallel: bool = True, write_full_json: bool = False):
         self.profile_name = profile_name
+        self.parallel = parallel
         self.start_time = datetime.utcnow()
+        self.write_full_json = write_full_json
+
+        # One Session shared by every nuke/verify call - credentials and
+        # botocore service models load once instead of per invocation
+        self.session = boto3.Session(profile_name=profile_name)
+        self._regions = None
+        self._clients = {}
+        self._clients_lock = threading.Lock()
         self.orchestration_log = {
             'profile_name': profile_name,
             'start_time': self.start_time.isoformat(),
@@ -22,69 +132,186 @@ class ClosureOrchestrator:
             'summary': {
                 'phases_completed': 0,
                 'phases_failed': 0,
-                'total_resources_destroyed': 0
+                'total_resources_destroyed': 0,
+                'total_failures': 0,
+                'completion_status': 'in_progress'
             }
         }
-        
+
+        # Append-only event log - one JSONL record per phase/region as work
+        # completes, so a crash mid-run doesn't lose the whole log
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        self.events_path = str(RESULTS_DIR / f"closure_orchestration_{profile_name}_{self.start_time.strftime('%Y%m%d_%H%M%S')}_events.jsonl")
+        self.events = open(self.events_path, 'a')
+        self._events_lock = threading.Lock()
+        self._emit_event('start', profile_name=profile_name, start_time=self.orchestration_log['start_time'])
+
+    def _emit_event(self, event: str, **fields):
+        """Append one JSONL record to the events log (phases emit concurrently)"""
+        record = {'event': event, 'timestamp': datetime.utcnow().isoformat()}
+        record.update(fields)
+        with self._events_lock:
+            self.events.write(json.dumps(record) + '\n')
+            self.events.flush()
+
+    def _client(self, service: str, region: str = None):
+        """Lazily create and cache one client per (service, region)"""
+        key = (service, region)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self.session.client(service, region_name=region)
+                self._clients[key] = client
+            return client
+
+    @property
+    def regions(self) -> list:
+        """All region names for this account, fetched once"""
+        if self._regions is None:
+            self._regions = [r['RegionName'] for r in
+                             self._client('ec2').describe_regions()['Regions']]
+        return self._regions
+
+    def _wait_stable(self, probes, poll=2, stable_for=2, max_wait=60):
+        """Poll cheap count probes until results hold steady instead of a blind sleep.
+
+        Returns True once every probe reports the same counts for
+        stable_for consecutive polls, False if max_wait elapses first.
+        """
+        last = None
+        stable = 0
+        waited = 0.0
+        while waited < max_wait:
+            try:
+                counts = tuple(probe() for probe in probes)
+            except Exception:
+                counts = None
+            if counts is not None and counts == last:
+                stable += 1
+                if stable >= stable_for:
+                    return True
+            else:
+                stable = 0
+            last = counts
+            time.sleep(poll)
+            waited += poll
+        return False
+
+    def _record_phase(self, phase_name: str, record: dict) -> dict:
+        """Store a phase record, update counters, and emit its event"""
+        self.orchestration_log['phases'][phase_name] = record
+        summary = self.orchestration_log['summary']
+        if record.get('status') == 'success':
+            summary['phases_completed'] += 1
+        else:
+            summary['phases_failed'] += 1
+        summary['total_resources_destroyed'] += record.get('resources_destroyed', 0)
+        summary['total_failures'] += record.get('failures', 0)
+        self._emit_event('phase', name=phase_name, **record)
+        return record
+
     def run_agent(self, agent_script: str, phase_name: str) -> dict:
         """Run a destruction agent"""
-        print(f"\n🚀 STARTING PHASE: {phase_name}")
-        print(f"   Agent: {agent_script}")
-        
-        try:
-            start_time = datetime.utcnow()
-            
-            # Run the agent
-            result = subprocess.run([
-                'python3', agent_script, self.profile_name
-            ], capture_output=True, text=True, timeout=1800)  # 30 min timeout
-            
-            end_time = datetime.utcnow()
-            duration = (end_time - start_time).total_seconds()
-            
-            if result.returncode == 0:
-                print(f"✅ PHASE COMPLETE: {phase_name} ({duration:.1f}s)")
-                self.orchestration_log['phases'][phase_name] = {
-                    'status': 'success',
-                    'start_time': start_time.isoformat(),
-                    'end_time': end_time.isoformat(),
-                    'duration_seconds': duration,
-                    'stdout': result.stdout,
-                    'stderr': result.stderr
-                }
-                self.orchestration_log['summary']['phases_completed'] += 1
-                return {'success': True, 'output': result.stdout}
-            else:
-                print(f"❌ PHASE FAILED: {phase_name}")
-                print(f"   Error: {result.stderr}")
-                self.orchestration_log['phases'][phase_name] = {
-                    'status': 'failed',
-                    'start_time': start_time.isoformat(),
-                    'end_time': end_time.isoformat(),
-                    'duration_seconds': duration,
-                    'error': result.stderr,
-                    'stdout': result.stdout
-                }
-                self.orchestration_log['summary']['phases_failed'] += 1
-                return {'success': False, 'error': result.stderr}
-                
-        except subprocess.TimeoutExpired:
-            print(f"⏰ PHASE TIMEOUT: {phase_name}")
-            self.orchestration_log['phases'][phase_name] = {
-                'status': 'timeout',
-                'error': 'Agent timed out after 30 minutes'
-            }
-            self.orchestration_log['summary']['phases_failed'] += 1
-            return {'success': False, 'error': 'Timeout'}
-        except Exception as e:
-            print(f"💥 PHASE ERROR: {phase_name} - {e}")
-            self.orchestration_log['phases'][phase_name] = {
-                'status': 'error',
-                'error': str(e)
+        record = self._record_phase(phase_name, _run_agent_task(agent_script, phase_name, self.profile_name))
+        if record.get('status') == 'success':
+            return {'success': True, 'output': record.get('stdout_path', '')}
+        return {'success': False, 'error': record.get('error', 'unknown error')}
+
+    def run_closure(self):
+        """Execute the closure in the mode selected at construction"""
+        if self.parallel:
+            return self.run_comprehensive_nuke()
+        return self.orchestrate_account_closure()
+
+    def orchestrate_account_closure(self):
+        """Phased closure: storage+compute, consistency wait, then infrastructure"""
+        print(f"🔥🔥🔥 ACCOUNT CLOSURE ORCHESTRATOR 🔥🔥🔥")
+        print(f"Account Profile: {self.profile_name}")
+        print(f"⚠️  WARNING: COMPLETE ACCOUNT DESTRUCTION IN PROGRESS!")
+        print("=" * 80)
+
+        agents_dir = str(AGENTS_DIR)
+
+        # Phases 1+2: Storage and Compute destruction are both parallel safe
+        print(f"\n📦💻 PHASES 1+2: STORAGE + COMPUTE DESTRUCTION (PARALLEL)")
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2, mp_context=_MP_CONTEXT) as executor:
+            futures = {
+                executor.submit(_run_agent_task, f"{agents_dir}/storage_destruction_agent.py",
+                                "Storage", self.profile_name): "storage",
+                executor.submit(_run_agent_task, f"{agents_dir}/compute_destruction_agent.py",
+                                "Compute", self.profile_name): "compute"
             }
-            self.orchestration_log['summary']['phases_failed'] += 1
-            return {'success': False, 'error': str(e)}
-    
+            for future in concurrent.futures.as_completed(futures):
+                phase_name = futures[future]
+                self._record_phase(phase_name, future.result())
+
+        # Single consistency barrier once both parallel phases are done
+        print(f"\n⏳ Waiting for AWS eventual consistency...")
+        ec2 = self._client('ec2', 'us-east-1')
+        s3 = self._client('s3')
+        self._wait_stable([
+            lambda: sum(len(r['Instances']) for r in ec2.describe_instances()['Reservations']),
+            lambda: len(s3.list_buckets()['Buckets'])
+        ])
+
+        # Phase 3: Infrastructure Destruction (must be last)
+        print(f"\n🏗️  PHASE 3: INFRASTRUCTURE DESTRUCTION")
+        self._record_phase('infrastructure', _run_agent_task(
+            f"{agents_dir}/infrastructure_destruction_agent.py", "Infrastructure", self.profile_name))
+
+        # Finalize summary and save
+        summary = self.orchestration_log['summary']
+        summary['completion_status'] = 'completed' if summary['phases_failed'] == 0 else 'partial'
+        self.save_orchestration_log()
+        self.generate_closure_report(self.events_path)
+
+        return self.orchestration_log
+
+    def generate_closure_report(self, log_file: str, now: datetime = None):
+        """Generate human-readable closure report"""
+        now = now or datetime.utcnow()
+        summary = self.orchestration_log['summary']
+        print(f"\n🔥🔥🔥 ACCOUNT CLOSURE COMPLETE 🔥🔥🔥")
+        print("=" * 80)
+        print(f"Account Profile: {self.profile_name}")
+        print(f"Completion Status: {summary['completion_status'].upper()}")
+        print(f"Total Resources Destroyed: {summary['total_resources_destroyed']}")
+        print(f"Total Failures: {summary['total_failures']}")
+
+        print(f"\n📊 PHASE BREAKDOWN:")
+        for phase_name, phase_data in self.orchestration_log['phases'].items():
+            status_emoji = "✅" if phase_data.get('status') == 'success' else "❌"
+            print(f"{status_emoji} {phase_name.title()}: {phase_data.get('resources_destroyed', 0)} destroyed, {phase_data.get('failures', 0)} failed")
+
+        # Full agent output lives in the streamed per-phase log files
+        print(f"\n📄 PER-PHASE AGENT LOGS:")
+        for phase_name, phase_data in self.orchestration_log['phases'].items():
+            if phase_data.get('stdout_path'):
+                print(f"   {phase_name.title()}: {phase_data['stdout_path']}")
+
+        print(f"\n📁 Full log saved to: {log_file}")
+        print(f"\n⚠️  ACCOUNT {self.profile_name} IS NOW READY FOR CLOSURE")
+
+        # Create summary file
+        summary_file = str(RESULTS_DIR / f"CLOSURE_SUMMARY_{self.profile_name}_{now.strftime('%Y%m%d_%H%M%S')}.txt")
+        with open(summary_file, 'w') as f:
+            f.write(f"AWS ACCOUNT CLOSURE SUMMARY\n")
+            f.write(f"==========================\n\n")
+            f.write(f"Account Profile: {self.profile_name}\n")
+            f.write(f"Closure Date: {now.strftime('%Y-%m-%d %H:%M:%S')} UTC\n")
+            f.write(f"Status: {summary['completion_status'].upper()}\n\n")
+            f.write(f"DESTRUCTION SUMMARY:\n")
+            f.write(f"- Total Resources Destroyed: {summary['total_resources_destroyed']}\n")
+            f.write(f"- Total Failures: {summary['total_failures']}\n\n")
+            f.write(f"PHASE RESULTS:\n")
+            for phase_name, phase_data in self.orchestration_log['phases'].items():
+                f.write(f"- {phase_name.title()}: {phase_data.get('status', 'unknown').upper()}\n")
+                if phase_data.get('stdout_path'):
+                    f.write(f"  Log: {phase_data['stdout_path']}\n")
+            f.write(f"\nFull details in: {log_file}\n")
+
+        print(f"📋 Summary report: {summary_file}")
+
     def run_comprehensive_nuke(self):
         """Execute comprehensive account destruction"""
         print("🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥")
@@ -93,29 +320,36 @@ class ClosureOrchestrator:
         print(f"     Start Time: {self.start_time.isoformat()}")
         print("🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥🔥")
         
-        agents_dir = "/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/closure"
+        agents_dir = str(AGENTS_DIR)
         
         # Phase 1: Parallel destruction of major resource types
         print("\n📋 PHASE 1: PARALLEL RESOURCE DESTRUCTION")
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=2, mp_context=_MP_CONTEXT) as executor:
             futures = {
-                executor.submit(self.run_agent, f"{agents_dir}/storage_destruction_agent.py", "STORAGE_DESTRUCTION"): "storage",
-                executor.submit(self.run_agent, f"{agents_dir}/compute_destruction_agent.py", "COMPUTE_DESTRUCTION"): "compute"
+                executor.submit(_run_agent_task, f"{agents_dir}/storage_destruction_agent.py",
+                                "STORAGE_DESTRUCTION", self.profile_name): "storage",
+                executor.submit(_run_agent_task, f"{agents_dir}/compute_destruction_agent.py",
+                                "COMPUTE_DESTRUCTION", self.profile_name): "compute"
             }
-            
+
             for future in concurrent.futures.as_completed(futures):
                 agent_type = futures[future]
                 try:
-                    result = future.result()
-                    if result['success']:
+                    record = self._record_phase(f"{agent_type.upper()}_DESTRUCTION", future.result())
+                    if record.get('status') == 'success':
                         print(f"✅ {agent_type.upper()} destruction completed")
                     else:
-                        print(f"❌ {agent_type.upper()} destruction failed: {result['error']}")
+                        print(f"❌ {agent_type.upper()} destruction failed: {record.get('error')}")
                 except Exception as e:
                     print(f"💥 {agent_type.upper()} destruction crashed: {e}")
         
-        # Short pause between phases
-        time.sleep(10)
+        # Pause between phases only as long as AWS takes to settle
+        ec2 = self._client('ec2', 'us-east-1')
+        s3 = self._client('s3')
+        self._wait_stable([
+            lambda: sum(len(r['Instances']) for r in ec2.describe_instances()['Reservations']),
+            lambda: len(s3.list_buckets()['Buckets'])
+        ], max_wait=30)
         
         # Phase 2: Infrastructure cleanup using AWS CLI nuke approach
         print("\n📋 PHASE 2: INFRASTRUCTURE ANNIHILATION")
@@ -126,6 +360,8 @@ class ClosureOrchestrator:
         self.verify_account_empty()
         
         # Save final orchestration log
+        summary = self.orchestration_log['summary']
+        summary['completion_status'] = 'completed' if summary['phases_failed'] == 0 else 'partial'
         self.save_orchestration_log()
         
         print("\n🔥🔥🔥 ACCOUNT CLOSURE ORCHESTRATION COMPLETE 🔥🔥🔥")
@@ -134,121 +370,215 @@ class ClosureOrchestrator:
         print(f"   Phases Failed: {self.orchestration_log['summary']['phases_failed']}")
     
     def run_cli_nuke(self):
-        """Use AWS CLI to nuke remaining resources"""
-        print("🔥 RUNNING AWS CLI NUKE OPERATIONS...")
-        
-        # Get all regions
+        """Nuke remaining resources across every region"""
+        print("🔥 RUNNING NUKE OPERATIONS...")
+
         try:
-            result = subprocess.run([
-                'aws', 'ec2', 'describe-regions', 
-                '--profile', self.profile_name,
-                '--query', 'Regions[].RegionName',
-                '--output', 'text'
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                regions = result.stdout.strip().split()
-                print(f"  Targeting {len(regions)} regions for cleanup")
-                
-                # Nuke each region in parallel
-                with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                    futures = [executor.submit(self.nuke_region, region) for region in regions]
-                    for future in concurrent.futures.as_completed(futures):
-                        try:
-                            future.result()
-                        except Exception as e:
-                            print(f"Error in region nuke: {e}")
-                            
+            regions = self.regions
+            nukers = self._region_nukers()
+            print(f"  Targeting {len(regions)} regions x {len(nukers)} services for cleanup")
+
+            # Flatten to independent (region, service) tasks so one slow
+            # service (usually CloudFormation) can't serialize its region
+            completed = {region: 0 for region in regions}
+            with concurrent.futures.ThreadPoolExecutor(max_workers=32) as executor:
+                futures = {executor.submit(nuker, region): (region, service)
+                           for region in regions
+                           for service, nuker in nukers.items()}
+                for future in concurrent.futures.as_completed(futures):
+                    region, service = futures[future]
+                    try:
+                        future.result()
+                        completed[region] += 1
+                    except Exception as e:
+                        print(f"    Error nuking {service} in {region}: {e}")
+
+            for region in regions:
+                self._emit_event('region_nuke', region=region,
+                                 services_completed=completed[region],
+                                 services_total=len(nukers))
+
         except Exception as e:
             print(f"Error getting regions for nuke: {e}")
-    
+
+    def _nuke_deletes(self, delete_call, identifiers):
+        """Fan per-resource deletes out over a thread pool.
+
+        Errors are swallowed per item to preserve the old `|| true`
+        semantics - this is best-effort cleanup of a dying account.
+        """
+        if not identifiers:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as pool:
+            futures = [pool.submit(delete_call, identifier) for identifier in identifiers]
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    pass
+
+    def _nuke_cloudformation(self, region: str):
+        cfn = self._client('cloudformation', region)
+        names = []
+        for page in cfn.get_paginator('list_stacks').paginate(
+                StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE']):
+            names.extend(stack['StackName'] for stack in page['StackSummaries'])
+        self._nuke_deletes(lambda name: cfn.delete_stack(StackName=name), names)
+
+    def _nuke_apigateway(self, region: str):
+        apigw = self._client('apigateway', region)
+        api_ids = []
+        for page in apigw.get_paginator('get_rest_apis').paginate():
+            api_ids.extend(api['id'] for api in page.get('items', []))
+        self._nuke_deletes(lambda api_id: apigw.delete_rest_api(restApiId=api_id), api_ids)
+
+    def _nuke_cloudwatch(self, region: str):
+        cloudwatch = self._client('cloudwatch', region)
+        names = []
+        for page in cloudwatch.get_paginator('describe_alarms').paginate():
+            names.extend(alarm['AlarmName'] for alarm in page.get('MetricAlarms', []))
+        # delete_alarms is already a batch API (up to 100 names per call)
+        for i in range(0, len(names), 100):
+            try:
+                cloudwatch.delete_alarms(AlarmNames=names[i:i+100])
+            except Exception:
+                pass
+
+    def _nuke_sns(self, region: str):
+        sns = self._client('sns', region)
+        topic_arns = []
+        for page in sns.get_paginator('list_topics').paginate():
+            topic_arns.extend(topic['TopicArn'] for topic in page.get('Topics', []))
+        self._nuke_deletes(lambda arn: sns.delete_topic(TopicArn=arn), topic_arns)
+
+    def _nuke_sqs(self, region: str):
+        sqs = self._client('sqs', region)
+        queue_urls = []
+        for page in sqs.get_paginator('list_queues').paginate():
+            queue_urls.extend(page.get('QueueUrls', []))
+        self._nuke_deletes(lambda url: sqs.delete_queue(QueueUrl=url), queue_urls)
+
+    def _nuke_vpcs(self, region: str):
+        ec2 = self._client('ec2', region)
+        vpc_ids = [vpc['VpcId'] for vpc in ec2.describe_vpcs()['Vpcs'] if not vpc['IsDefault']]
+
+        def delete_vpc(vpc_id):
+            subnets = ec2.describe_subnets(
+                Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}])['Subnets']
+            for subnet in subnets:
+                try:
+                    ec2.delete_subnet(SubnetId=subnet['SubnetId'])
+                except Exception:
+                    pass
+            ec2.delete_vpc(VpcId=vpc_id)
+
+        self._nuke_deletes(delete_vpc, vpc_ids)
+
+    def _region_nukers(self) -> dict:
+        """Per-service nuke functions, keyed by service name"""
+        return {
+            'cloudformation': self._nuke_cloudformation,
+            'apigateway': self._nuke_apigateway,
+            'cloudwatch': self._nuke_cloudwatch,
+            'sns': self._nuke_sns,
+            'sqs': self._nuke_sqs,
+            'vpc': self._nuke_vpcs,
+        }
+
     def nuke_region(self, region: str):
-        """Nuke all remaining resources in a region"""
+        """Nuke all remaining resources in a region via boto3 batch calls"""
         print(f"  🔥 NUKING REGION: {region}")
-        
-        nuke_commands = [
-            # Delete CloudFormation stacks
-            f"aws cloudformation list-stacks --profile {self.profile_name} --region {region} --stack-status-filter CREATE_COMPLETE UPDATE_COMPLETE --query 'StackSummaries[].StackName' --output text | xargs -n1 -I{{}} aws cloudformation delete-stack --profile {self.profile_name} --region {region} --stack-name {{}} || true",
-            
-            # Delete API Gateways
-            f"aws apigateway get-rest-apis --profile {self.profile_name} --region {region} --query 'items[].id' --output text | xargs -n1 -I{{}} aws apigateway delete-rest-api --profile {self.profile_name} --region {region} --rest-api-id {{}} || true",
-            
-            # Delete CloudWatch alarms
-            f"aws cloudwatch describe-alarms --profile {self.profile_name} --region {region} --query 'MetricAlarms[].AlarmName' --output text | xargs -n1 -I{{}} aws cloudwatch delete-alarms --profile {self.profile_name} --region {region} --alarm-names {{}} || true",
-            
-            # Delete SNS topics
-            f"aws sns list-topics --profile {self.profile_name} --region {region} --query 'Topics[].TopicArn' --output text | xargs -n1 -I{{}} aws sns delete-topic --profile {self.profile_name} --region {region} --topic-arn {{}} || true",
-            
-            # Delete SQS queues
-            f"aws sqs list-queues --profile {self.profile_name} --region {region} --query 'QueueUrls[]' --output text | xargs -n1 -I{{}} aws sqs delete-queue --profile {self.profile_name} --region {region} --queue-url {{}} || true",
-            
-            # Delete VPC resources
-            f"aws ec2 describe-vpcs --profile {self.profile_name} --region {region} --query 'Vpcs[?IsDefault==`false`].VpcId' --output text | xargs -n1 -I{{}} bash -c 'aws ec2 describe-subnets --profile {self.profile_name} --region {region} --filters Name=vpc-id,Values={{}} --query \"Subnets[].SubnetId\" --output text | xargs -n1 -I[] aws ec2 delete-subnet --profile {self.profile_name} --region {region} --subnet-id [] || true; aws ec2 delete-vpc --profile {self.profile_name} --region {region} --vpc-id {{}} || true'",
-        ]
-        
-        for cmd in nuke_commands:
+
+        nukers = self._region_nukers()
+        services_completed = 0
+        for service, nuker in nukers.items():
             try:
-                subprocess.run(cmd, shell=True, timeout=300, capture_output=True)
-            except:
-                pass  # Continue on errors
-    
+                nuker(region)
+                services_completed += 1
+            except Exception as e:
+                print(f"    Error nuking {service} in {region}: {e}")
+
+        self._emit_event('region_nuke', region=region, services_completed=services_completed,
+                         services_total=len(nukers))
+
     def verify_account_empty(self):
-        """Verify the account is ready for closure"""
+        """Verify the account is ready for closure - every service, every region"""
         print("🔍 VERIFYING ACCOUNT IS EMPTY...")
-        
-        verification_results = {
-            's3_buckets': 0,
-            'ec2_instances': 0,
-            'lambda_functions': 0,
-            'cloudformation_stacks': 0
-        }
-        
+
+        def count_buckets():
+            return len(self._client('s3').list_buckets()['Buckets'])
+
+        def count_instances(region):
+            reservations = self._client('ec2', region).describe_instances()['Reservations']
+            return sum(len(r['Instances']) for r in reservations)
+
+        def count_functions(region):
+            return sum(len(page['Functions']) for page in
+                       self._client('lambda', region).get_paginator('list_functions').paginate())
+
+        def count_stacks(region):
+            return sum(len(page['StackSummaries']) for page in
+                       self._client('cloudformation', region).get_paginator('list_stacks').paginate(
+                           StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE']))
+
+        # One probe per (service, region) pair - all I/O bound, so fan the
+        # whole set out at once instead of walking regions serially
+        probes = [('s3_buckets', None, count_buckets)]
+        for region in self.regions:
+            probes.append(('ec2_instances', region, lambda r=region: count_instances(r)))
+            probes.append(('lambda_functions', region, lambda r=region: count_functions(r)))
+            probes.append(('cloudformation_stacks', region, lambda r=region: count_stacks(r)))
+
+        verification_results = {}
         try:
-            # Check S3 buckets
-            result = subprocess.run([
-                'aws', 's3api', 'list-buckets',
-                '--profile', self.profile_name,
-                '--query', 'length(Buckets)',
-                '--output', 'text'
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                verification_results['s3_buckets'] = int(result.stdout.strip())
-            
-            # Check EC2 instances (sample region)
-            result = subprocess.run([
-                'aws', 'ec2', 'describe-instances',
-                '--profile', self.profile_name,
-                '--region', 'us-east-1',
-                '--query', 'length(Reservations[].Instances[])',
-                '--output', 'text'
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0 and result.stdout.strip() != 'None':
-                verification_results['ec2_instances'] = int(result.stdout.strip())
-            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=32) as pool:
+                futures = {pool.submit(probe): (service, region)
+                           for service, region, probe in probes}
+                for future in concurrent.futures.as_completed(futures):
+                    service, region = futures[future]
+                    try:
+                        count = future.result()
+                    except Exception as e:
+                        print(f"   Error probing {service} in {region}: {e}")
+                        continue
+                    if region is None:
+                        verification_results[service] = count
+                    else:
+                        verification_results.setdefault(service, {})[region] = count
+
             print("🔍 VERIFICATION RESULTS:")
-            for resource_type, count in verification_results.items():
-                status = "✅ CLEAN" if count == 0 else f"⚠️  {count} remaining"
-                print(f"   {resource_type}: {status}")
-            
+            for service, counts in sorted(verification_results.items()):
+                remaining = counts if isinstance(counts, int) else sum(counts.values())
+                status = "✅ CLEAN" if remaining == 0 else f"⚠️  {remaining} remaining"
+                print(f"   {service}: {status}")
+
             self.orchestration_log['verification'] = verification_results
-            
+
         except Exception as e:
             print(f"Error in verification: {e}")
-    
+
     def save_orchestration_log(self):
         """Save the complete orchestration log"""
-        self.orchestration_log['end_time'] = datetime.utcnow().isoformat()
-        self.orchestration_log['total_duration_seconds'] = (datetime.utcnow() - self.start_time).total_seconds()
-        
-        output_dir = "/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/closure/results"
-        os.makedirs(output_dir, exist_ok=True)
-        
-        filename = f"{output_dir}/closure_orchestration_{self.profile_name}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(self.orchestration_log, f, indent=2)
-        
+        now = datetime.utcnow()
+        self.orchestration_log['end_time'] = now.isoformat()
+        self.orchestration_log['total_duration_seconds'] = (now - self.start_time).total_seconds()
+
+        self._emit_event('summary',
+                         end_time=self.orchestration_log['end_time'],
+                         total_duration_seconds=self.orchestration_log['total_duration_seconds'],
+                         verification=self.orchestration_log.get('verification'),
+                         **self.orchestration_log['summary'])
+
+        filename = self.events_path
+        if self.write_full_json:
+            filename = str(RESULTS_DIR / f"closure_orchestration_{self.profile_name}_{now.strftime('%Y%m%d_%H%M%S')}.json")
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(self.orchestration_log, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(self.orchestration_log, f, indent=2)
+
         print(f"\n📊 Orchestration log saved to: {filename}")
 
 
@@ -271,7 +601,7 @@ def main():
         sys.exit(1)
     
     orchestrator = ClosureOrchestrator(profile_name)
-    orchestrator.run_comprehensive_nuke()
+    orchestrator.run_closure()
 
 
 if __name__ == "__main__":
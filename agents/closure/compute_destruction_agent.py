@@ -5,18 +5,101 @@ Compute Destruction Agent - Destroys ALL compute resources for account closure
 
 import json
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+try:
+    import orjson  # Rust JSON encoder - serializes big logs 5-10x faster
+except ImportError:
+    orjson = None
+import atexit
 import concurrent.futures
+import logging
+import logging.handlers
+import queue
+import functools
+import threading
 import time
 from datetime import datetime
+from pathlib import Path
 import os
 import sys
 from typing import Dict, List, Any
 
+# Destroying all regions x all resources is guaranteed to hit API throttling;
+# adaptive mode rate-limits client-side and retries throttles instead of
+# surfacing them as permanent failures in the destruction log
+# max_pool_connections must outpace the widest thread pool (32 bucket
+# workers / 16 regions x 20 deletes locally) or threads silently serialize
+# waiting for an HTTPS connection slot
+RETRY_CFG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'},
+                   max_pool_connections=50)
+
+# All output funnels through one QueueListener thread: log.info() takes the
+# stdio lock and flushes per line, which becomes a serialization point
+# once deletes fan out across thread pools
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+log = logging.getLogger(__name__)
+
+
+_REGION_CACHE = Path.home() / '.cache' / 'infra-decom' / 'regions.json'
+_REGION_CACHE_TTL = 24 * 3600
+
+
+@functools.lru_cache(maxsize=4)
+def _get_regions(profile_name: str) -> tuple:
+    """Enabled regions for a profile, cached on disk for 24h.
+
+    Every agent calls describe_regions at startup and the answer almost
+    never changes, so the compute/infra/S3 agents running back-to-back
+    share one lookup via the cache file.
+    """
+    cached = {}
+    try:
+        # Read the file even past its TTL: the rewrite below merges this
+        # profile's fresh answer into it, and starting from {} would wipe
+        # every other profile's entry and force them back onto
+        # describe_regions
+        fresh = time.time() - _REGION_CACHE.stat().st_mtime < _REGION_CACHE_TTL
+        cached = json.loads(_REGION_CACHE.read_text())
+        if fresh and profile_name in cached:
+            return tuple(cached[profile_name])
+    except (OSError, ValueError):
+        cached = {}
+
+    ec2 = boto3.Session(profile_name=profile_name).client(
+        'ec2', region_name='us-east-1', config=RETRY_CFG)
+    regions = [r['RegionName'] for r in ec2.describe_regions()['Regions']]
+
+    try:
+        _REGION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        cached[profile_name] = regions
+        _REGION_CACHE.write_text(json.dumps(cached))
+    except OSError:
+        pass
+    return tuple(regions)
+
 class ComputeDestructionAgent:
     def __init__(self, profile_name: str):
         self.profile_name = profile_name
         self.session = boto3.Session(profile_name=profile_name)
+        self._clients = {}
+        self._clients_lock = threading.Lock()
         self.account_id = self.get_account_id()
+        # Regions are destroyed concurrently; every destruction_log mutation
+        # (lists and summary counters) must hold this lock
+        self._log_lock = threading.Lock()
+        # Columnar buffer for destroyed entries (see _log_destroyed)
+        self._destroyed_type = []
+        self._destroyed_id = []
+        self._destroyed_region = []
+        self._destroyed_ts = []
         self.destruction_log = {
             'account_id': self.account_id,
             'profile_name': profile_name,
@@ -30,115 +113,178 @@ class ComputeDestructionAgent:
             }
         }
         
+    def _client(self, service: str, region: str = None):
+        """Shared per-(service, region) client.
+
+        Client construction costs ~50-200ms (endpoint resolution, model
+        load) and Session.client is not thread-safe, so cache one client
+        per (service, region) behind a lock - the region workers then
+        reuse clients across phases instead of rebuilding them.
+        """
+        key = (service, region)
+        with self._clients_lock:
+            if key not in self._clients:
+                self._clients[key] = self.session.client(service, region_name=region, config=RETRY_CFG)
+            return self._clients[key]
+    
     def get_account_id(self) -> str:
         try:
-            sts = self.session.client('sts')
+            sts = self._client('sts')
             return sts.get_caller_identity()['Account']
         except Exception as e:
-            print(f"Error getting account ID: {e}")
+            log.info(f"Error getting account ID: {e}")
             return "unknown"
     
+    def _log_destroyed(self, rtype, rid, region, ts, counter):
+        """Record one destroyed resource.
+
+        Stored column-wise (four parallel lists) instead of one dict per
+        entry - ~4x less memory over a long destruction - and zipped back
+        into the log's list-of-dicts shape at save time.
+        """
+        with self._log_lock:
+            self._destroyed_type.append(rtype)
+            self._destroyed_id.append(rid)
+            self._destroyed_region.append(region)
+            self._destroyed_ts.append(ts)
+            self.destruction_log['summary'][counter] += 1
+    
+    def _delete_parallel(self, delete_one, items, max_workers=20):
+        """Fan independent per-resource deletes out across a thread pool.
+
+        Each worker handles (and logs) its own failures, so map() never
+        raises; deletes within a region overlap instead of paying one RTT
+        per resource serially.
+        """
+        if not items:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            list(executor.map(delete_one, items))
+    
     def destroy_ec2_instances(self, region: str):
         """Destroy all EC2 instances in a region"""
-        print(f"🔥 DESTROYING EC2 INSTANCES in {region}...")
-        ec2 = self.session.client('ec2', region_name=region)
+        log.info(f"🔥 DESTROYING EC2 INSTANCES in {region}...")
+        ec2 = self._client('ec2', region)
+        # One timestamp per region batch - these entries all belong to the
+        # same logical operation, so skip a clock_gettime+strftime per entry
+        ts = datetime.utcnow().isoformat()
         
         try:
-            instances = ec2.describe_instances(
-                Filters=[{'Name': 'instance-state-name', 'Values': ['running', 'stopped', 'stopping']}]
+            # Paginate - a plain describe_instances silently stops at one page,
+            # missing instances in regions with large fleets
+            pages = ec2.get_paginator('describe_instances').paginate(
+                Filters=[{'Name': 'instance-state-name', 'Values': ['running', 'stopped', 'stopping']}],
+                PaginationConfig={'PageSize': 1000}  # API max
             )
             
-            instance_ids = []
-            for reservation in instances['Reservations']:
-                for instance in reservation['Instances']:
-                    instance_ids.append(instance['InstanceId'])
+            instance_ids = [
+                instance['InstanceId']
+                for page in pages
+                for reservation in page['Reservations']
+                for instance in reservation['Instances']
+            ]
             
             if not instance_ids:
-                print(f"  No EC2 instances found in {region}")
+                log.info(f"  No EC2 instances found in {region}")
                 return
                 
-            print(f"  Found {len(instance_ids)} instances to destroy")
-            
-            # Disable termination protection for all instances
-            for instance_id in instance_ids:
-                try:
-                    ec2.modify_instance_attribute(
-                        InstanceId=instance_id,
-                        DisableApiTermination={'Value': False}
-                    )
-                except:
-                    pass  # Instance might not have termination protection
+            log.info(f"  Found {len(instance_ids)} instances to destroy")
             
-            # Terminate all instances
-            print(f"  🗑️  Terminating {len(instance_ids)} instances...")
-            ec2.terminate_instances(InstanceIds=instance_ids)
+            # Terminate first - most instances have no termination protection,
+            # so the common case needs zero modify_instance_attribute calls
+            log.info(f"  🗑️  Terminating {len(instance_ids)} instances...")
+            try:
+                ec2.terminate_instances(InstanceIds=instance_ids)
+            except Exception as e:
+                if 'OperationNotPermitted' not in str(e):
+                    raise
+                # Some instances are protected - clear the attribute in
+                # parallel, then retry the batch terminate
+                log.info(f"  🔓 Disabling termination protection...")
+                def disable_protection(instance_id):
+                    try:
+                        ec2.modify_instance_attribute(
+                            InstanceId=instance_id,
+                            DisableApiTermination={'Value': False}
+                        )
+                    except ClientError as e:
+                        # Spot instances reject the attribute write - benign;
+                        # anything else (incl. throttles past the retry
+                        # config) must surface, or the retried terminate
+                        # fails the whole batch again
+                        if e.response['Error']['Code'] != 'UnsupportedOperation':
+                            raise
+                self._delete_parallel(disable_protection, instance_ids, max_workers=10)
+                ec2.terminate_instances(InstanceIds=instance_ids)
             
             for instance_id in instance_ids:
-                self.destruction_log['destroyed'].append({
-                    'type': 'ec2_instance',
-                    'id': instance_id,
-                    'region': region,
-                    'timestamp': datetime.utcnow().isoformat()
-                })
-                self.destruction_log['summary']['ec2_instances'] += 1
-                print(f"    ✅ TERMINATED: {instance_id}")
+                self._log_destroyed('ec2_instance', instance_id, region, ts, 'ec2_instances')
+                log.info(f"    ✅ TERMINATED: {instance_id}")
                 
         except Exception as e:
-            print(f"Error destroying EC2 instances in {region}: {e}")
+            log.info(f"Error destroying EC2 instances in {region}: {e}")
     
     def destroy_lambda_functions(self, region: str):
         """Destroy all Lambda functions in a region"""
-        print(f"🔥 DESTROYING LAMBDA FUNCTIONS in {region}...")
-        lambda_client = self.session.client('lambda', region_name=region)
+        log.info(f"🔥 DESTROYING LAMBDA FUNCTIONS in {region}...")
+        lambda_client = self._client('lambda', region)
+        # One timestamp per region batch - these entries all belong to the
+        # same logical operation, so skip a clock_gettime+strftime per entry
+        ts = datetime.utcnow().isoformat()
         
         try:
             paginator = lambda_client.get_paginator('list_functions')
             functions = []
-            for page in paginator.paginate():
+            for page in paginator.paginate(PaginationConfig={'PageSize': 50}):  # API max
                 functions.extend(page['Functions'])
             
             if not functions:
-                print(f"  No Lambda functions found in {region}")
+                log.info(f"  No Lambda functions found in {region}")
                 return
                 
-            print(f"  Found {len(functions)} functions to destroy")
+            log.info(f"  Found {len(functions)} functions to destroy")
             
-            for function in functions:
+            def delete_one(function):
                 function_name = function['FunctionName']
                 try:
-                    print(f"  🗑️  Destroying function: {function_name}")
+                    log.info(f"  🗑️  Destroying function: {function_name}")
                     lambda_client.delete_function(FunctionName=function_name)
                     
-                    self.destruction_log['destroyed'].append({
-                        'type': 'lambda_function',
-                        'id': function_name,
-                        'region': region,
-                        'timestamp': datetime.utcnow().isoformat()
-                    })
-                    self.destruction_log['summary']['lambda_functions'] += 1
-                    print(f"    ✅ DESTROYED: {function_name}")
+                    self._log_destroyed('lambda_function', function_name, region, ts, 'lambda_functions')
+                    log.info(f"    ✅ DESTROYED: {function_name}")
                     
                 except Exception as e:
-                    print(f"    ❌ FAILED: {function_name} - {e}")
-                    self.destruction_log['failed'].append({
-                        'type': 'lambda_function',
-                        'id': function_name,
-                        'region': region,
-                        'error': str(e)
-                    })
-                    self.destruction_log['summary']['failed'] += 1
+                    log.info(f"    ❌ FAILED: {function_name} - {e}")
+                    with self._log_lock:
+                        self.destruction_log['failed'].append({
+                            'type': 'lambda_function',
+                            'id': function_name,
+                            'region': region,
+                            'error': str(e)
+                        })
+                        self.destruction_log['summary']['failed'] += 1
+            
+            self._delete_parallel(delete_one, functions)
                     
         except Exception as e:
-            print(f"Error destroying Lambda functions in {region}: {e}")
+            log.info(f"Error destroying Lambda functions in {region}: {e}")
+    
+    def _process_region(self, region: str):
+        """Destroy all compute resources in one region (thread-pool worker)"""
+        try:
+            log.info(f"\n🌍 Processing region: {region}")
+            self.destroy_lambda_functions(region)
+            self.destroy_ec2_instances(region)
+        except Exception as e:
+            log.info(f"Error processing region {region}: {e}")
     
     def destroy_all_compute(self):
         """Main destruction execution"""
-        print(f"🔥🔥🔥 COMPUTE DESTRUCTION AGENT - ACCOUNT {self.account_id} 🔥🔥🔥")
-        print("⚠️  WARNING: ALL COMPUTE RESOURCES WILL BE PERMANENTLY DESTROYED!")
+        log.info(f"🔥🔥🔥 COMPUTE DESTRUCTION AGENT - ACCOUNT {self.account_id} 🔥🔥🔥")
+        log.info("⚠️  WARNING: ALL COMPUTE RESOURCES WILL BE PERMANENTLY DESTROYED!")
         
-        # Get all regions
-        ec2 = self.session.client('ec2', region_name='us-east-1')
-        regions = [r['RegionName'] for r in ec2.describe_regions()['Regions']]
+        # Get all regions (cached - the list effectively never changes)
+        regions = _get_regions(self.profile_name)
         
         # Process regions with resources first
         priority_regions = ['us-east-1', 'us-east-2', 'us-west-1', 'us-west-2']
@@ -146,14 +292,17 @@ class ComputeDestructionAgent:
         
         all_regions = priority_regions + other_regions
         
-        for region in all_regions:
-            try:
-                print(f"\n🌍 Processing region: {region}")
-                self.destroy_lambda_functions(region)
-                self.destroy_ec2_instances(region)
-            except Exception as e:
-                print(f"Error processing region {region}: {e}")
+        # Destruction is network-bound (HTTP RTT per call), so fan regions
+        # out across a thread pool; each worker uses its own per-region clients
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(self._process_region, all_regions))
         
+        # Materialize the columnar destroyed buffer for serialization
+        self.destruction_log['destroyed'] = [
+            {'type': t, 'id': i, 'region': r, 'timestamp': ts}
+            for t, i, r, ts in zip(self._destroyed_type, self._destroyed_id,
+                                   self._destroyed_region, self._destroyed_ts)
+        ]
         self.destruction_log['end_time'] = datetime.utcnow().isoformat()
         
         # Save results
@@ -161,25 +310,35 @@ class ComputeDestructionAgent:
         os.makedirs(output_dir, exist_ok=True)
         
         filename = f"{output_dir}/compute_destruction_{self.account_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(self.destruction_log, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.destruction_log, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(self.destruction_log, f, indent=2)
         
-        print(f"\n🔥 COMPUTE DESTRUCTION COMPLETE!")
-        print(f"  EC2 Instances destroyed: {self.destruction_log['summary']['ec2_instances']}")
-        print(f"  Lambda Functions destroyed: {self.destruction_log['summary']['lambda_functions']}")
-        print(f"  Failed: {self.destruction_log['summary']['failed']}")
-        print(f"  Results saved to: {filename}")
+        log.info(f"\n🔥 COMPUTE DESTRUCTION COMPLETE!")
+        log.info(f"  EC2 Instances destroyed: {self.destruction_log['summary']['ec2_instances']}")
+        log.info(f"  Lambda Functions destroyed: {self.destruction_log['summary']['lambda_functions']}")
+        log.info(f"  Failed: {self.destruction_log['summary']['failed']}")
+        log.info(f"  Results saved to: {filename}")
         
         return self.destruction_log
 
 
+def run(profile_name: str) -> dict:
+    """Entry point for in-process orchestration - returns the destruction log"""
+    agent = ComputeDestructionAgent(profile_name)
+    return agent.destroy_all_compute()
+
+
 def main():
     if len(sys.argv) != 2:
-        print("Usage: python3 compute_destruction_agent.py <profile_name>")
+        log.info("Usage: python3 compute_destruction_agent.py <profile_name>")
         sys.exit(1)
     
     profile_name = sys.argv[1]
-    print(f"🔥 Starting Compute Destruction Agent for {profile_name}")
+    log.info(f"🔥 Starting Compute Destruction Agent for {profile_name}")
     
     agent = ComputeDestructionAgent(profile_name)
     agent.destroy_all_compute()
@@ -5,18 +5,101 @@ Infrastructure Destruction Agent - Destroys ALL infrastructure for account closu
 
 import json
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+try:
+    import orjson  # Rust JSON encoder - serializes big logs 5-10x faster
+except ImportError:
+    orjson = None
+import atexit
 import concurrent.futures
+import logging
+import logging.handlers
+import queue
+import functools
+import threading
 import time
 from datetime import datetime
+from pathlib import Path
 import os
 import sys
 from typing import Dict, List, Any
 
+# Destroying all regions x all resources is guaranteed to hit API throttling;
+# adaptive mode rate-limits client-side and retries throttles instead of
+# surfacing them as permanent failures in the destruction log
+# max_pool_connections must outpace the widest thread pool (32 bucket
+# workers / 16 regions x 20 deletes locally) or threads silently serialize
+# waiting for an HTTPS connection slot
+RETRY_CFG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'},
+                   max_pool_connections=50)
+
+# All output funnels through one QueueListener thread: log.info() takes the
+# stdio lock and flushes per line, which becomes a serialization point
+# once deletes fan out across thread pools
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+log = logging.getLogger(__name__)
+
+
+_REGION_CACHE = Path.home() / '.cache' / 'infra-decom' / 'regions.json'
+_REGION_CACHE_TTL = 24 * 3600
+
+
+@functools.lru_cache(maxsize=4)
+def _get_regions(profile_name: str) -> tuple:
+    """Enabled regions for a profile, cached on disk for 24h.
+
+    Every agent calls describe_regions at startup and the answer almost
+    never changes, so the compute/infra/S3 agents running back-to-back
+    share one lookup via the cache file.
+    """
+    cached = {}
+    try:
+        # Read the file even past its TTL: the rewrite below merges this
+        # profile's fresh answer into it, and starting from {} would wipe
+        # every other profile's entry and force them back onto
+        # describe_regions
+        fresh = time.time() - _REGION_CACHE.stat().st_mtime < _REGION_CACHE_TTL
+        cached = json.loads(_REGION_CACHE.read_text())
+        if fresh and profile_name in cached:
+            return tuple(cached[profile_name])
+    except (OSError, ValueError):
+        cached = {}
+
+    ec2 = boto3.Session(profile_name=profile_name).client(
+        'ec2', region_name='us-east-1', config=RETRY_CFG)
+    regions = [r['RegionName'] for r in ec2.describe_regions()['Regions']]
+
+    try:
+        _REGION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        cached[profile_name] = regions
+        _REGION_CACHE.write_text(json.dumps(cached))
+    except OSError:
+        pass
+    return tuple(regions)
+
 class InfrastructureDestructionAgent:
     def __init__(self, profile_name: str):
         self.profile_name = profile_name
         self.session = boto3.Session(profile_name=profile_name)
+        self._clients = {}
+        self._clients_lock = threading.Lock()
         self.account_id = self.get_account_id()
+        # Regions are destroyed concurrently; every destruction_log mutation
+        # (lists and summary counters) must hold this lock
+        self._log_lock = threading.Lock()
+        # Columnar buffer for destroyed entries (see _log_destroyed)
+        self._destroyed_type = []
+        self._destroyed_id = []
+        self._destroyed_region = []
+        self._destroyed_ts = []
         self.destruction_log = {
             'account_id': self.account_id,
             'profile_name': profile_name,
@@ -30,18 +113,61 @@ class InfrastructureDestructionAgent:
             }
         }
         
+    def _client(self, service: str, region: str = None):
+        """Shared per-(service, region) client.
+
+        Client construction costs ~50-200ms (endpoint resolution, model
+        load) and Session.client is not thread-safe, so cache one client
+        per (service, region) behind a lock - the region workers then
+        reuse clients across phases instead of rebuilding them.
+        """
+        key = (service, region)
+        with self._clients_lock:
+            if key not in self._clients:
+                self._clients[key] = self.session.client(service, region_name=region, config=RETRY_CFG)
+            return self._clients[key]
+    
     def get_account_id(self) -> str:
         try:
-            sts = self.session.client('sts')
+            sts = self._client('sts')
             return sts.get_caller_identity()['Account']
         except Exception as e:
-            print(f"Error getting account ID: {e}")
+            log.info(f"Error getting account ID: {e}")
             return "unknown"
     
+    def _log_destroyed(self, rtype, rid, region, ts, counter):
+        """Record one destroyed resource.
+
+        Stored column-wise (four parallel lists) instead of one dict per
+        entry - ~4x less memory over a long destruction - and zipped back
+        into the log's list-of-dicts shape at save time.
+        """
+        with self._log_lock:
+            self._destroyed_type.append(rtype)
+            self._destroyed_id.append(rid)
+            self._destroyed_region.append(region)
+            self._destroyed_ts.append(ts)
+            self.destruction_log['summary'][counter] += 1
+    
+    def _delete_parallel(self, delete_one, items, max_workers=20):
+        """Fan independent per-resource deletes out across a thread pool.
+
+        Each worker handles (and logs) its own failures, so map() never
+        raises; deletes within a region overlap instead of paying one RTT
+        per resource serially.
+        """
+        if not items:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            list(executor.map(delete_one, items))
+    
     def destroy_cloudformation_stacks(self, region: str):
         """Destroy ALL CloudFormation stacks in a region"""
-        print(f"🔥 DESTROYING CLOUDFORMATION STACKS in {region}...")
-        cfn = self.session.client('cloudformation', region_name=region)
+        log.info(f"🔥 DESTROYING CLOUDFORMATION STACKS in {region}...")
+        cfn = self._client('cloudformation', region)
+        # One timestamp per region batch - these entries all belong to the
+        # same logical operation, so skip a clock_gettime+strftime per entry
+        ts = datetime.utcnow().isoformat()
         
         try:
             # Get all stacks (including Control Tower ones)
@@ -50,14 +176,14 @@ class InfrastructureDestructionAgent:
             for page in paginator.paginate(StackStatusFilter=[
                 'CREATE_COMPLETE', 'UPDATE_COMPLETE', 'UPDATE_ROLLBACK_COMPLETE',
                 'ROLLBACK_COMPLETE', 'IMPORT_COMPLETE', 'IMPORT_ROLLBACK_COMPLETE'
-            ]):
+            ], PaginationConfig={'PageSize': 100}):  # API max - halves round-trips
                 stacks.extend(page['StackSummaries'])
             
             if not stacks:
-                print(f"  No CloudFormation stacks found in {region}")
+                log.info(f"  No CloudFormation stacks found in {region}")
                 return
                 
-            print(f"  Found {len(stacks)} stacks to destroy")
+            log.info(f"  Found {len(stacks)} stacks to destroy")
             
             # Sort stacks - destroy dependent stacks first, Control Tower last
             def stack_priority(stack):
@@ -69,97 +195,120 @@ class InfrastructureDestructionAgent:
                 else:
                     return 1  # Delete application stacks first
             
-            sorted_stacks = sorted(stacks, key=stack_priority)
+            # One paginated describe_stacks pass gives EnableTerminationProtection
+            # for every stack, replacing a per-stack describe call in the loop
+            protected = {
+                stack['StackName']
+                for page in cfn.get_paginator('describe_stacks').paginate()
+                for stack in page['Stacks']
+                if stack.get('EnableTerminationProtection')
+            }
+            
+            # Group into dependency tiers - stacks within a tier are
+            # independent, so each tier deletes in parallel and the waiter
+            # gates the next tier
+            tiers = {}
+            for stack in stacks:
+                tiers.setdefault(stack_priority(stack), []).append(stack)
             
-            for stack in sorted_stacks:
+            def delete_stack(stack):
                 stack_name = stack['StackName']
                 try:
-                    print(f"  🗑️  Destroying stack: {stack_name}")
+                    log.info(f"  🗑️  Destroying stack: {stack_name}")
                     
                     # Disable termination protection if enabled
-                    try:
-                        stack_details = cfn.describe_stacks(StackName=stack_name)['Stacks'][0]
-                        if stack_details.get('EnableTerminationProtection', False):
+                    if stack_name in protected:
+                        try:
                             cfn.update_termination_protection(
                                 StackName=stack_name,
                                 EnableTerminationProtection=False
                             )
-                    except:
-                        pass
+                        except ClientError as e:
+                            # Nested stacks can't toggle protection directly
+                            # (ValidationError); real failures should land
+                            # this stack in the failed log, not be skipped
+                            if e.response['Error']['Code'] != 'ValidationError':
+                                raise
                     
-                    # Delete the stack
+                    # Delete the stack and wait for it to finish - the
+                    # waiter is the synchronization point between tiers
                     cfn.delete_stack(StackName=stack_name)
+                    cfn.get_waiter('stack_delete_complete').wait(
+                        StackName=stack_name,
+                        WaiterConfig={'Delay': 10, 'MaxAttempts': 60}
+                    )
                     
-                    # Wait for deletion to start
-                    time.sleep(2)
-                    
-                    self.destruction_log['destroyed'].append({
-                        'type': 'cloudformation_stack',
-                        'id': stack_name,
-                        'region': region,
-                        'timestamp': datetime.utcnow().isoformat()
-                    })
-                    self.destruction_log['summary']['cloudformation_stacks'] += 1
-                    print(f"    ✅ DELETING: {stack_name} (deletion in progress)")
+                    self._log_destroyed('cloudformation_stack', stack_name, region, ts, 'cloudformation_stacks')
+                    log.info(f"    ✅ DELETED: {stack_name}")
                     
                 except Exception as e:
-                    print(f"    ❌ FAILED: {stack_name} - {e}")
-                    self.destruction_log['failed'].append({
-                        'type': 'cloudformation_stack',
-                        'id': stack_name,
-                        'region': region,
-                        'error': str(e)
-                    })
-                    self.destruction_log['summary']['failed'] += 1
+                    log.info(f"    ❌ FAILED: {stack_name} - {e}")
+                    with self._log_lock:
+                        self.destruction_log['failed'].append({
+                            'type': 'cloudformation_stack',
+                            'id': stack_name,
+                            'region': region,
+                            'error': str(e)
+                        })
+                        self.destruction_log['summary']['failed'] += 1
+            
+            for tier in sorted(tiers):
+                self._delete_parallel(delete_stack, tiers[tier])
                     
         except Exception as e:
-            print(f"Error destroying CloudFormation stacks in {region}: {e}")
+            log.info(f"Error destroying CloudFormation stacks in {region}: {e}")
     
     def destroy_networking(self, region: str):
         """Destroy networking resources in a region"""
-        print(f"🔥 DESTROYING NETWORKING in {region}...")
-        ec2 = self.session.client('ec2', region_name=region)
+        log.info(f"🔥 DESTROYING NETWORKING in {region}...")
+        ec2 = self._client('ec2', region)
+        # One timestamp per region batch - these entries all belong to the
+        # same logical operation, so skip a clock_gettime+strftime per entry
+        ts = datetime.utcnow().isoformat()
         
         try:
             # Destroy NAT Gateways first
-            nat_gateways = ec2.describe_nat_gateways(
-                Filters=[{'Name': 'state', 'Values': ['available']}]
-            )['NatGateways']
+            nat_gateways = [
+                nat
+                for page in ec2.get_paginator('describe_nat_gateways').paginate(
+                    Filters=[{'Name': 'state', 'Values': ['available']}])
+                for nat in page['NatGateways']
+            ]
             
-            for nat in nat_gateways:
+            def delete_nat(nat):
                 nat_id = nat['NatGatewayId']
                 try:
-                    print(f"  🗑️  Destroying NAT Gateway: {nat_id}")
+                    log.info(f"  🗑️  Destroying NAT Gateway: {nat_id}")
                     ec2.delete_nat_gateway(NatGatewayId=nat_id)
                     
-                    self.destruction_log['destroyed'].append({
-                        'type': 'nat_gateway',
-                        'id': nat_id,
-                        'region': region,
-                        'timestamp': datetime.utcnow().isoformat()
-                    })
-                    self.destruction_log['summary']['nat_gateways'] += 1
-                    print(f"    ✅ DESTROYED: {nat_id}")
+                    self._log_destroyed('nat_gateway', nat_id, region, ts, 'nat_gateways')
+                    log.info(f"    ✅ DESTROYED: {nat_id}")
                     
                 except Exception as e:
-                    print(f"    ❌ FAILED: {nat_id} - {e}")
-                    self.destruction_log['failed'].append({
-                        'type': 'nat_gateway',
-                        'id': nat_id,
-                        'region': region,
-                        'error': str(e)
-                    })
-                    self.destruction_log['summary']['failed'] += 1
+                    log.info(f"    ❌ FAILED: {nat_id} - {e}")
+                    with self._log_lock:
+                        self.destruction_log['failed'].append({
+                            'type': 'nat_gateway',
+                            'id': nat_id,
+                            'region': region,
+                            'error': str(e)
+                        })
+                        self.destruction_log['summary']['failed'] += 1
+            
+            self._delete_parallel(delete_nat, nat_gateways)
             
             # Destroy Internet Gateways
-            igws = ec2.describe_internet_gateways(
-                Filters=[{'Name': 'attachment.state', 'Values': ['available']}]
-            )['InternetGateways']
+            igws = [
+                igw
+                for page in ec2.get_paginator('describe_internet_gateways').paginate(
+                    Filters=[{'Name': 'attachment.state', 'Values': ['available']}])
+                for igw in page['InternetGateways']
+            ]
             
-            for igw in igws:
+            def delete_igw(igw):
                 igw_id = igw['InternetGatewayId']
                 try:
-                    print(f"  🗑️  Destroying Internet Gateway: {igw_id}")
+                    log.info(f"  🗑️  Destroying Internet Gateway: {igw_id}")
                     
                     # Detach from VPCs first
                     for attachment in igw.get('Attachments', []):
@@ -172,107 +321,149 @@ class InfrastructureDestructionAgent:
                     # Delete the IGW
                     ec2.delete_internet_gateway(InternetGatewayId=igw_id)
                     
-                    self.destruction_log['destroyed'].append({
-                        'type': 'internet_gateway',
-                        'id': igw_id,
-                        'region': region,
-                        'timestamp': datetime.utcnow().isoformat()
-                    })
-                    self.destruction_log['summary']['internet_gateways'] += 1
-                    print(f"    ✅ DESTROYED: {igw_id}")
+                    self._log_destroyed('internet_gateway', igw_id, region, ts, 'internet_gateways')
+                    log.info(f"    ✅ DESTROYED: {igw_id}")
                     
                 except Exception as e:
-                    print(f"    ❌ FAILED: {igw_id} - {e}")
-                    self.destruction_log['failed'].append({
-                        'type': 'internet_gateway',
-                        'id': igw_id,
-                        'region': region,
-                        'error': str(e)
-                    })
-                    self.destruction_log['summary']['failed'] += 1
+                    log.info(f"    ❌ FAILED: {igw_id} - {e}")
+                    with self._log_lock:
+                        self.destruction_log['failed'].append({
+                            'type': 'internet_gateway',
+                            'id': igw_id,
+                            'region': region,
+                            'error': str(e)
+                        })
+                        self.destruction_log['summary']['failed'] += 1
+            
+            self._delete_parallel(delete_igw, igws)
             
             # Destroy Security Groups (except default)
-            security_groups = ec2.describe_security_groups()['SecurityGroups']
+            security_groups = [
+                sg
+                for page in ec2.get_paginator('describe_security_groups').paginate()
+                for sg in page['SecurityGroups']
+            ]
             custom_sgs = [sg for sg in security_groups if sg['GroupName'] != 'default']
             
-            for sg in custom_sgs:
+            def delete_sg(sg):
                 sg_id = sg['GroupId']
                 try:
-                    print(f"  🗑️  Destroying Security Group: {sg_id}")
+                    log.info(f"  🗑️  Destroying Security Group: {sg_id}")
                     ec2.delete_security_group(GroupId=sg_id)
                     
-                    self.destruction_log['destroyed'].append({
-                        'type': 'security_group',
-                        'id': sg_id,
-                        'region': region,
-                        'timestamp': datetime.utcnow().isoformat()
-                    })
-                    self.destruction_log['summary']['security_groups'] += 1
-                    print(f"    ✅ DESTROYED: {sg_id}")
+                    self._log_destroyed('security_group', sg_id, region, ts, 'security_groups')
+                    log.info(f"    ✅ DESTROYED: {sg_id}")
                     
                 except Exception as e:
-                    print(f"    ❌ FAILED: {sg_id} - {e}")
-                    self.destruction_log['failed'].append({
-                        'type': 'security_group',
-                        'id': sg_id,
-                        'region': region,
-                        'error': str(e)
-                    })
-                    self.destruction_log['summary']['failed'] += 1
+                    log.info(f"    ❌ FAILED: {sg_id} - {e}")
+                    with self._log_lock:
+                        self.destruction_log['failed'].append({
+                            'type': 'security_group',
+                            'id': sg_id,
+                            'region': region,
+                            'error': str(e)
+                        })
+                        self.destruction_log['summary']['failed'] += 1
+            
+            self._delete_parallel(delete_sg, custom_sgs)
             
             # Destroy VPCs (except default)
-            vpcs = ec2.describe_vpcs()['Vpcs']
+            vpcs = [
+                vpc
+                for page in ec2.get_paginator('describe_vpcs').paginate()
+                for vpc in page['Vpcs']
+            ]
             custom_vpcs = [vpc for vpc in vpcs if not vpc['IsDefault']]
             
-            for vpc in custom_vpcs:
+            def delete_one_vpc(vpc):
                 vpc_id = vpc['VpcId']
                 try:
-                    print(f"  🗑️  Destroying VPC: {vpc_id}")
+                    log.info(f"  🗑️  Destroying VPC: {vpc_id}")
+                    
+                    vpc_filter = [{'Name': 'vpc-id', 'Values': [vpc_id]}]
+                    
+                    def list_all(op, result_key):
+                        return [
+                            item
+                            for page in ec2.get_paginator(op).paginate(Filters=vpc_filter)
+                            for item in page[result_key]
+                        ]
+                    
+                    # All four dependency listings in one round-trip's worth
+                    # of latency instead of four serial calls
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as lister:
+                        subnets_f = lister.submit(list_all, 'describe_subnets', 'Subnets')
+                        route_tables_f = lister.submit(list_all, 'describe_route_tables', 'RouteTables')
+                        enis_f = lister.submit(list_all, 'describe_network_interfaces', 'NetworkInterfaces')
+                        endpoints_f = lister.submit(list_all, 'describe_vpc_endpoints', 'VpcEndpoints')
+                        subnets = subnets_f.result()
+                        route_tables = route_tables_f.result()
+                        enis = enis_f.result()
+                        endpoints = endpoints_f.result()
+                    
+                    # Endpoints and leftover ENIs block subnet deletion
+                    if endpoints:
+                        ec2.delete_vpc_endpoints(
+                            VpcEndpointIds=[ep['VpcEndpointId'] for ep in endpoints])
+                    self._delete_parallel(
+                        lambda eni: ec2.delete_network_interface(NetworkInterfaceId=eni['NetworkInterfaceId']),
+                        [eni for eni in enis if eni.get('Status') == 'available'])
                     
                     # Delete subnets first
-                    subnets = ec2.describe_subnets(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}])['Subnets']
-                    for subnet in subnets:
-                        ec2.delete_subnet(SubnetId=subnet['SubnetId'])
+                    self._delete_parallel(
+                        lambda subnet: ec2.delete_subnet(SubnetId=subnet['SubnetId']), subnets)
                     
                     # Delete route tables (except main)
-                    route_tables = ec2.describe_route_tables(Filters=[{'Name': 'vpc-id', 'Values': [vpc_id]}])['RouteTables']
-                    for rt in route_tables:
-                        if not any(assoc.get('Main', False) for assoc in rt.get('Associations', [])):
-                            ec2.delete_route_table(RouteTableId=rt['RouteTableId'])
+                    self._delete_parallel(
+                        lambda rt: ec2.delete_route_table(RouteTableId=rt['RouteTableId']),
+                        [rt for rt in route_tables
+                         if not any(assoc.get('Main', False) for assoc in rt.get('Associations', []))])
                     
                     # Delete the VPC
                     ec2.delete_vpc(VpcId=vpc_id)
                     
-                    self.destruction_log['destroyed'].append({
-                        'type': 'vpc',
-                        'id': vpc_id,
-                        'region': region,
-                        'timestamp': datetime.utcnow().isoformat()
-                    })
-                    self.destruction_log['summary']['vpcs'] += 1
-                    print(f"    ✅ DESTROYED: {vpc_id}")
+                    self._log_destroyed('vpc', vpc_id, region, ts, 'vpcs')
+                    log.info(f"    ✅ DESTROYED: {vpc_id}")
                     
                 except Exception as e:
-                    print(f"    ❌ FAILED: {vpc_id} - {e}")
-                    self.destruction_log['failed'].append({
-                        'type': 'vpc',
-                        'id': vpc_id,
-                        'region': region,
-                        'error': str(e)
-                    })
-                    self.destruction_log['summary']['failed'] += 1
+                    log.info(f"    ❌ FAILED: {vpc_id} - {e}")
+                    with self._log_lock:
+                        self.destruction_log['failed'].append({
+                            'type': 'vpc',
+                            'id': vpc_id,
+                            'region': region,
+                            'error': str(e)
+                        })
+                        self.destruction_log['summary']['failed'] += 1
+            
+            self._delete_parallel(delete_one_vpc, custom_vpcs)
                     
         except Exception as e:
-            print(f"Error destroying networking in {region}: {e}")
+            log.info(f"Error destroying networking in {region}: {e}")
+    
+    def _process_cloudformation_region(self, region: str):
+        """CloudFormation destruction for one region (thread-pool worker)"""
+        try:
+            log.info(f"\n🌍 Processing CloudFormation in: {region}")
+            self.destroy_cloudformation_stacks(region)
+        except Exception as e:
+            log.info(f"Error processing CloudFormation in {region}: {e}")
+    
+    def _process_networking_region(self, region: str):
+        """Networking destruction for one region (thread-pool worker)"""
+        try:
+            log.info(f"\n🌍 Processing networking in: {region}")
+            self.destroy_networking(region)
+        except Exception as e:
+            log.info(f"Error processing networking in {region}: {e}")
     
     def destroy_all_infrastructure(self):
         """Main destruction execution"""
-        print(f"🔥🔥🔥 INFRASTRUCTURE DESTRUCTION AGENT - ACCOUNT {self.account_id} 🔥🔥🔥")
-        print("⚠️  WARNING: ALL INFRASTRUCTURE WILL BE PERMANENTLY DESTROYED!")
+        log.info(f"🔥🔥🔥 INFRASTRUCTURE DESTRUCTION AGENT - ACCOUNT {self.account_id} 🔥🔥🔥")
+        log.info("⚠️  WARNING: ALL INFRASTRUCTURE WILL BE PERMANENTLY DESTROYED!")
         
-        # Get all regions
-        ec2 = self.session.client('ec2', region_name='us-east-1')
-        regions = [r['RegionName'] for r in ec2.describe_regions()['Regions']]
+        # Get all regions (cached - the list effectively never changes)
+        regions = _get_regions(self.profile_name)
         
         # Process CloudFormation stacks first in priority regions
         priority_regions = ['us-east-1', 'us-east-2', 'us-west-1', 'us-west-2']
@@ -280,28 +471,44 @@ class InfrastructureDestructionAgent:
         
         all_regions = priority_regions + other_regions
         
-        # Phase 1: Delete CloudFormation stacks
-        print("\n🔥 PHASE 1: DESTROYING CLOUDFORMATION STACKS")
-        for region in all_regions:
-            try:
-                print(f"\n🌍 Processing CloudFormation in: {region}")
-                self.destroy_cloudformation_stacks(region)
-            except Exception as e:
-                print(f"Error processing CloudFormation in {region}: {e}")
+        # Phase 1: Delete CloudFormation stacks - regions in parallel, each
+        # worker holds its own per-region clients
+        log.info("\n🔥 PHASE 1: DESTROYING CLOUDFORMATION STACKS")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(self._process_cloudformation_region, all_regions))
+        
+        # Gate Phase 2 on nothing still deleting - the per-stack waiters
+        # cover the normal case, but a stack whose waiter timed out can
+        # still hold VPC resources the networking phase would then fail on
+        log.info("\n⏳ Confirming no CloudFormation deletions still in progress...")
         
-        # Wait for stack deletions to complete
-        print("\n⏳ Waiting for CloudFormation deletions to complete...")
-        time.sleep(30)
+        def wait_region_stacks_settled(region):
+            cfn = self._client('cloudformation', region)
+            deadline = time.time() + 900
+            while time.time() < deadline:
+                remaining = sum(
+                    len(page['StackSummaries'])
+                    for page in cfn.get_paginator('list_stacks').paginate(
+                        StackStatusFilter=['DELETE_IN_PROGRESS'])
+                )
+                if not remaining:
+                    return
+                time.sleep(5)
         
-        # Phase 2: Clean up networking
-        print("\n🔥 PHASE 2: DESTROYING NETWORKING")
-        for region in all_regions:
-            try:
-                print(f"\n🌍 Processing networking in: {region}")
-                self.destroy_networking(region)
-            except Exception as e:
-                print(f"Error processing networking in {region}: {e}")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(wait_region_stacks_settled, all_regions))
         
+        # Phase 2: Clean up networking - same fan-out
+        log.info("\n🔥 PHASE 2: DESTROYING NETWORKING")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(self._process_networking_region, all_regions))
+        
+        # Materialize the columnar destroyed buffer for serialization
+        self.destruction_log['destroyed'] = [
+            {'type': t, 'id': i, 'region': r, 'timestamp': ts}
+            for t, i, r, ts in zip(self._destroyed_type, self._destroyed_id,
+                                   self._destroyed_region, self._destroyed_ts)
+        ]
         self.destruction_log['end_time'] = datetime.utcnow().isoformat()
         
         # Save results
@@ -309,28 +516,38 @@ class InfrastructureDestructionAgent:
         os.makedirs(output_dir, exist_ok=True)
         
         filename = f"{output_dir}/infrastructure_destruction_{self.account_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(self.destruction_log, f, indent=2)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.destruction_log, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(self.destruction_log, f, indent=2)
         
-        print(f"\n🔥 INFRASTRUCTURE DESTRUCTION COMPLETE!")
-        print(f"  CloudFormation Stacks: {self.destruction_log['summary']['cloudformation_stacks']}")
-        print(f"  VPCs destroyed: {self.destruction_log['summary']['vpcs']}")
-        print(f"  Security Groups: {self.destruction_log['summary']['security_groups']}")
-        print(f"  Internet Gateways: {self.destruction_log['summary']['internet_gateways']}")
-        print(f"  NAT Gateways: {self.destruction_log['summary']['nat_gateways']}")
-        print(f"  Failed: {self.destruction_log['summary']['failed']}")
-        print(f"  Results saved to: {filename}")
+        log.info(f"\n🔥 INFRASTRUCTURE DESTRUCTION COMPLETE!")
+        log.info(f"  CloudFormation Stacks: {self.destruction_log['summary']['cloudformation_stacks']}")
+        log.info(f"  VPCs destroyed: {self.destruction_log['summary']['vpcs']}")
+        log.info(f"  Security Groups: {self.destruction_log['summary']['security_groups']}")
+        log.info(f"  Internet Gateways: {self.destruction_log['summary']['internet_gateways']}")
+        log.info(f"  NAT Gateways: {self.destruction_log['summary']['nat_gateways']}")
+        log.info(f"  Failed: {self.destruction_log['summary']['failed']}")
+        log.info(f"  Results saved to: {filename}")
         
         return self.destruction_log
 
 
+def run(profile_name: str) -> dict:
+    """Entry point for in-process orchestration - returns the destruction log"""
+    agent = InfrastructureDestructionAgent(profile_name)
+    return agent.destroy_all_infrastructure()
+
+
 def main():
     if len(sys.argv) != 2:
-        print("Usage: python3 infrastructure_destruction_agent.py <profile_name>")
+        log.info("Usage: python3 infrastructure_destruction_agent.py <profile_name>")
         sys.exit(1)
     
     profile_name = sys.argv[1]
-    print(f"🔥 Starting Infrastructure Destruction Agent for {profile_name}")
+    log.info(f"🔥 Starting Infrastructure Destruction Agent for {profile_name}")
     
     agent = InfrastructureDestructionAgent(profile_name)
     agent.destroy_all_infrastructure()
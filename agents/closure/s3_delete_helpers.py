@@ -0,0 +1,73 @@
+"""Shared S3 bulk-delete pipeline used by the storage destruction agents.
+
+One implementation of the stream-list-and-delete machinery: page the
+bucket's versions, batch the keys without materializing them, and keep
+delete_objects calls in flight while the listing keeps paginating.
+"""
+
+import collections
+import concurrent.futures
+import itertools
+
+_DELETE_POOL_WIDTH = 8
+# 1000-key batches concentrated on one prefix blow straight through the
+# 3500 deletes/s per-prefix budget; 250 spreads the same work across more,
+# smaller requests that the adaptive retry config can pace
+DELETE_BATCH_SIZE = 250
+
+
+def _iter_delete_keys(page):
+    """Yield delete descriptors straight off a list_object_versions page"""
+    for version in page.get('Versions', ()):
+        yield {'Key': version['Key'], 'VersionId': version['VersionId']}
+    for marker in page.get('DeleteMarkers', ()):
+        yield {'Key': marker['Key'], 'VersionId': marker['VersionId']}
+
+
+def _batched(iterable, size):
+    """Fixed-size batches without materializing the whole key list"""
+    it = iter(iterable)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+def _delete_batch(s3_client, bucket_name, batch):
+    """One delete_objects call, requeuing only the keys that failed.
+
+    Quiet mode reports just the failures; resubmitting the whole batch on
+    a partial error would recount every key against the per-prefix TPS
+    budget, so only keys with retryable error codes are resubmitted, as a
+    single follow-up batch.
+    """
+    response = s3_client.delete_objects(
+        Bucket=bucket_name, Delete={'Objects': batch, 'Quiet': True})
+    for _ in range(2):
+        retry = [
+            {k: v for k, v in error.items() if k in ('Key', 'VersionId')}
+            for error in response.get('Errors', [])
+            if error.get('Code') in ('InternalError', 'SlowDown', 'ServiceUnavailable')
+        ]
+        if not retry:
+            break
+        response = s3_client.delete_objects(
+            Bucket=bucket_name, Delete={'Objects': retry, 'Quiet': True})
+
+
+def _delete_batches_pipelined(s3_client, bucket_name, batch_iter):
+    """Dispatch delete_objects batches while the listing keeps paginating.
+
+    Keeps up to _DELETE_POOL_WIDTH deletes in flight on a bounded pool and
+    reaps finished futures opportunistically, so the List round-trip for
+    page N+1 overlaps the Delete round-trips for page N instead of
+    strictly alternating between the two.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_DELETE_POOL_WIDTH) as executor:
+        in_flight = collections.deque()
+        for batch in batch_iter:
+            in_flight.append(executor.submit(
+                _delete_batch, s3_client, bucket_name, batch))
+            # Reap what's done; block only when the pipeline is full
+            while in_flight and (in_flight[0].done() or len(in_flight) >= _DELETE_POOL_WIDTH * 2):
+                in_flight.popleft().result()
+        while in_flight:
+            in_flight.popleft().result()
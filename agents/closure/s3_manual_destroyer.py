@@ -4,130 +4,205 @@ Manual S3 Destroyer - Destroys remaining S3 buckets for account closure
 """
 
 import boto3
+import atexit
+import concurrent.futures
+import logging
+import logging.handlers
+import queue
+import functools
+import itertools
+import threading
+from botocore.config import Config
+from botocore.exceptions import ClientError
 import sys
 from datetime import datetime
 
+# Destroying all regions x all resources is guaranteed to hit API throttling;
+# adaptive mode rate-limits client-side and retries throttles instead of
+# surfacing them as permanent failures in the destruction log
+# max_pool_connections must outpace the widest thread pool (32 bucket
+# workers / 16 regions x 20 deletes locally) or threads silently serialize
+# waiting for an HTTPS connection slot
+RETRY_CFG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'},
+                   max_pool_connections=50)
+
+# All output funnels through one QueueListener thread: log.info() takes the
+# stdio lock and flushes per line, which becomes a serialization point
+# once deletes fan out across thread pools
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+log = logging.getLogger(__name__)
+
+def _batched(iterable, size):
+    """Yield lists of up to `size` items without slicing copies"""
+    it = iter(iterable)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+_session = None
+_global_s3 = None
+_regional_clients = {}
+_clients_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _bucket_region(bucket_name):
+    """Resolve (once per bucket) which region a bucket lives in"""
+    location = _global_s3.get_bucket_location(Bucket=bucket_name)['LocationConstraint']
+    return location or 'us-east-1'
+
+
+def _client_for_bucket(bucket_name):
+    """S3 client pinned to the bucket's own region.
+
+    An unpinned client pays a 307 redirect (and a dropped connection) on
+    every call to an out-of-region bucket; resolving the region once per
+    bucket and reusing one client per region keeps the botocore
+    connection pool warm across calls.
+    """
+    region = _bucket_region(bucket_name)
+    with _clients_lock:  # Session.client creation is not thread-safe
+        if region not in _regional_clients:
+            _regional_clients[region] = _session.client('s3', region_name=region, config=RETRY_CFG)
+        return _regional_clients[region]
+
+
 def destroy_bucket(s3_client, bucket_name):
     """Completely destroy an S3 bucket"""
-    print(f"🔥 DESTROYING BUCKET: {bucket_name}")
+    log.info(f"🔥 DESTROYING BUCKET: {bucket_name}")
     
     try:
-        # Step 1: Delete all object versions and delete markers
-        print(f"  📋 Listing all versions...")
-        paginator = s3_client.get_paginator('list_object_versions')
-        
-        for page in paginator.paginate(Bucket=bucket_name):
-            # Collect all objects to delete
-            objects_to_delete = []
-            
-            # Add all versions
-            for version in page.get('Versions', []):
-                objects_to_delete.append({
-                    'Key': version['Key'],
-                    'VersionId': version['VersionId']
-                })
-            
-            # Add all delete markers
-            for marker in page.get('DeleteMarkers', []):
-                objects_to_delete.append({
-                    'Key': marker['Key'],
-                    'VersionId': marker['VersionId']
-                })
-            
-            # Delete in batches of 1000
-            if objects_to_delete:
-                print(f"    🗑️  Deleting {len(objects_to_delete)} versioned objects...")
-                for i in range(0, len(objects_to_delete), 1000):
-                    batch = objects_to_delete[i:i+1000]
-                    s3_client.delete_objects(
-                        Bucket=bucket_name,
-                        Delete={'Objects': batch, 'Quiet': True}
-                    )
-        
-        # Step 2: Delete all current objects (non-versioned)
-        print(f"  📋 Listing current objects...")
-        paginator = s3_client.get_paginator('list_objects_v2')
-        
-        for page in paginator.paginate(Bucket=bucket_name):
-            objects = page.get('Contents', [])
-            if objects:
-                print(f"    🗑️  Deleting {len(objects)} current objects...")
-                delete_keys = [{'Key': obj['Key']} for obj in objects]
-                for i in range(0, len(delete_keys), 1000):
-                    batch = delete_keys[i:i+1000]
-                    s3_client.delete_objects(
+        # Steps 1+2 pipeline listing with deletion: while one page's batch
+        # deletes are in flight, the next page is being listed
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            futures = []
+
+            def submit_batches(objects_to_delete):
+                for batch in _batched(objects_to_delete, 1000):
+                    futures.append(executor.submit(
+                        s3_client.delete_objects,
                         Bucket=bucket_name,
                         Delete={'Objects': batch, 'Quiet': True}
+                    ))
+
+            # One get_bucket_versioning call decides which single listing
+            # pass we need: list_object_versions already covers every current
+            # object on a (once-)versioned bucket, and a never-versioned
+            # bucket has no versions to enumerate
+            versioning = s3_client.get_bucket_versioning(Bucket=bucket_name).get('Status')
+
+            if versioning in ('Enabled', 'Suspended'):
+                # Delete all object versions and delete markers
+                log.info(f"  📋 Listing all versions...")
+                paginator = s3_client.get_paginator('list_object_versions')
+
+                for page in paginator.paginate(Bucket=bucket_name,
+                                               PaginationConfig={'PageSize': 1000}):  # API max
+                    # Versions and delete markers share the {Key, VersionId}
+                    # shape; stream them straight into delete batches
+                    entries = itertools.chain(page.get('Versions', []),
+                                              page.get('DeleteMarkers', []))
+                    submit_batches(
+                        {'Key': e['Key'], 'VersionId': e['VersionId']}
+                        for e in entries
                     )
-        
+            else:
+                # Never versioned - current objects are the whole story
+                log.info(f"  📋 Listing current objects...")
+                paginator = s3_client.get_paginator('list_objects_v2')
+
+                for page in paginator.paginate(Bucket=bucket_name):
+                    submit_batches({'Key': obj['Key']}
+                                   for obj in page.get('Contents', []))
+
+            # Surface any batch-delete failure before touching the bucket itself
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+
         # Step 3: Remove bucket policy if exists
         try:
-            print(f"  🛡️  Removing bucket policy...")
+            log.info(f"  🛡️  Removing bucket policy...")
             s3_client.delete_bucket_policy(Bucket=bucket_name)
-        except:
-            pass
+        except ClientError as e:
+            # Only "nothing to remove" is benign; throttles that survive the
+            # retry config must surface as a bucket failure, not skipped work
+            if e.response['Error']['Code'] != 'NoSuchBucketPolicy':
+                raise
         
         # Step 4: Remove lifecycle configuration if exists
         try:
-            print(f"  ♻️  Removing lifecycle configuration...")
+            log.info(f"  ♻️  Removing lifecycle configuration...")
             s3_client.delete_bucket_lifecycle(Bucket=bucket_name)
-        except:
-            pass
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NoSuchLifecycleConfiguration':
+                raise
         
         # Step 5: Remove CORS configuration if exists
         try:
-            print(f"  🌐 Removing CORS configuration...")
+            log.info(f"  🌐 Removing CORS configuration...")
             s3_client.delete_bucket_cors(Bucket=bucket_name)
-        except:
-            pass
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NoSuchCORSConfiguration':
+                raise
         
         # Step 6: Delete the bucket itself
-        print(f"  💀 Deleting bucket...")
+        log.info(f"  💀 Deleting bucket...")
         s3_client.delete_bucket(Bucket=bucket_name)
         
-        print(f"  ✅ BUCKET DESTROYED: {bucket_name}")
+        log.info(f"  ✅ BUCKET DESTROYED: {bucket_name}")
         return True
         
     except Exception as e:
-        print(f"  ❌ FAILED TO DESTROY: {bucket_name} - {e}")
+        log.info(f"  ❌ FAILED TO DESTROY: {bucket_name} - {e}")
         return False
 
 def main():
     if len(sys.argv) != 2:
-        print("Usage: python3 s3_manual_destroyer.py <profile_name>")
+        log.info("Usage: python3 s3_manual_destroyer.py <profile_name>")
         sys.exit(1)
     
     profile_name = sys.argv[1]
-    print(f"🔥🔥🔥 S3 MANUAL DESTROYER for {profile_name} 🔥🔥🔥")
+    log.info(f"🔥🔥🔥 S3 MANUAL DESTROYER for {profile_name} 🔥🔥🔥")
     
     # Initialize S3 client
-    session = boto3.Session(profile_name=profile_name)
-    s3 = session.client('s3')
+    global _session, _global_s3
+    _session = boto3.Session(profile_name=profile_name)
+    _global_s3 = s3 = _session.client('s3', config=RETRY_CFG)
     
     # List all buckets
     try:
         buckets = s3.list_buckets()['Buckets']
-        print(f"📊 Found {len(buckets)} buckets to destroy")
-        
-        success_count = 0
-        fail_count = 0
+        log.info(f"📊 Found {len(buckets)} buckets to destroy")
+        if not buckets:
+            # The normal end state of a decommissioned account - and
+            # ThreadPoolExecutor rejects max_workers=0
+            log.info("   🎉 ALL S3 BUCKETS DESTROYED!")
+            return
+
+        # Buckets are independent - destroy them concurrently; each worker
+        # already pipelines its own listing/deletes internally
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(buckets))) as executor:
+            results = list(executor.map(
+                lambda bucket: destroy_bucket(_client_for_bucket(bucket['Name']), bucket['Name']), buckets))
         
-        for bucket in buckets:
-            bucket_name = bucket['Name']
-            if destroy_bucket(s3, bucket_name):
-                success_count += 1
-            else:
-                fail_count += 1
+        success_count = sum(results)
+        fail_count = len(results) - success_count
         
-        print(f"\n🔥 S3 DESTRUCTION COMPLETE!")
-        print(f"   ✅ Successfully destroyed: {success_count}")
-        print(f"   ❌ Failed to destroy: {fail_count}")
+        log.info(f"\n🔥 S3 DESTRUCTION COMPLETE!")
+        log.info(f"   ✅ Successfully destroyed: {success_count}")
+        log.info(f"   ❌ Failed to destroy: {fail_count}")
         
         if fail_count == 0:
-            print("   🎉 ALL S3 BUCKETS DESTROYED!")
+            log.info("   🎉 ALL S3 BUCKETS DESTROYED!")
         
     except Exception as e:
-        print(f"Error listing buckets: {e}")
+        log.info(f"Error listing buckets: {e}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
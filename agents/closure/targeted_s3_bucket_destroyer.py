@@ -4,16 +4,99 @@ Targeted S3 Bucket Destroyer - Destroys specific remaining S3 buckets for accoun
 """
 
 import boto3
+import atexit
+import contextlib
+import logging
+import logging.handlers
+import queue
+import concurrent.futures
+import itertools
+import os
 import sys
 import json
+
+try:
+    import orjson  # Rust JSON encoder - serializes big logs 5-10x faster
+except ImportError:
+    orjson = None
+
 from datetime import datetime
+from pathlib import Path
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# Streaming list+delete machinery shared with storage_destruction_agent
+from s3_delete_helpers import (DELETE_BATCH_SIZE, _batched,
+                               _delete_batches_pipelined, _iter_delete_keys)
+
+# Buckets above this object count are cheaper to drain via an S3 lifecycle
+# rule than by paying a LIST+DELETE round-trip budget client-side
+FAST_LIFECYCLE_THRESHOLD = 10000
+
+
+
+# Shared client tuning: adaptive retries for throttling, a connection pool
+# wide enough for the delete fan-outs, and TCP keepalive so long runs keep
+# reusing established connections instead of re-handshaking TLS
+CLIENT_CFG = Config(max_pool_connections=64,
+                    retries={'mode': 'adaptive', 'max_attempts': 10},
+                    tcp_keepalive=True)
+
+# All output funnels through one QueueListener thread: log.info() takes the
+# stdio lock and flushes per line, which becomes a serialization point
+# once deletes fan out across thread pools
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+log = logging.getLogger(__name__)
+
+def _handle_access_denied(agent, bucket_name, bucket_result):
+    log.info(f"  ❌ ACCESS DENIED: {bucket_name}")
+    log.info(f"     This bucket may be protected by service control policies")
+    bucket_result['error_type'] = 'access_denied'
+    agent.results['summary']['access_denied_errors'] += 1
+
+
+def _handle_no_such_bucket(agent, bucket_name, bucket_result):
+    log.info(f"  ℹ️  Bucket {bucket_name} doesn't exist (already deleted)")
+    bucket_result['status'] = 'success'
+
+
+def _handle_bucket_not_empty(agent, bucket_name, bucket_result):
+    log.info(f"  ❌ BUCKET NOT EMPTY: {bucket_name}")
+    log.info(f"     Some objects may still remain or be protected")
+    bucket_result['error_type'] = 'bucket_not_empty'
+
+
+# destroy_bucket sees the same handful of error codes over and over on a
+# large run; one dict lookup replaces the if/elif chain, and the slow
+# SCP substring scan only runs for codes not listed here
+_ERROR_HANDLERS = {
+    'AccessDenied': _handle_access_denied,
+    'NoSuchBucket': _handle_no_such_bucket,
+    'BucketNotEmpty': _handle_bucket_not_empty,
+}
+
+
 class TargetedS3BucketDestroyer:
-    def __init__(self, profile_name):
+    def __init__(self, profile_name, fast_lifecycle=False):
         self.profile_name = profile_name
+        self.fast_lifecycle = fast_lifecycle
+        self.pending_lifecycle = []
         self.session = boto3.Session(profile_name=profile_name)
-        self.s3_client = self.session.client('s3')
+        self.s3_client = self.session.client('s3', config=CLIENT_CFG)
+        self._region_clients = {}
+        self._bucket_clients = {}
+        # Validate the results directory up front rather than at save time;
+        # DESTRUCTION_LOG_DIR overrides the in-repo results/ default
+        self.output_dir = Path(os.environ.get(
+            'DESTRUCTION_LOG_DIR',
+            Path(__file__).resolve().parent / 'results')).expanduser()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         self.results = {
             'timestamp': datetime.now().isoformat(),
             'profile': profile_name,
@@ -24,132 +107,217 @@ class TargetedS3BucketDestroyer:
                 'failed_deletions': 0,
                 'access_denied_errors': 0,
                 'policy_restricted_errors': 0,
-                'other_errors': 0
+                'other_errors': 0,
+                'pending_lifecycle': 0
             }
         }
     
+    def _region_client(self, region):
+        """Cached S3 client pinned to a region"""
+        if region not in self._region_clients:
+            self._region_clients[region] = self.session.client('s3', region_name=region, config=CLIENT_CFG)
+        return self._region_clients[region]
+    
+    def _client_for_bucket(self, bucket_name):
+        """Client pinned to the bucket's own region.
+
+        A default-region client pays a 301 redirect plus a second request
+        on every call to an out-of-region bucket; one get_bucket_location
+        per bucket routes everything to the right endpoint directly.
+        """
+        if bucket_name not in self._bucket_clients:
+            try:
+                location = self.s3_client.get_bucket_location(Bucket=bucket_name)['LocationConstraint'] or 'us-east-1'
+                client = self._region_client(location)
+            except ClientError:
+                # Missing bucket / no access - let the caller's own error
+                # handling see the real failure on the default client
+                client = self.s3_client
+            self._bucket_clients[bucket_name] = client
+        return self._bucket_clients[bucket_name]
+    
+    def close(self):
+        """Release the sockets held by the cached clients"""
+        for client in [self.s3_client, *self._region_clients.values()]:
+            with contextlib.suppress(Exception):
+                client.close()
+        self._region_clients.clear()
+        self._bucket_clients.clear()
+    
+    def _bucket_is_large(self, bucket_name):
+        """Decide cheaply whether to hand a bucket off to a lifecycle drain.
+
+        Counts keys only up to the threshold, so the check costs at most a
+        handful of LIST pages rather than a full enumeration.
+        """
+        s3 = self._client_for_bucket(bucket_name)
+        count = 0
+        for page in s3.get_paginator('list_objects_v2').paginate(Bucket=bucket_name):
+            count += page.get('KeyCount', 0)
+            if count > FAST_LIFECYCLE_THRESHOLD:
+                return True
+        return False
+    
+    def _apply_drain_lifecycle(self, bucket_name):
+        """Put an expire-everything lifecycle rule on the bucket.
+
+        S3 then deletes current objects, noncurrent versions and stale
+        multipart uploads internally - O(1) client-side work instead of
+        O(objects) LIST/DELETE round-trips.
+        """
+        s3 = self._client_for_bucket(bucket_name)
+        s3.put_bucket_lifecycle_configuration(
+            Bucket=bucket_name,
+            LifecycleConfiguration={'Rules': [{
+                'ID': 'infra-decom-drain',
+                'Status': 'Enabled',
+                'Filter': {},
+                'Expiration': {'Days': 1},
+                'NoncurrentVersionExpiration': {'NoncurrentDays': 1},
+                'AbortIncompleteMultipartUpload': {'DaysAfterInitiation': 1}
+            }]}
+        )
+        log.info(f"  ⏳ Lifecycle drain applied; {bucket_name} will empty S3-side")
+    
+    def finalize_pending_lifecycle(self):
+        """Second pass: delete buckets whose lifecycle drain has finished"""
+        remaining = []
+        for bucket_name in self.pending_lifecycle:
+            s3 = self._client_for_bucket(bucket_name)
+            try:
+                page = s3.list_object_versions(Bucket=bucket_name, MaxKeys=1)
+                if page.get('Versions') or page.get('DeleteMarkers'):
+                    remaining.append(bucket_name)
+                    continue
+                s3.delete_bucket(Bucket=bucket_name)
+                log.info(f"  ✅ BUCKET DESTROYED (post-drain): {bucket_name}")
+            except ClientError as e:
+                log.info(f"  ⚠️  Post-drain delete failed for {bucket_name}: {e}")
+                remaining.append(bucket_name)
+        self.pending_lifecycle = remaining
+        return remaining
+    
     def empty_bucket_contents(self, bucket_name):
         """Empty all objects and versions from a bucket"""
-        print(f"  📋 Emptying bucket contents...")
+        log.info(f"  📋 Emptying bucket contents...")
+        s3 = self._client_for_bucket(bucket_name)
         
         try:
-            # Delete all object versions and delete markers
-            paginator = self.s3_client.get_paginator('list_object_versions')
-            
-            for page in paginator.paginate(Bucket=bucket_name):
-                objects_to_delete = []
-                
-                # Add all versions
-                for version in page.get('Versions', []):
-                    objects_to_delete.append({
-                        'Key': version['Key'],
-                        'VersionId': version['VersionId']
-                    })
-                
-                # Add all delete markers
-                for marker in page.get('DeleteMarkers', []):
-                    objects_to_delete.append({
-                        'Key': marker['Key'],
-                        'VersionId': marker['VersionId']
-                    })
-                
-                # Delete in batches of 1000
-                if objects_to_delete:
-                    print(f"    🗑️  Deleting {len(objects_to_delete)} versioned objects...")
-                    for i in range(0, len(objects_to_delete), 1000):
-                        batch = objects_to_delete[i:i+1000]
-                        self.s3_client.delete_objects(
-                            Bucket=bucket_name,
-                            Delete={'Objects': batch, 'Quiet': True}
-                        )
-            
-            # Delete all current objects (non-versioned)
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            
-            for page in paginator.paginate(Bucket=bucket_name):
-                objects = page.get('Contents', [])
-                if objects:
-                    print(f"    🗑️  Deleting {len(objects)} current objects...")
-                    delete_keys = [{'Key': obj['Key']} for obj in objects]
-                    for i in range(0, len(delete_keys), 1000):
-                        batch = delete_keys[i:i+1000]
-                        self.s3_client.delete_objects(
-                            Bucket=bucket_name,
-                            Delete={'Objects': batch, 'Quiet': True}
-                        )
+            # Delete everything in one list_object_versions pass - it returns
+            # current objects as well (VersionId='null' on unversioned
+            # buckets) plus delete markers, streaming keys page->batch so
+            # only in-flight batches are materialized
+            paginator = s3.get_paginator('list_object_versions')
+            keys = itertools.chain.from_iterable(
+                map(_iter_delete_keys, paginator.paginate(Bucket=bucket_name)))
+            _delete_batches_pipelined(s3, bucket_name, _batched(keys, DELETE_BATCH_SIZE))
             
             return True
             
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             if error_code == 'AccessDenied':
-                print(f"    ❌ Access denied while emptying bucket contents")
+                log.info(f"    ❌ Access denied while emptying bucket contents")
                 return False
             elif error_code == 'NoSuchBucket':
-                print(f"    ℹ️  Bucket doesn't exist (already deleted or never existed)")
+                log.info(f"    ℹ️  Bucket doesn't exist (already deleted or never existed)")
                 return True
             else:
-                print(f"    ❌ Error emptying bucket: {e}")
+                log.info(f"    ❌ Error emptying bucket: {e}")
                 return False
     
     def remove_bucket_configurations(self, bucket_name):
         """Remove bucket policies and configurations that might prevent deletion"""
-        print(f"  🛠️  Removing bucket configurations...")
+        log.info(f"  🛠️  Removing bucket configurations...")
+        s3 = self._client_for_bucket(bucket_name)
         
         configurations_removed = []
         
+        # Probe all five configurations concurrently first; most buckets
+        # have none of them, so the common case is one parallel round of
+        # gets and zero removal calls instead of five unconditional RTTs
+        def probe(getter, benign_code):
+            try:
+                getter(Bucket=bucket_name)
+                return True
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') == benign_code:
+                    return False
+                return True  # unclear - attempt the removal anyway
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
+            has_policy = executor.submit(probe, s3.get_bucket_policy, 'NoSuchBucketPolicy')
+            has_lifecycle = executor.submit(probe, s3.get_bucket_lifecycle_configuration, 'NoSuchLifecycleConfiguration')
+            has_cors = executor.submit(probe, s3.get_bucket_cors, 'NoSuchCORSConfiguration')
+            versioning = executor.submit(s3.get_bucket_versioning, Bucket=bucket_name)
+            notifications = executor.submit(s3.get_bucket_notification_configuration, Bucket=bucket_name)
+        
         # Remove bucket policy
-        try:
-            self.s3_client.delete_bucket_policy(Bucket=bucket_name)
-            configurations_removed.append("bucket_policy")
-        except ClientError as e:
-            if e.response.get('Error', {}).get('Code') != 'NoSuchBucketPolicy':
-                print(f"    ⚠️  Could not remove bucket policy: {e}")
+        if has_policy.result():
+            try:
+                s3.delete_bucket_policy(Bucket=bucket_name)
+                configurations_removed.append("bucket_policy")
+            except ClientError as e:
+                log.info(f"    ⚠️  Could not remove bucket policy: {e}")
         
         # Remove lifecycle configuration
-        try:
-            self.s3_client.delete_bucket_lifecycle(Bucket=bucket_name)
-            configurations_removed.append("lifecycle")
-        except ClientError as e:
-            if e.response.get('Error', {}).get('Code') != 'NoSuchLifecycleConfiguration':
-                print(f"    ⚠️  Could not remove lifecycle configuration: {e}")
+        if has_lifecycle.result():
+            try:
+                s3.delete_bucket_lifecycle(Bucket=bucket_name)
+                configurations_removed.append("lifecycle")
+            except ClientError as e:
+                log.info(f"    ⚠️  Could not remove lifecycle configuration: {e}")
         
         # Remove CORS configuration
-        try:
-            self.s3_client.delete_bucket_cors(Bucket=bucket_name)
-            configurations_removed.append("cors")
-        except ClientError as e:
-            if e.response.get('Error', {}).get('Code') != 'NoSuchCORSConfiguration':
-                print(f"    ⚠️  Could not remove CORS configuration: {e}")
+        if has_cors.result():
+            try:
+                s3.delete_bucket_cors(Bucket=bucket_name)
+                configurations_removed.append("cors")
+            except ClientError as e:
+                log.info(f"    ⚠️  Could not remove CORS configuration: {e}")
         
-        # Remove versioning configuration
+        # Suspend versioning only if it was ever enabled
         try:
-            self.s3_client.put_bucket_versioning(
-                Bucket=bucket_name,
-                VersioningConfiguration={'Status': 'Suspended'}
-            )
-            configurations_removed.append("versioning")
-        except ClientError as e:
-            print(f"    ⚠️  Could not suspend versioning: {e}")
+            versioning_active = versioning.result().get('Status') == 'Enabled'
+        except ClientError:
+            versioning_active = True
+        if versioning_active:
+            try:
+                s3.put_bucket_versioning(
+                    Bucket=bucket_name,
+                    VersioningConfiguration={'Status': 'Suspended'}
+                )
+                configurations_removed.append("versioning")
+            except ClientError as e:
+                log.info(f"    ⚠️  Could not suspend versioning: {e}")
         
-        # Remove notification configuration
+        # Clear notifications only if any are configured
         try:
-            self.s3_client.put_bucket_notification_configuration(
-                Bucket=bucket_name,
-                NotificationConfiguration={}
+            notification_config = notifications.result()
+            has_notifications = any(
+                value for key, value in notification_config.items()
+                if key != 'ResponseMetadata'
             )
-            configurations_removed.append("notifications")
-        except ClientError as e:
-            print(f"    ⚠️  Could not remove notification configuration: {e}")
+        except ClientError:
+            has_notifications = True
+        if has_notifications:
+            try:
+                s3.put_bucket_notification_configuration(
+                    Bucket=bucket_name,
+                    NotificationConfiguration={}
+                )
+                configurations_removed.append("notifications")
+            except ClientError as e:
+                log.info(f"    ⚠️  Could not remove notification configuration: {e}")
         
         if configurations_removed:
-            print(f"    ✅ Removed configurations: {', '.join(configurations_removed)}")
+            log.info(f"    ✅ Removed configurations: {', '.join(configurations_removed)}")
         
         return configurations_removed
     
     def destroy_bucket(self, bucket_name):
         """Completely destroy an S3 bucket"""
-        print(f"\n🔥 DESTROYING BUCKET: {bucket_name}")
+        log.info(f"\n🔥 DESTROYING BUCKET: {bucket_name}")
         
         bucket_result = {
             'bucket_name': bucket_name,
@@ -161,25 +329,36 @@ class TargetedS3BucketDestroyer:
         }
         
         try:
+            s3 = self._client_for_bucket(bucket_name)
+            
             # Check if bucket exists
             try:
-                self.s3_client.head_bucket(Bucket=bucket_name)
+                s3.head_bucket(Bucket=bucket_name)
                 bucket_result['steps_completed'].append('bucket_exists_check')
             except ClientError as e:
                 error_code = e.response.get('Error', {}).get('Code', '')
                 if error_code == 'NoSuchBucket':
-                    print(f"  ℹ️  Bucket {bucket_name} doesn't exist (already deleted)")
+                    log.info(f"  ℹ️  Bucket {bucket_name} doesn't exist (already deleted)")
                     bucket_result['status'] = 'success'
                     bucket_result['error_message'] = 'Bucket already deleted'
                     return bucket_result
                 elif error_code == 'AccessDenied':
-                    print(f"  ❌ Access denied to bucket {bucket_name}")
+                    log.info(f"  ❌ Access denied to bucket {bucket_name}")
                     bucket_result['error_type'] = 'access_denied'
                     bucket_result['error_message'] = str(e)
                     return bucket_result
                 else:
                     raise e
             
+            # Fast path for huge buckets: delegate deletion to S3 via a
+            # lifecycle rule and pick the bucket up again on a later pass
+            if self.fast_lifecycle and self._bucket_is_large(bucket_name):
+                self._apply_drain_lifecycle(bucket_name)
+                self.pending_lifecycle.append(bucket_name)
+                bucket_result['status'] = 'pending_lifecycle'
+                bucket_result['steps_completed'].append('lifecycle_applied')
+                return bucket_result
+            
             # Step 1: Empty bucket contents
             if self.empty_bucket_contents(bucket_name):
                 bucket_result['steps_completed'].append('empty_contents')
@@ -193,11 +372,11 @@ class TargetedS3BucketDestroyer:
             bucket_result['steps_completed'].append('remove_configurations')
             
             # Step 3: Delete the bucket itself
-            print(f"  💀 Deleting bucket...")
-            self.s3_client.delete_bucket(Bucket=bucket_name)
+            log.info(f"  💀 Deleting bucket...")
+            s3.delete_bucket(Bucket=bucket_name)
             bucket_result['steps_completed'].append('delete_bucket')
             
-            print(f"  ✅ BUCKET DESTROYED: {bucket_name}")
+            log.info(f"  ✅ BUCKET DESTROYED: {bucket_name}")
             bucket_result['status'] = 'success'
             return bucket_result
             
@@ -205,21 +384,16 @@ class TargetedS3BucketDestroyer:
             error_code = e.response.get('Error', {}).get('Code', '')
             error_message = str(e)
             
-            if error_code == 'AccessDenied':
-                print(f"  ❌ ACCESS DENIED: {bucket_name}")
-                print(f"     This bucket may be protected by service control policies")
-                bucket_result['error_type'] = 'access_denied'
-                self.results['summary']['access_denied_errors'] += 1
-            elif error_code == 'BucketNotEmpty':
-                print(f"  ❌ BUCKET NOT EMPTY: {bucket_name}")
-                print(f"     Some objects may still remain or be protected")
-                bucket_result['error_type'] = 'bucket_not_empty'
+            handler = _ERROR_HANDLERS.get(error_code)
+            if handler is not None:
+                handler(self, bucket_name, bucket_result)
+            # Only pay the substring scan when the code itself wasn't enough
             elif 'ServiceControlPolicy' in error_message or 'SCP' in error_message:
-                print(f"  ❌ SERVICE CONTROL POLICY RESTRICTION: {bucket_name}")
+                log.info(f"  ❌ SERVICE CONTROL POLICY RESTRICTION: {bucket_name}")
                 bucket_result['error_type'] = 'policy_restricted'
                 self.results['summary']['policy_restricted_errors'] += 1
             else:
-                print(f"  ❌ UNEXPECTED ERROR: {bucket_name} - {error_message}")
+                log.info(f"  ❌ UNEXPECTED ERROR: {bucket_name} - {error_message}")
                 bucket_result['error_type'] = 'other_error'
                 self.results['summary']['other_errors'] += 1
             
@@ -227,7 +401,7 @@ class TargetedS3BucketDestroyer:
             return bucket_result
         
         except Exception as e:
-            print(f"  ❌ UNEXPECTED ERROR: {bucket_name} - {e}")
+            log.info(f"  ❌ UNEXPECTED ERROR: {bucket_name} - {e}")
             bucket_result['error_type'] = 'unexpected_error'
             bucket_result['error_message'] = str(e)
             self.results['summary']['other_errors'] += 1
@@ -235,8 +409,8 @@ class TargetedS3BucketDestroyer:
     
     def destroy_target_buckets(self, target_buckets):
         """Destroy specific target buckets"""
-        print(f"🔥🔥🔥 TARGETED S3 BUCKET DESTROYER for {self.profile_name} 🔥🔥🔥")
-        print(f"📊 Targeting {len(target_buckets)} specific buckets for destruction")
+        log.info(f"🔥🔥🔥 TARGETED S3 BUCKET DESTROYER for {self.profile_name} 🔥🔥🔥")
+        log.info(f"📊 Targeting {len(target_buckets)} specific buckets for destruction")
         
         self.results['summary']['total_attempted'] = len(target_buckets)
         
@@ -246,6 +420,8 @@ class TargetedS3BucketDestroyer:
             
             if bucket_result['status'] == 'success':
                 self.results['summary']['successful_deletions'] += 1
+            elif bucket_result['status'] == 'pending_lifecycle':
+                self.results['summary']['pending_lifecycle'] += 1
             else:
                 self.results['summary']['failed_deletions'] += 1
         
@@ -253,42 +429,68 @@ class TargetedS3BucketDestroyer:
     
     def print_summary(self):
         """Print a summary of the destruction operation"""
-        print(f"\n🔥 TARGETED S3 BUCKET DESTRUCTION COMPLETE!")
-        print(f"   📊 Total buckets attempted: {self.results['summary']['total_attempted']}")
-        print(f"   ✅ Successfully destroyed: {self.results['summary']['successful_deletions']}")
-        print(f"   ❌ Failed to destroy: {self.results['summary']['failed_deletions']}")
+        log.info(f"\n🔥 TARGETED S3 BUCKET DESTRUCTION COMPLETE!")
+        log.info(f"   📊 Total buckets attempted: {self.results['summary']['total_attempted']}")
+        log.info(f"   ✅ Successfully destroyed: {self.results['summary']['successful_deletions']}")
+        log.info(f"   ❌ Failed to destroy: {self.results['summary']['failed_deletions']}")
         
         if self.results['summary']['access_denied_errors'] > 0:
-            print(f"   🚫 Access denied errors: {self.results['summary']['access_denied_errors']}")
+            log.info(f"   🚫 Access denied errors: {self.results['summary']['access_denied_errors']}")
         
         if self.results['summary']['policy_restricted_errors'] > 0:
-            print(f"   🛡️  Policy restricted errors: {self.results['summary']['policy_restricted_errors']}")
+            log.info(f"   🛡️  Policy restricted errors: {self.results['summary']['policy_restricted_errors']}")
         
         if self.results['summary']['other_errors'] > 0:
-            print(f"   ⚠️  Other errors: {self.results['summary']['other_errors']}")
+            log.info(f"   ⚠️  Other errors: {self.results['summary']['other_errors']}")
+        
+        if self.results['summary']['pending_lifecycle'] > 0:
+            log.info(f"   ⏳ Draining via lifecycle: {self.results['summary']['pending_lifecycle']}")
         
         if self.results['summary']['failed_deletions'] == 0:
-            print("   🎉 ALL TARGET BUCKETS DESTROYED!")
+            log.info("   🎉 ALL TARGET BUCKETS DESTROYED!")
         
         # Print detailed results for failed buckets
         failed_buckets = [b for b in self.results['buckets_processed'] if b['status'] == 'failed']
         if failed_buckets:
-            print(f"\n❌ FAILED BUCKET DETAILS:")
+            log.info(f"\n❌ FAILED BUCKET DETAILS:")
             for bucket in failed_buckets:
-                print(f"   • {bucket['bucket_name']}: {bucket['error_type']} - {bucket['error_message']}")
+                log.info(f"   • {bucket['bucket_name']}: {bucket['error_type']} - {bucket['error_message']}")
     
     def save_results(self, output_file=None):
         """Save detailed results to a JSON file"""
         if output_file is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/closure/results/targeted_s3_destruction_{self.profile_name}_{timestamp}.json"
+            output_file = self.output_dir / f"targeted_s3_destruction_{self.profile_name}_{timestamp}.json"
         
-        with open(output_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(self.results, f, indent=2)
         
-        print(f"📄 Detailed results saved to: {output_file}")
+        log.info(f"📄 Detailed results saved to: {output_file}")
         return output_file
 
+def _pending_from_results(output_dir, profile_name):
+    """Bucket names still draining, read from the newest saved results file.
+
+    The drain lifecycle takes S3 up to a day to act on, so finalization is
+    a separate invocation; the previous run's results JSON records which
+    buckets it handed off.
+    """
+    result_files = list(Path(output_dir).glob(
+        f"targeted_s3_destruction_{profile_name}_*.json"))
+    if not result_files:
+        return []
+    latest = max(result_files, key=lambda p: p.stat().st_mtime)
+    with open(latest, 'rb') as f:
+        results = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    return [bucket['bucket_name']
+            for bucket in results.get('buckets_processed', [])
+            if bucket.get('status') == 'pending_lifecycle']
+
+
 def main():
     # Target buckets for Development-Admin account
     TARGET_BUCKETS = [
@@ -299,21 +501,46 @@ def main():
         "modulairhr-lambda-artifacts-134388504287"
     ]
     
+    fast_lifecycle = '--fast-lifecycle' in sys.argv
+    if fast_lifecycle:
+        sys.argv.remove('--fast-lifecycle')
+
+    finalize_lifecycle = '--finalize-lifecycle' in sys.argv
+    if finalize_lifecycle:
+        sys.argv.remove('--finalize-lifecycle')
+
     if len(sys.argv) != 2:
-        print("Usage: python3 targeted_s3_bucket_destroyer.py <profile_name>")
-        print("\nThis script will attempt to destroy the following buckets:")
+        log.info("Usage: python3 targeted_s3_bucket_destroyer.py <profile_name> [--fast-lifecycle | --finalize-lifecycle]")
+        log.info("\nThis script will attempt to destroy the following buckets:")
         for bucket in TARGET_BUCKETS:
-            print(f"  • {bucket}")
-        print("\nNote: Some buckets may be protected by service control policies.")
+            log.info(f"  • {bucket}")
+        log.info("\nNote: Some buckets may be protected by service control policies.")
         sys.exit(1)
     
     profile_name = sys.argv[1]
     
     try:
-        destroyer = TargetedS3BucketDestroyer(profile_name)
-        results = destroyer.destroy_target_buckets(TARGET_BUCKETS)
-        destroyer.print_summary()
-        destroyer.save_results()
+        destroyer = TargetedS3BucketDestroyer(profile_name, fast_lifecycle=fast_lifecycle)
+        try:
+            if finalize_lifecycle:
+                # Second pass: pick up the buckets a --fast-lifecycle run
+                # handed off to S3 and delete the ones that have drained
+                destroyer.pending_lifecycle = _pending_from_results(
+                    destroyer.output_dir, profile_name)
+                if not destroyer.pending_lifecycle:
+                    log.info("No buckets pending lifecycle drain - nothing to finalize")
+                    sys.exit(0)
+                log.info(f"⏳ Finalizing {len(destroyer.pending_lifecycle)} buckets pending lifecycle drain")
+                remaining = destroyer.finalize_pending_lifecycle()
+                if remaining:
+                    log.info(f"   ⏳ Still draining ({len(remaining)}): {', '.join(remaining)}")
+                sys.exit(1 if remaining else 0)
+
+            results = destroyer.destroy_target_buckets(TARGET_BUCKETS)
+            destroyer.print_summary()
+            destroyer.save_results()
+        finally:
+            destroyer.close()
         
         # Exit with error code if any buckets failed to delete
         if results['summary']['failed_deletions'] > 0:
@@ -322,11 +549,11 @@ def main():
             sys.exit(0)
             
     except NoCredentialsError:
-        print(f"❌ Error: No credentials found for profile '{profile_name}'")
-        print("Please ensure your AWS credentials are configured correctly.")
+        log.info(f"❌ Error: No credentials found for profile '{profile_name}'")
+        log.info("Please ensure your AWS credentials are configured correctly.")
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        log.info(f"❌ Unexpected error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
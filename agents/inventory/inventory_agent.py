@@ -5,13 +5,34 @@ AWS Inventory Agent - Comprehensive resource discovery across all accounts and r
 
 import json
 import boto3
+import botocore.session
+
+try:
+    import orjson  # Rust JSON encoder - serializes big inventories 5-10x faster
+except ImportError:
+    orjson = None
+
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+import atexit
 import concurrent.futures
+import dataclasses
+import logging
+import logging.handlers
+import queue
+import functools
+import multiprocessing
+import itertools
 from datetime import datetime
 import os
+import random
 import sys
+from pathlib import Path
+import threading
+import time
 from typing import Dict, List, Any, Set
 
-PRESERVE_RESOURCE_TYPES = {
+PRESERVE_RESOURCE_TYPES = frozenset({
     'AWS::Organizations::Account',
     'AWS::Organizations::OrganizationalUnit',
     'AWS::Organizations::Root',
@@ -25,10 +46,131 @@ PRESERVE_RESOURCE_TYPES = {
     'AWS::Budgets::Budget',
     'AWS::Support::SupportPlan',
     'AWS::SavingsPlans::SavingsPlan',
-}
+})
 
 PRESERVE_TAG = "decom:preserve"
 
+# All output funnels through one QueueListener thread: log.info() takes the
+# stdout lock per line, which becomes a serialization point once twenty
+# regions x several services log concurrently
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# botocore/urllib3 debug chatter costs a record per API call at scale
+logging.getLogger('botocore').setLevel(logging.WARNING)
+logging.getLogger('urllib3').setLevel(logging.WARNING)
+log = logging.getLogger(__name__)
+
+
+def _init_worker_logging():
+    """Rebind a forked worker's logging straight to stdout.
+
+    The QueueListener thread above does not survive fork, so a worker
+    inheriting the QueueHandler would enqueue records that nothing ever
+    drains - every per-account scan line would silently vanish. Workers
+    log far less concurrently than the parent's region threads, so a
+    plain StreamHandler is fine there.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.getLogger().handlers = [handler]
+
+THROTTLE_CODES = frozenset({'Throttling', 'ThrottlingException',
+                            'RequestLimitExceeded', 'TooManyRequestsException'})
+
+_STS_CACHE_DIR = Path.home() / '.cache' / 'infra-decom'
+_STS_CACHE_TTL = 3600
+
+# Same cache file the closure agents use for their region lookups
+_REGION_CACHE = Path.home() / '.cache' / 'infra-decom' / 'regions.json'
+_REGION_CACHE_TTL = 24 * 3600
+
+
+# Projected records use slotted dataclasses instead of dicts: at tens of
+# thousands of roles/functions/stacks the per-dict overhead dominates the
+# scan's memory. Field names match the API response keys exactly so the
+# saved JSON keeps the schema the tagging and sweeper agents read.
+@dataclasses.dataclass(slots=True)
+class _IamRoleRef:
+    RoleName: str
+    Arn: str
+
+
+@dataclasses.dataclass(slots=True)
+class _IamUserRef:
+    UserName: str
+    Arn: str
+
+
+@dataclasses.dataclass(slots=True)
+class _IamPolicyRef:
+    PolicyName: str
+    Arn: str
+
+
+@dataclasses.dataclass(slots=True)
+class _SecurityGroupRef:
+    GroupId: str
+    GroupName: str
+
+
+@dataclasses.dataclass(slots=True)
+class _LambdaFunctionRef:
+    FunctionName: str
+    Runtime: str
+
+
+@dataclasses.dataclass(slots=True)
+class _DbInstanceRef:
+    DBInstanceIdentifier: str
+    Engine: str
+    # Carried through so the sweeper doesn't re-describe each instance
+    DBInstanceArn: str
+    DeletionProtection: bool
+
+
+@dataclasses.dataclass(slots=True)
+class _DbClusterRef:
+    DBClusterIdentifier: str
+    Engine: str
+
+
+@dataclasses.dataclass(slots=True)
+class _StackRef:
+    StackName: str
+    Status: str
+
+
+@dataclasses.dataclass(slots=True)
+class _BucketRef:
+    Name: str
+    CreationDate: str
+
+
+def _json_default(o):
+    """stdlib-json fallback encoder: dataclass refs, then str"""
+    if dataclasses.is_dataclass(o):
+        return {f.name: getattr(o, f.name) for f in dataclasses.fields(o)}
+    return str(o)
+
+
+def _backoff_if_throttled(e):
+    """Sleep briefly on a throttle so the region's other scanners don't
+    immediately pile onto the same rate limit (adaptive retry paces the
+    client that was throttled, but not its siblings)"""
+    if e.response.get('Error', {}).get('Code') in THROTTLE_CODES:
+        time.sleep(random.uniform(1, 4))
+
+# A 20-wide region fan-out needs the connection pool to keep up (the
+# default of 10 forces threads to queue for an HTTPS slot) and adaptive
+# retries to pace any throttling the extra concurrency surfaces
+SCAN_CFG = Config(max_pool_connections=32,
+                  retries={'max_attempts': 10, 'mode': 'adaptive'})
+
 ALL_REGIONS = [
     'us-east-1', 'us-east-2', 'us-west-1', 'us-west-2',
     'eu-west-1', 'eu-west-2', 'eu-west-3', 'eu-central-1',
@@ -73,11 +215,31 @@ class AWSInventoryAgent:
     def __init__(self, profile_name: str):
         self.profile_name = profile_name
         self.session = boto3.Session(profile_name=profile_name)
+        # Credential resolution (SSO token cache, assume-role chains) is the
+        # expensive part of session setup - do it once here and hand the
+        # resolver to the per-thread sessions below
+        self._credential_provider = self.session._session.get_component('credential_provider')
+        self._tls = threading.local()
+        # Clients are shared per (service, region) across the scan threads;
+        # the lock only guards the cache dict - construction itself happens
+        # on a per-thread session, which is safe without serialization
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+        # Running totals, maintained as results arrive so the final summary
+        # is a constant-time assignment (and mid-scan progress is readable)
+        self._total = 0
+        self._preserve = 0
         self.account_id = self.get_account_id()
+        # One timestamp for the whole scan: every region reporting the same
+        # scan_time keeps delta analysis between runs clean, and the
+        # filename stamp comes from the same instant
+        scan_started = datetime.utcnow()
+        self._scan_iso = scan_started.isoformat()
+        self._scan_stamp = scan_started.strftime('%Y%m%d_%H%M%S')
         self.inventory = {
             'account_id': self.account_id,
             'profile_name': profile_name,
-            'scan_time': datetime.utcnow().isoformat(),
+            'scan_time': self._scan_iso,
             'regions': {},
             'global_resources': {},
             'summary': {
@@ -89,63 +251,120 @@ class AWSInventoryAgent:
             }
         }
         
+    def _sess(self):
+        """Per-thread boto3 Session sharing the parent's credential resolver.
+
+        Session.client is not thread-safe on a shared session; giving each
+        worker thread its own session avoids that without re-running
+        credential negotiation, since the resolved provider is shared.
+        """
+        sess = getattr(self._tls, 'session', None)
+        if sess is None:
+            botocore_sess = botocore.session.Session(profile=self.profile_name)
+            botocore_sess.register_component('credential_provider',
+                                             self._credential_provider)
+            sess = boto3.Session(botocore_session=botocore_sess)
+            self._tls.session = sess
+        return sess
+    
+    def _client(self, service: str, region: str = None):
+        """Cached per-(service, region) client"""
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._sess().client(service, region_name=region, config=SCAN_CFG)
+            with self._clients_lock:
+                client = self._clients.setdefault(key, client)
+        return client
+    
     def get_account_id(self) -> str:
+        """Account id for the profile, cached on disk for an hour.
+
+        Profile-to-account mappings don't change between reruns, so a
+        failed scan restarted minutes later skips the STS round-trip.
+        One file per profile, so pool workers never write the same path.
+        """
+        cache_file = _STS_CACHE_DIR / f'sts-{self.profile_name}.json'
         try:
-            sts = self.session.client('sts')
-            return sts.get_caller_identity()['Account']
+            if time.time() - cache_file.stat().st_mtime < _STS_CACHE_TTL:
+                return json.loads(cache_file.read_text())['account_id']
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        try:
+            sts = self._client('sts')
+            account_id = sts.get_caller_identity()['Account']
         except Exception as e:
-            print(f"Error getting account ID for profile {self.profile_name}: {e}")
+            log.info(f"Error getting account ID for profile {self.profile_name}: {e}")
             return "unknown"
+        
+        try:
+            _STS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({'account_id': account_id}))
+        except OSError:
+            pass
+        return account_id
     
     def scan_global_resources(self):
         """Scan global resources (IAM, Route53, Organizations, etc.)"""
-        print(f"  Scanning global resources for account {self.account_id}")
+        log.info(f"  Scanning global resources for account {self.account_id}")
         
         # IAM Resources
         try:
-            iam = self.session.client('iam')
+            iam = self._client('iam')
             
+            # Project down to the two fields we keep while paginating, so
+            # the full responses (policy documents, descriptions, ...)
+            # never accumulate in memory
             # Scan IAM roles
-            paginator = iam.get_paginator('list_roles')
             roles = []
-            for page in paginator.paginate():
-                roles.extend(page['Roles'])
+            for page in iam.get_paginator('list_roles').paginate():
+                roles.extend(_IamRoleRef(r['RoleName'], r['Arn'])
+                             for r in page['Roles'])
             self.inventory['global_resources']['iam_roles'] = {
                 'count': len(roles),
                 'preserve': True,
-                'resources': [{'RoleName': r['RoleName'], 'Arn': r['Arn']} for r in roles]
+                'resources': roles
             }
+            self._total += len(roles)
+            self._preserve += len(roles)
             
             # Scan IAM users
-            paginator = iam.get_paginator('list_users')
             users = []
-            for page in paginator.paginate():
-                users.extend(page['Users'])
+            for page in iam.get_paginator('list_users').paginate():
+                users.extend(_IamUserRef(u['UserName'], u['Arn'])
+                             for u in page['Users'])
             self.inventory['global_resources']['iam_users'] = {
                 'count': len(users),
                 'preserve': True,
-                'resources': [{'UserName': u['UserName'], 'Arn': u['Arn']} for u in users]
+                'resources': users
             }
+            self._total += len(users)
+            self._preserve += len(users)
             
             # Scan IAM policies
-            paginator = iam.get_paginator('list_policies')
             policies = []
-            for page in paginator.paginate(Scope='Local'):
-                policies.extend(page['Policies'])
+            for page in iam.get_paginator('list_policies').paginate(Scope='Local'):
+                policies.extend(_IamPolicyRef(p['PolicyName'], p['Arn'])
+                                for p in page['Policies'])
             self.inventory['global_resources']['iam_policies'] = {
                 'count': len(policies),
                 'preserve': True,
-                'resources': [{'PolicyName': p['PolicyName'], 'Arn': p['Arn']} for p in policies]
+                'resources': policies
             }
-        except Exception as e:
-            print(f"    Error scanning IAM: {e}")
+            self._total += len(policies)
+            self._preserve += len(policies)
+        except (ClientError, BotoCoreError) as e:
+            log.info(f"    Error scanning IAM: {e}")
         
         # Route53 Resources
         try:
-            route53 = self.session.client('route53')
+            route53 = self._client('route53')
             
             # Hosted zones
-            zones = route53.list_hosted_zones()['HostedZones']
+            zones = []
+            for page in route53.get_paginator('list_hosted_zones').paginate():
+                zones.extend(page['HostedZones'])
             modulair_zones = [z for z in zones if 'modulairhr.com' in z['Name']]
             self.inventory['global_resources']['route53_zones'] = {
                 'count': len(zones),
@@ -153,26 +372,31 @@ class AWSInventoryAgent:
                 'resources': zones,
                 'to_preserve': modulair_zones
             }
+            self._total += len(zones)
+            self._preserve += len(modulair_zones)
             
             # Domains (if using Route53 domain registration)
             try:
-                route53domains = self.session.client('route53domains', region_name='us-east-1')
+                route53domains = self._client('route53domains', 'us-east-1')
                 domains = route53domains.list_domains()['Domains']
                 self.inventory['global_resources']['route53_domains'] = {
                     'count': len(domains),
                     'preserve': True,
                     'resources': domains
                 }
-            except:
+                self._total += len(domains)
+                self._preserve += len(domains)
+            except (ClientError, BotoCoreError):
+                # Domain registration is rarely enabled; absence isn't an error
                 pass
                 
-        except Exception as e:
-            print(f"    Error scanning Route53: {e}")
+        except (ClientError, BotoCoreError) as e:
+            log.info(f"    Error scanning Route53: {e}")
         
         # Organizations (if this is the management account)
         if self.profile_name == 'Management-Admin':
             try:
-                org = self.session.client('organizations')
+                org = self._client('organizations')
                 
                 # List accounts
                 accounts = []
@@ -184,151 +408,273 @@ class AWSInventoryAgent:
                     'preserve': True,
                     'resources': accounts
                 }
+                self._total += len(accounts)
+                self._preserve += len(accounts)
                 
                 # List OUs
                 ous = []
                 roots = org.list_roots()['Roots']
                 for root in roots:
-                    ous.extend(self._list_ous_recursive(org, root['Id']))
+                    ous.extend(self._list_ous(org, root['Id']))
                 self.inventory['global_resources']['organizational_units'] = {
                     'count': len(ous),
                     'preserve': True,
                     'resources': ous
                 }
+                self._total += len(ous)
+                self._preserve += len(ous)
                 
-            except Exception as e:
-                print(f"    Error scanning Organizations: {e}")
+            except (ClientError, BotoCoreError) as e:
+                log.info(f"    Error scanning Organizations: {e}")
     
-    def _list_ous_recursive(self, org_client, parent_id):
-        """Recursively list all OUs"""
+    def _list_ous(self, org_client, root_id):
+        """List every OU under a root, breadth-first.
+
+        An iterative worklist instead of recursion (a deep OU tree would
+        hit the recursion limit), with each level's parents paginated in
+        parallel rather than one network call per OU in sequence.
+        """
         ous = []
-        try:
-            paginator = org_client.get_paginator('list_organizational_units_for_parent')
-            for page in paginator.paginate(ParentId=parent_id):
-                for ou in page['OrganizationalUnits']:
-                    ous.append(ou)
-                    ous.extend(self._list_ous_recursive(org_client, ou['Id']))
-        except:
-            pass
+        frontier = [root_id]
+        
+        def children(parent_id):
+            try:
+                paginator = org_client.get_paginator('list_organizational_units_for_parent')
+                return [ou for page in paginator.paginate(ParentId=parent_id)
+                        for ou in page['OrganizationalUnits']]
+            except ClientError as e:
+                _backoff_if_throttled(e)
+                return []
+        
+        while frontier:
+            next_frontier = []
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(frontier))) as executor:
+                for found in executor.map(children, frontier):
+                    ous.extend(found)
+                    next_frontier.extend(ou['Id'] for ou in found)
+            frontier = next_frontier
         return ous
     
-    def scan_regional_resources(self, region: str):
-        """Scan resources in a specific region"""
-        print(f"  Scanning region {region}")
-        regional_inventory = {
-            'scan_time': datetime.utcnow().isoformat(),
-            'resources': {},
-            'summary': {
-                'total': 0,
-                'to_preserve': 0,
-                'to_delete': 0
-            }
-        }
-        
-        # EC2 Resources
+    def _scan_ec2(self, region: str):
+        """EC2 instances, VPCs and security groups in one region"""
+        resources = {}
         try:
-            ec2 = self.session.client('ec2', region_name=region)
+            ec2 = self._client('ec2', region)
             
-            # Instances
-            instances = ec2.describe_instances()
-            instance_count = sum(len(r['Instances']) for r in instances['Reservations'])
+            # Instances (unpaginated describe_* truncates on big accounts,
+            # which silently under-reports the inventory)
+            reservations = []
+            for page in ec2.get_paginator('describe_instances').paginate():
+                reservations.extend(page['Reservations'])
+            instance_count = sum(len(r['Instances']) for r in reservations)
             if instance_count > 0:
-                regional_inventory['resources']['ec2_instances'] = {
+                resources['ec2_instances'] = {
                     'count': instance_count,
-                    'resources': instances['Reservations']
+                    'resources': reservations
                 }
             
             # VPCs
-            vpcs = ec2.describe_vpcs()['Vpcs']
+            vpcs = []
+            for page in ec2.get_paginator('describe_vpcs').paginate():
+                vpcs.extend(page['Vpcs'])
             if vpcs:
-                regional_inventory['resources']['vpcs'] = {
+                resources['vpcs'] = {
                     'count': len(vpcs),
                     'resources': vpcs
                 }
             
             # Security Groups
-            sgs = ec2.describe_security_groups()['SecurityGroups']
+            sgs = []
+            for page in ec2.get_paginator('describe_security_groups').paginate():
+                sgs.extend(page['SecurityGroups'])
             if sgs:
-                regional_inventory['resources']['security_groups'] = {
+                resources['security_groups'] = {
                     'count': len(sgs),
-                    'resources': [{'GroupId': sg['GroupId'], 'GroupName': sg['GroupName']} for sg in sgs]
+                    'resources': [_SecurityGroupRef(sg['GroupId'], sg['GroupName']) for sg in sgs]
                 }
                 
-        except Exception as e:
-            print(f"    Error scanning EC2 in {region}: {e}")
-        
-        # S3 Buckets (only in us-east-1)
-        if region == 'us-east-1':
-            try:
-                s3 = self.session.client('s3')
-                buckets = s3.list_buckets()['Buckets']
-                if buckets:
-                    regional_inventory['resources']['s3_buckets'] = {
-                        'count': len(buckets),
-                        'resources': [{'Name': b['Name'], 'CreationDate': b['CreationDate'].isoformat()} for b in buckets]
-                    }
-            except Exception as e:
-                print(f"    Error scanning S3: {e}")
-        
-        # Lambda Functions
+        except ClientError as e:
+            _backoff_if_throttled(e)
+            log.info(f"    Error scanning EC2 in {region}: {e}")
+        except BotoCoreError as e:
+            log.info(f"    Error scanning EC2 in {region}: {e}")
+        return resources
+    
+    def _scan_s3(self):
+        """S3 buckets (global listing, surfaced under us-east-1)"""
+        resources = {}
         try:
-            lambda_client = self.session.client('lambda', region_name=region)
+            s3 = self._client('s3')
+            buckets = s3.list_buckets()['Buckets']
+            if buckets:
+                resources['s3_buckets'] = {
+                    'count': len(buckets),
+                    'resources': [_BucketRef(b['Name'], b['CreationDate'].isoformat()) for b in buckets]
+                }
+        except ClientError as e:
+            _backoff_if_throttled(e)
+            log.info(f"    Error scanning S3: {e}")
+        except BotoCoreError as e:
+            log.info(f"    Error scanning S3: {e}")
+        return resources
+    
+    def _scan_lambda(self, region: str):
+        """Lambda functions in one region"""
+        resources = {}
+        try:
+            lambda_client = self._client('lambda', region)
             functions = []
-            paginator = lambda_client.get_paginator('list_functions')
-            for page in paginator.paginate():
-                functions.extend(page['Functions'])
+            for page in lambda_client.get_paginator('list_functions').paginate():
+                functions.extend(
+                    _LambdaFunctionRef(f['FunctionName'], f.get('Runtime', 'N/A'))
+                    for f in page['Functions'])
             if functions:
-                regional_inventory['resources']['lambda_functions'] = {
+                resources['lambda_functions'] = {
                     'count': len(functions),
-                    'resources': [{'FunctionName': f['FunctionName'], 'Runtime': f.get('Runtime', 'N/A')} for f in functions]
+                    'resources': functions
                 }
-        except Exception as e:
-            print(f"    Error scanning Lambda in {region}: {e}")
-        
-        # RDS Instances
+        except ClientError as e:
+            _backoff_if_throttled(e)
+            log.info(f"    Error scanning Lambda in {region}: {e}")
+        except BotoCoreError as e:
+            log.info(f"    Error scanning Lambda in {region}: {e}")
+        return resources
+    
+    def _scan_rds(self, region: str):
+        """RDS instances and clusters in one region"""
+        resources = {}
         try:
-            rds = self.session.client('rds', region_name=region)
+            rds = self._client('rds', region)
             
             # DB Instances
-            db_instances = rds.describe_db_instances()['DBInstances']
+            db_instances = []
+            for page in rds.get_paginator('describe_db_instances').paginate():
+                db_instances.extend(page['DBInstances'])
             if db_instances:
-                regional_inventory['resources']['rds_instances'] = {
+                resources['rds_instances'] = {
                     'count': len(db_instances),
-                    'resources': [{'DBInstanceIdentifier': db['DBInstanceIdentifier'], 'Engine': db['Engine']} for db in db_instances]
+                    'resources': [_DbInstanceRef(db['DBInstanceIdentifier'], db['Engine'],
+                                                 db['DBInstanceArn'],
+                                                 db.get('DeletionProtection', False))
+                                  for db in db_instances]
                 }
             
             # DB Clusters
-            db_clusters = rds.describe_db_clusters()['DBClusters']
+            db_clusters = []
+            for page in rds.get_paginator('describe_db_clusters').paginate():
+                db_clusters.extend(page['DBClusters'])
             if db_clusters:
-                regional_inventory['resources']['rds_clusters'] = {
+                resources['rds_clusters'] = {
                     'count': len(db_clusters),
-                    'resources': [{'DBClusterIdentifier': db['DBClusterIdentifier'], 'Engine': db['Engine']} for db in db_clusters]
+                    'resources': [_DbClusterRef(db['DBClusterIdentifier'], db['Engine']) for db in db_clusters]
                 }
                 
-        except Exception as e:
-            print(f"    Error scanning RDS in {region}: {e}")
-        
-        # CloudFormation Stacks
+        except ClientError as e:
+            _backoff_if_throttled(e)
+            log.info(f"    Error scanning RDS in {region}: {e}")
+        except BotoCoreError as e:
+            log.info(f"    Error scanning RDS in {region}: {e}")
+        return resources
+    
+    def _scan_cfn(self, region: str):
+        """CloudFormation stacks in one region"""
+        resources = {}
         try:
-            cfn = self.session.client('cloudformation', region_name=region)
+            cfn = self._client('cloudformation', region)
             stacks = []
+            ct_stacks = []
             paginator = cfn.get_paginator('list_stacks')
             for page in paginator.paginate(StackStatusFilter=['CREATE_COMPLETE', 'UPDATE_COMPLETE', 'UPDATE_ROLLBACK_COMPLETE']):
-                stacks.extend(page['StackSummaries'])
-            
-            # Check for Control Tower stacks
-            ct_stacks = [s for s in stacks if 'ControlTower' in s['StackName'] or 'AWS-Landing-Zone' in s['StackName']]
+                for summary in page['StackSummaries']:
+                    # Control Tower stacks must survive the decommission
+                    if 'ControlTower' in summary['StackName'] or 'AWS-Landing-Zone' in summary['StackName']:
+                        ct_stacks.append(summary)
+                    stacks.append(_StackRef(summary['StackName'],
+                                            summary['StackStatus']))
             
             if stacks:
-                regional_inventory['resources']['cloudformation_stacks'] = {
+                resources['cloudformation_stacks'] = {
                     'count': len(stacks),
                     'control_tower_stacks': len(ct_stacks),
-                    'resources': [{'StackName': s['StackName'], 'Status': s['StackStatus']} for s in stacks],
+                    'resources': stacks,
                     'to_preserve': ct_stacks
                 }
                 
-        except Exception as e:
-            print(f"    Error scanning CloudFormation in {region}: {e}")
+        except ClientError as e:
+            _backoff_if_throttled(e)
+            log.info(f"    Error scanning CloudFormation in {region}: {e}")
+        except BotoCoreError as e:
+            log.info(f"    Error scanning CloudFormation in {region}: {e}")
+        return resources
+    
+    # Services with a dedicated scanner (or that the tagging API can't
+    # see properly); everything else is picked up by the tagging sweep
+    _DEDICATED_SCAN_SERVICES = frozenset({'ec2', 'lambda', 'rds',
+                                          'cloudformation', 's3', 'iam',
+                                          'route53'})
+    
+    def _scan_via_tagging_api(self, region: str):
+        """Sweep every taggable resource in a region with one paginated call.
+
+        One get_resources pass covers dozens of services the dedicated
+        scanners never query (SQS, SNS, DynamoDB, ElastiCache, ...), so
+        those surface in the inventory without one describe_* call per
+        service per region. Services with a dedicated scanner are skipped
+        here to avoid double counting; untagged resources in the remaining
+        services still won't appear, which is why the dedicated scanners
+        stay authoritative for the core services.
+        """
+        resources = {}
+        try:
+            tagging = self._client('resourcegroupstaggingapi', region)
+            by_service = {}
+            for page in tagging.get_paginator('get_resources').paginate():
+                for mapping in page['ResourceTagMappingList']:
+                    arn = mapping['ResourceARN']
+                    service = arn.split(':')[2]
+                    if service in self._DEDICATED_SCAN_SERVICES:
+                        continue
+                    by_service.setdefault(service, []).append(arn)
+            for service, arns in by_service.items():
+                resources[f'tagged_{service}'] = {
+                    'count': len(arns),
+                    'resources': arns
+                }
+        except ClientError as e:
+            _backoff_if_throttled(e)
+            log.info(f"    Error scanning tagged resources in {region}: {e}")
+        except BotoCoreError as e:
+            log.info(f"    Error scanning tagged resources in {region}: {e}")
+        return resources
+    
+    # Data-driven dispatch: adding a regional scanner means adding its
+    # method here, not editing scan_regional_resources
+    _REGIONAL_SCANNERS = (_scan_ec2, _scan_lambda, _scan_rds, _scan_cfn,
+                          _scan_via_tagging_api)
+    
+    def scan_regional_resources(self, region: str):
+        """Scan resources in a specific region"""
+        log.info(f"  Scanning region {region}")
+        regional_inventory = {
+            'scan_time': self._scan_iso,
+            'resources': {},
+            'summary': {
+                'total': 0,
+                'to_preserve': 0,
+                'to_delete': 0
+            }
+        }
+        
+        # The service scans share no data, so run them concurrently - per
+        # region this turns the sequential round-trip chains into one
+        scans = [functools.partial(scan, self, region)
+                 for scan in self._REGIONAL_SCANNERS]
+        if region == 'us-east-1':
+            scans.append(self._scan_s3)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(scans)) as executor:
+            for resources in executor.map(lambda scan: scan(), scans):
+                regional_inventory['resources'].update(resources)
         
         # Calculate summary
         for service, data in regional_inventory['resources'].items():
@@ -339,26 +685,75 @@ class AWSInventoryAgent:
         
         return regional_inventory
     
+    def _enabled_regions(self):
+        """Regions from ALL_REGIONS that the account has actually enabled.
+
+        Opt-in regions the account never enabled still cost a round-trip
+        and a ClientError per service scanned there; one describe_regions
+        call (cached on disk for 24h, shared with the closure agents)
+        removes them from the schedule entirely.
+        """
+        cached = {}
+        try:
+            if time.time() - _REGION_CACHE.stat().st_mtime < _REGION_CACHE_TTL:
+                cached = json.loads(_REGION_CACHE.read_text())
+                if self.profile_name in cached:
+                    enabled = set(cached[self.profile_name])
+                    return [r for r in ALL_REGIONS if r in enabled]
+        except (OSError, ValueError):
+            pass
+        
+        try:
+            ec2 = self._client('ec2', 'us-east-1')
+            regions = [r['RegionName'] for r in
+                       ec2.describe_regions(AllRegions=False)['Regions']]
+        except (ClientError, BotoCoreError) as e:
+            log.info(f"  Could not list enabled regions, scanning all: {e}")
+            return list(ALL_REGIONS)
+        
+        try:
+            _REGION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            cached[self.profile_name] = regions
+            _REGION_CACHE.write_text(json.dumps(cached))
+        except OSError:
+            pass
+        enabled = set(regions)
+        return [r for r in ALL_REGIONS if r in enabled]
+    
     def scan_account(self):
         """Scan all resources in the account"""
-        print(f"\nScanning account {self.account_id} ({self.profile_name})")
+        log.info(f"\nScanning account {self.account_id} ({self.profile_name})")
         
         # Scan global resources
         self.scan_global_resources()
         
         # Scan each region in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_region = {executor.submit(self.scan_regional_resources, region): region for region in ALL_REGIONS}
+        # Regions scan in parallel, but only a bounded number are in flight
+        # at once: each completed result is folded into the inventory (and
+        # its future dropped) before another region is submitted, so peak
+        # memory tracks the in-flight window rather than all 20 regions'
+        # raw responses at once
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            in_flight = {}
             
-            for future in concurrent.futures.as_completed(future_to_region):
-                region = future_to_region[future]
+            def drain(future):
+                region = in_flight.pop(future)
                 try:
                     regional_data = future.result()
                     if regional_data['resources']:  # Only store if resources found
                         self.inventory['regions'][region] = regional_data
                         self.inventory['summary']['by_region'][region] = regional_data['summary']
+                        self._total += regional_data['summary']['total']
+                        self._preserve += regional_data['summary']['to_preserve']
                 except Exception as e:
-                    print(f"  Error scanning region {region}: {e}")
+                    log.info(f"  Error scanning region {region}: {e}")
+            
+            for region in self._enabled_regions():
+                while len(in_flight) >= 8:
+                    drain(next(concurrent.futures.as_completed(in_flight)))
+                in_flight[executor.submit(self.scan_regional_resources, region)] = region
+            while in_flight:
+                drain(next(concurrent.futures.as_completed(in_flight)))
         
         # Calculate totals
         self._calculate_summary()
@@ -366,44 +761,84 @@ class AWSInventoryAgent:
         return self.inventory
     
     def _calculate_summary(self):
-        """Calculate summary statistics"""
-        total = 0
-        preserve = 0
-        
-        # Count global resources
-        for resource_type, data in self.inventory['global_resources'].items():
-            count = data.get('count', 0)
-            total += count
-            if data.get('preserve', False):
-                preserve += count
-            else:
-                preserve += data.get('preserve_count', 0)
-        
-        # Count regional resources
-        for region, regional_data in self.inventory['regions'].items():
-            total += regional_data['summary']['total']
-            preserve += regional_data['summary']['to_preserve']
-        
-        self.inventory['summary']['total_resources'] = total
-        self.inventory['summary']['resources_to_preserve'] = preserve
-        self.inventory['summary']['resources_to_delete'] = total - preserve
+        """Publish the running totals into the summary"""
+        self.inventory['summary']['total_resources'] = self._total
+        self.inventory['summary']['resources_to_preserve'] = self._preserve
+        self.inventory['summary']['resources_to_delete'] = self._total - self._preserve
     
     def save_inventory(self, output_dir: str):
         """Save inventory to file"""
-        filename = f"{output_dir}/inventory_{self.account_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
+        filename = f"{output_dir}/inventory_{self.account_id}_{self._scan_stamp}.json"
         os.makedirs(output_dir, exist_ok=True)
         
-        with open(filename, 'w') as f:
-            json.dump(self.inventory, f, indent=2, default=str)
+        # Inventories run to tens of MB; orjson encodes them natively
+        # (including boto3's datetimes) in a fraction of stdlib json's time
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(self.inventory, default=str,
+                                     option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(self.inventory, f, indent=2, default=_json_default)
         
-        print(f"  Inventory saved to {filename}")
+        log.info(f"  Inventory saved to {filename}")
         return filename
+    
+    def save_ndjson(self, output_dir: str):
+        """Flatten the inventory to one resource record per line.
+
+        The monolithic JSON has to be loaded whole to answer any question;
+        NDJSON lets downstream tooling stream or grep a single region or
+        service out of a 100 MB inventory without parsing the rest.
+        """
+        filename = f"{output_dir}/inventory_{self.account_id}_{self._scan_stamp}.ndjson"
+        os.makedirs(output_dir, exist_ok=True)
+        
+        def encode(record):
+            if orjson is not None:
+                return orjson.dumps(record, default=str)
+            return json.dumps(record, default=_json_default).encode()
+        
+        with open(filename, 'wb') as f:
+            for service, data in self.inventory['global_resources'].items():
+                for resource in data.get('resources', []):
+                    f.write(encode({'account': self.account_id,
+                                    'region': 'global',
+                                    'service': service,
+                                    'resource': resource}))
+                    f.write(b'\n')
+            for region, regional_data in self.inventory['regions'].items():
+                for service, data in regional_data['resources'].items():
+                    for resource in data.get('resources', []):
+                        f.write(encode({'account': self.account_id,
+                                        'region': region,
+                                        'service': service,
+                                        'resource': resource}))
+                        f.write(b'\n')
+        
+        log.info(f"  Flat inventory saved to {filename}")
+        return filename
+
+
+def run_profile(profile: str, output_dir: str):
+    """Scan one account; runs in a worker process.
+
+    Returns only what the consolidated report needs (account id, summary,
+    filename) - the full inventory is already on disk, and shipping it
+    back through the process pipe would just re-pickle megabytes per
+    account.
+    """
+    agent = AWSInventoryAgent(profile)
+    inventory = agent.scan_account()
+    filename = agent.save_inventory(output_dir)
+    agent.save_ndjson(output_dir)
+    return profile, inventory['account_id'], inventory['summary'], filename
 
 
 def main():
     """Main execution function"""
-    print("AWS Inventory Agent Starting...")
-    print(f"Scan started at: {datetime.utcnow().isoformat()}")
+    log.info("AWS Inventory Agent Starting...")
+    log.info(f"Scan started at: {datetime.utcnow().isoformat()}")
     
     # Get all profiles
     profiles = [
@@ -418,53 +853,81 @@ def main():
         'JWModulairHR-Admin'
     ]
     
-    all_inventories = {}
     output_dir = "/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/inventory/results"
     
-    # Scan each account
-    for profile in profiles:
-        try:
-            agent = AWSInventoryAgent(profile)
-            inventory = agent.scan_account()
-            filename = agent.save_inventory(output_dir)
-            all_inventories[profile] = {
-                'inventory': inventory,
-                'filename': filename
-            }
-        except Exception as e:
-            print(f"Error scanning profile {profile}: {e}")
+    # Constructing a client parses the service's multi-MB JSON model; do it
+    # once here so the forked workers inherit the parsed models copy-on-
+    # write instead of each re-parsing ec2/s3/rds/... from scratch
+    try:
+        warm = boto3.Session(profile_name=profiles[0])
+        for service in ('ec2', 's3', 'rds', 'lambda', 'cloudformation',
+                        'iam', 'route53', 'organizations', 'sts',
+                        'resourcegroupstaggingapi'):
+            warm.client(service, region_name='us-east-1')
+    except Exception as e:
+        log.info(f"Service model preload skipped: {e}")
     
-    # Generate consolidated report
+    # Accounts are independent, so scan them in parallel - one process per
+    # profile sidesteps GIL contention from the per-account thread pools
+    # and gives each account its own boto3 Session; fork (not spawn) so
+    # the preloaded service models above are inherited
+    # Each profile's result is folded into the consolidated report the
+    # moment its worker finishes - only per-account summary dicts (a few
+    # KB) ever sit in this process, never the full inventories
     consolidated_report = {
-        'scan_completed': datetime.utcnow().isoformat(),
-        'accounts_scanned': len(all_inventories),
-        'total_resources_found': sum(inv['inventory']['summary']['total_resources'] for inv in all_inventories.values()),
-        'total_to_preserve': sum(inv['inventory']['summary']['resources_to_preserve'] for inv in all_inventories.values()),
-        'total_to_delete': sum(inv['inventory']['summary']['resources_to_delete'] for inv in all_inventories.values()),
+        'scan_completed': None,
+        'accounts_scanned': 0,
+        'total_resources_found': 0,
+        'total_to_preserve': 0,
+        'total_to_delete': 0,
         'accounts': {}
     }
-    
-    for profile, data in all_inventories.items():
-        consolidated_report['accounts'][profile] = {
-            'account_id': data['inventory']['account_id'],
-            'total_resources': data['inventory']['summary']['total_resources'],
-            'to_preserve': data['inventory']['summary']['resources_to_preserve'],
-            'to_delete': data['inventory']['summary']['resources_to_delete'],
-            'inventory_file': data['filename']
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=len(profiles),
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_worker_logging) as executor:
+        futures = {
+            executor.submit(run_profile, profile, output_dir): profile
+            for profile in profiles
         }
+        for future in concurrent.futures.as_completed(futures):
+            profile = futures[future]
+            try:
+                profile, account_id, summary, filename = future.result()
+            except Exception as e:
+                log.info(f"Error scanning profile {profile}: {e}")
+                continue
+            consolidated_report['accounts_scanned'] += 1
+            consolidated_report['total_resources_found'] += summary['total_resources']
+            consolidated_report['total_to_preserve'] += summary['resources_to_preserve']
+            consolidated_report['total_to_delete'] += summary['resources_to_delete']
+            consolidated_report['accounts'][profile] = {
+                'account_id': account_id,
+                'total_resources': summary['total_resources'],
+                'to_preserve': summary['resources_to_preserve'],
+                'to_delete': summary['resources_to_delete'],
+                'inventory_file': filename
+            }
+    
+    consolidated_report['scan_completed'] = datetime.utcnow().isoformat()
     
     # Save consolidated report
     report_file = f"{output_dir}/consolidated_inventory_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(report_file, 'w') as f:
-        json.dump(consolidated_report, f, indent=2)
+    if orjson is not None:
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(consolidated_report, default=str,
+                                 option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_file, 'w') as f:
+            json.dump(consolidated_report, f, indent=2)
     
-    print(f"\nInventory scan completed!")
-    print(f"Consolidated report saved to: {report_file}")
-    print(f"\nSummary:")
-    print(f"  Total accounts scanned: {consolidated_report['accounts_scanned']}")
-    print(f"  Total resources found: {consolidated_report['total_resources_found']}")
-    print(f"  Resources to preserve: {consolidated_report['total_to_preserve']}")
-    print(f"  Resources to delete: {consolidated_report['total_to_delete']}")
+    log.info(f"\nInventory scan completed!")
+    log.info(f"Consolidated report saved to: {report_file}")
+    log.info(f"\nSummary:")
+    log.info(f"  Total accounts scanned: {consolidated_report['accounts_scanned']}")
+    log.info(f"  Total resources found: {consolidated_report['total_resources_found']}")
+    log.info(f"  Resources to preserve: {consolidated_report['total_to_preserve']}")
+    log.info(f"  Resources to delete: {consolidated_report['total_to_delete']}")
 
 
 if __name__ == "__main__":
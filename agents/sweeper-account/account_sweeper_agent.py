@@ -6,38 +6,98 @@ CRITICAL: This agent DELETES resources. Use with extreme caution.
 
 import json
 import boto3
+import atexit
+import concurrent.futures
+import logging
+import logging.handlers
+import queue
+import threading
 import time
 from datetime import datetime
 import os
 import sys
 from typing import Dict, List, Any, Set
 import argparse
+from botocore.config import Config
+
+try:
+    import ijson  # streams multi-hundred-MB inventories without buffering them
+except ImportError:
+    ijson = None
 
 PRESERVE_TAG_KEY = "decom:preserve"
 PRESERVE_TAG_VALUE = "true"
-DRY_RUN = True  # Safety default - must explicitly set to False
+
+# All output funnels through one QueueListener thread: with the phase
+# pools and per-resource workers running, direct stdout writes take the
+# stdio lock and flush per line, which becomes a serialization point
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# boto3 logs every retry at INFO once throttling kicks in; keep that
+# noise out of the sweep output
+logging.getLogger('botocore').setLevel(logging.WARNING)
+logging.getLogger('urllib3').setLevel(logging.WARNING)
+log = logging.getLogger(__name__)
 
 # Service control policies may prevent deletion in these accounts
 RESTRICTED_ACCOUNTS = ['LogArchive-Admin', 'Audit-Admin']
 
+# Parallel deletes hit API throttling quickly; adaptive mode rate-limits
+# client-side and keeps retrying throttles instead of surfacing them as
+# failed deletions. max_pool_connections must outpace the widest pool
+# (16 regions x 8 resource workers against shared regional clients) or
+# threads queue for an HTTPS connection slot
+RETRY_CFG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'},
+                   max_pool_connections=50)
+
+# Flush the NDJSON event log at least this often so a crashed sweep
+# loses a bounded tail of records rather than a full OS buffer, while
+# the write syscall still amortizes across many events
+EVENTS_FLUSH_EVERY = 100
+
 class AccountSweeperAgent:
     def __init__(self, profile_name: str, inventory_file: str, dry_run: bool = True):
         self.profile_name = profile_name
         self.session = boto3.Session(profile_name=profile_name)
+        # Clients memoized per (service, region): every Session.client()
+        # call rebuilds an endpoint resolver and signer chain
+        self._clients = {}
+        self._clients_lock = threading.Lock()
         self.account_id = self.get_account_id()
-        self.inventory = self.load_inventory(inventory_file)
+        self.inventory_file = inventory_file
+        self.load_inventory(inventory_file)
         self.dry_run = dry_run
+        # Deletions fan out across threads; log mutations share a lock
+        self._log_lock = threading.Lock()
+        # Preserved-resource ARNs, one bulk tagging-API fetch per region
+        self._preserved_arns = {}
+        # Hoisted once so the per-tag check is a single tuple compare
+        # instead of two module-global lookups per tag
+        self._preserve_pair = (PRESERVE_TAG_KEY, PRESERVE_TAG_VALUE)
+        self._preserved_lock = threading.Lock()
+        # Per-resource outcomes stream to disk as they happen, one JSON
+        # line each: indent=2 over millions of entries forgoes the
+        # encoder's C fast path and holds everything in memory, and a
+        # crashed sweep used to lose all progress. The in-memory log
+        # keeps only the counters plus run metadata.
+        output_dir = "/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/sweeper-account/results"
+        os.makedirs(output_dir, exist_ok=True)
+        stamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+        self.events_path = f"{output_dir}/sweep_{self.account_id}_{stamp}.ndjson"
+        self.summary_path = f"{output_dir}/sweep_summary_{self.account_id}_{stamp}.json"
+        self._events_fp = open(self.events_path, 'w', buffering=1 << 20)
+        self._events_pending = 0
         self.deletion_log = {
             'account_id': self.account_id,
             'profile_name': profile_name,
             'start_time': datetime.utcnow().isoformat(),
             'dry_run': dry_run,
-            'deletions': {
-                'successful': [],
-                'failed': [],
-                'skipped_preserved': [],
-                'skipped_dependency': []
-            },
+            'events_file': self.events_path,
             'summary': {
                 'total_deleted': 0,
                 'total_failed': 0,
@@ -46,28 +106,140 @@ class AccountSweeperAgent:
             }
         }
         
+    def _preserved_arns_for_region(self, region: str):
+        """ARNs tagged for preservation in a region, fetched once in bulk.
+
+        One paginated get_resources call replaces a tag-describe round-trip
+        per resource. Returns None if the bulk fetch fails, in which case
+        callers fall back to per-resource tag lookups (which keep the
+        fail-safe 'unknown means preserved' behaviour).
+        """
+        with self._preserved_lock:
+            if region in self._preserved_arns:
+                return self._preserved_arns[region]
+        
+        try:
+            tagging = self._client('resourcegroupstaggingapi', region)
+            arns = set()
+            paginator = tagging.get_paginator('get_resources')
+            for page in paginator.paginate(
+                    TagFilters=[{'Key': PRESERVE_TAG_KEY, 'Values': [PRESERVE_TAG_VALUE]}]):
+                for mapping in page['ResourceTagMappingList']:
+                    arn = mapping['ResourceARN']
+                    arns.add(arn)
+                    # Stack ARNs end in a generated uuid; keep a name-only
+                    # variant so callers can match without knowing it
+                    if ':cloudformation:' in arn and '/' in arn:
+                        arns.add(arn.rsplit('/', 1)[0])
+        except Exception as e:
+            log.info(f"    Warning: bulk tag lookup failed in {region}, "
+                  f"falling back to per-resource tags: {e}")
+            arns = None
+        
+        with self._preserved_lock:
+            self._preserved_arns[region] = arns
+        return arns
+    
+    def _is_preserved(self, region: str, arn: str, tag_fallback):
+        """Preservation check: O(1) ARN lookup, per-resource tags on fallback"""
+        preserved = self._preserved_arns_for_region(region)
+        if preserved is not None:
+            return arn in preserved
+        return self.is_resource_preserved(arn, tag_fallback())
+    
+    def _client(self, service: str, region: str = None):
+        """Cached boto3 client for a (service, region) pair.
+
+        The lock serializes construction — Session.client() is not
+        thread-safe — but the common case is a plain dict hit.
+        """
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = self.session.client(
+                        service, region_name=region, config=RETRY_CFG)
+        return client
+    
+    def _log_result(self, outcome: str, entry: Dict, counter: str):
+        """Record one resource outcome (thread-safe)"""
+        record = {'outcome': outcome, **entry}
+        with self._log_lock:
+            self._events_fp.write(json.dumps(record) + '\n')
+            self._events_pending += 1
+            if self._events_pending >= EVENTS_FLUSH_EVERY:
+                self._events_fp.flush()
+                self._events_pending = 0
+            self.deletion_log['summary'][counter] += 1
+    
+    def _for_each(self, worker, items, max_workers=8):
+        """Process independent resources across a small thread pool.
+
+        Each worker handles (and logs) its own failures, so map() never
+        raises; deletes are pure network waits, so the pool turns a chain
+        of round-trips into one.
+        """
+        items = list(items)
+        if not items:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            list(executor.map(worker, items))
+    
     def get_account_id(self) -> str:
         try:
-            sts = self.session.client('sts')
+            sts = self._client('sts')
             return sts.get_caller_identity()['Account']
         except Exception as e:
-            print(f"Error getting account ID: {e}")
+            log.info(f"Error getting account ID: {e}")
             return "unknown"
     
-    def load_inventory(self, inventory_file: str) -> Dict:
-        """Load the inventory file for this account"""
-        with open(inventory_file, 'r') as f:
-            return json.load(f)
+    def load_inventory(self, inventory_file: str) -> None:
+        """Index the inventory file without materializing its resources.
+
+        With ijson available, only the structure (region names and which
+        services each region has) is parsed up front; resource records
+        stream through _iter_resources one at a time, so memory stays
+        bounded by one service's list instead of the whole file and the
+        first deletion fires before the file finishes parsing. Without
+        ijson the stdlib loads the file whole, as before.
+        """
+        if ijson is None:
+            with open(inventory_file, 'r') as f:
+                self.inventory = json.load(f)
+            self._services = {region: set(data.get('resources', {}))
+                              for region, data in self.inventory.get('regions', {}).items()}
+        else:
+            self.inventory = None
+            self._services = {}
+            with open(inventory_file, 'rb') as f:
+                for prefix, event, value in ijson.parse(f):
+                    if event != 'map_key':
+                        continue
+                    if prefix == 'regions':
+                        self._services.setdefault(value, set())
+                    else:
+                        parts = prefix.split('.')
+                        if len(parts) == 3 and parts[0] == 'regions' and parts[2] == 'resources':
+                            self._services[parts[1]].add(value)
+        self._regions = list(self._services)
+    
+    def _iter_resources(self, region: str, service: str):
+        """Yield one resource record at a time for a region's service"""
+        if self.inventory is not None:
+            yield from (self.inventory['regions'].get(region, {})
+                        .get('resources', {}).get(service, {}).get('resources', []))
+            return
+        with open(self.inventory_file, 'rb') as f:
+            yield from ijson.items(f, f'regions.{region}.resources.{service}.resources.item')
     
     def is_resource_preserved(self, resource_id: str, tags: List[Dict]) -> bool:
         """Check if a resource has the preservation tag"""
         if not tags:
             return False
-        
-        for tag in tags:
-            if tag.get('Key') == PRESERVE_TAG_KEY and tag.get('Value') == PRESERVE_TAG_VALUE:
-                return True
-        return False
+        preserve_pair = self._preserve_pair
+        return any((tag.get('Key'), tag.get('Value')) == preserve_pair for tag in tags)
     
     def get_resource_tags(self, service_client, resource_arn: str = None, resource_id: str = None, 
                          resource_type: str = None) -> List[Dict]:
@@ -94,90 +266,103 @@ class AccountSweeperAgent:
                 return []
         except Exception as e:
             # If we can't get tags, assume resource should be preserved for safety
-            print(f"    Warning: Could not get tags for {resource_id}: {e}")
+            log.info(f"    Warning: Could not get tags for {resource_id}: {e}")
             return [{'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE}]  # Safety default
     
     def delete_s3_buckets(self):
         """Delete S3 buckets not tagged for preservation"""
-        if 's3_buckets' not in self.inventory['regions'].get('us-east-1', {}).get('resources', {}):
+        if 's3_buckets' not in self._services.get('us-east-1', set()):
             return
             
-        print(f"  Processing S3 buckets...")
-        s3 = self.session.client('s3')
+        log.info(f"  Processing S3 buckets...")
+        s3 = self._client('s3')
         
-        buckets = self.inventory['regions']['us-east-1']['resources']['s3_buckets'].get('resources', [])
-        for bucket in buckets:
+        buckets = self._iter_resources('us-east-1', 's3_buckets')
+        
+        # A bucket's tags surface in the tagging API of its own region, so
+        # the preserved set for buckets is the union over inventory regions
+        preserved_buckets = set()
+        for region in self._regions:
+            regional = self._preserved_arns_for_region(region)
+            if regional is None:
+                preserved_buckets = None
+                break
+            preserved_buckets |= regional
+        
+        # Mode is fixed for the agent's lifetime, so pick the action once
+        # here rather than re-branching on self.dry_run per bucket
+        if self.dry_run:
+            def remove_bucket(bucket_name):
+                log.info(f"    DRY RUN - Would delete: S3 bucket {bucket_name}")
+        else:
+            def remove_bucket(bucket_name):
+                # Empty bucket first: deletes drain inside the listing
+                # loop, so the first batch goes out after page one and
+                # memory stays bounded at one batch instead of every
+                # version in the bucket
+                log.info(f"    Emptying S3 bucket {bucket_name}...")
+                paginator = s3.get_paginator('list_object_versions')
+                
+                batch = []
+                for page in paginator.paginate(Bucket=bucket_name,
+                                               PaginationConfig={'PageSize': 1000}):
+                    for entry in page.get('DeleteMarkers', []) + page.get('Versions', []):
+                        batch.append({'Key': entry['Key'], 'VersionId': entry['VersionId']})
+                        if len(batch) >= 1000:
+                            # Quiet mode skips the per-key echo in the response
+                            s3.delete_objects(Bucket=bucket_name,
+                                              Delete={'Objects': batch, 'Quiet': True})
+                            batch = []
+                if batch:
+                    s3.delete_objects(Bucket=bucket_name,
+                                      Delete={'Objects': batch, 'Quiet': True})
+                
+                # Delete bucket
+                s3.delete_bucket(Bucket=bucket_name)
+                log.info(f"    DELETED: S3 bucket {bucket_name}")
+        
+        def process_bucket(bucket):
             bucket_name = bucket['Name']
             
             try:
-                tags = self.get_resource_tags(s3, resource_id=bucket_name, resource_type='s3')
+                if preserved_buckets is not None:
+                    preserved = f"arn:aws:s3:::{bucket_name}" in preserved_buckets
+                else:
+                    tags = self.get_resource_tags(s3, resource_id=bucket_name, resource_type='s3')
+                    preserved = self.is_resource_preserved(bucket_name, tags)
                 
-                if self.is_resource_preserved(bucket_name, tags):
-                    print(f"    PRESERVED: S3 bucket {bucket_name}")
-                    self.deletion_log['deletions']['skipped_preserved'].append({
+                if preserved:
+                    log.info(f"    PRESERVED: S3 bucket {bucket_name}")
+                    self._log_result('skipped_preserved', {
                         'type': 's3_bucket',
                         'id': bucket_name,
                         'reason': 'Tagged for preservation'
-                    })
-                    self.deletion_log['summary']['total_preserved'] += 1
+                    }, 'total_preserved')
                 else:
-                    if self.dry_run:
-                        print(f"    DRY RUN - Would delete: S3 bucket {bucket_name}")
-                    else:
-                        # Empty bucket first
-                        print(f"    Emptying S3 bucket {bucket_name}...")
-                        paginator = s3.get_paginator('list_object_versions')
-                        
-                        delete_markers = []
-                        versions = []
-                        
-                        for page in paginator.paginate(Bucket=bucket_name):
-                            for marker in page.get('DeleteMarkers', []):
-                                delete_markers.append({'Key': marker['Key'], 'VersionId': marker['VersionId']})
-                            for version in page.get('Versions', []):
-                                versions.append({'Key': version['Key'], 'VersionId': version['VersionId']})
-                        
-                        # Delete all versions and markers
-                        for i in range(0, len(delete_markers), 1000):
-                            batch = delete_markers[i:i+1000]
-                            if batch:
-                                s3.delete_objects(Bucket=bucket_name, Delete={'Objects': batch})
-                        
-                        for i in range(0, len(versions), 1000):
-                            batch = versions[i:i+1000]
-                            if batch:
-                                s3.delete_objects(Bucket=bucket_name, Delete={'Objects': batch})
-                        
-                        # Delete bucket
-                        s3.delete_bucket(Bucket=bucket_name)
-                        print(f"    DELETED: S3 bucket {bucket_name}")
-                        
-                    self.deletion_log['deletions']['successful'].append({
+                    remove_bucket(bucket_name)
+                    self._log_result('successful', {
                         'type': 's3_bucket',
                         'id': bucket_name
-                    })
-                    self.deletion_log['summary']['total_deleted'] += 1
+                    }, 'total_deleted')
                     
             except Exception as e:
-                print(f"    ERROR deleting S3 bucket {bucket_name}: {e}")
-                self.deletion_log['deletions']['failed'].append({
+                log.info(f"    ERROR deleting S3 bucket {bucket_name}: {e}")
+                self._log_result('failed', {
                     'type': 's3_bucket',
                     'id': bucket_name,
                     'error': str(e)
-                })
-                self.deletion_log['summary']['total_failed'] += 1
+                }, 'total_failed')
+        
+        self._for_each(process_bucket, buckets)
     
     def delete_cloudformation_stacks(self, region: str):
         """Delete CloudFormation stacks not tagged for preservation"""
-        if 'cloudformation_stacks' not in self.inventory['regions'].get(region, {}).get('resources', {}):
-            return
-            
-        print(f"    Processing CloudFormation stacks in {region}...")
-        cfn = self.session.client('cloudformation', region_name=region)
+        log.info(f"    Processing CloudFormation stacks in {region}...")
+        cfn = self._client('cloudformation', region)
         
-        stacks = self.inventory['regions'][region]['resources']['cloudformation_stacks'].get('resources', [])
+        stacks = self._iter_resources(region, 'cloudformation_stacks')
         
-        # Sort stacks to delete non-Control Tower stacks first
+        # Delete non-Control Tower stacks first
         def stack_priority(stack):
             name = stack['StackName'].lower()
             if 'controltower' in name or 'landing-zone' in name:
@@ -187,292 +372,457 @@ class AccountSweeperAgent:
             else:
                 return 0  # Process first
         
-        stacks.sort(key=stack_priority)
-        
+        tiers = {}
         for stack in stacks:
+            tiers.setdefault(stack_priority(stack), []).append(stack)
+        
+        # Mode resolved once per region, not per stack
+        if self.dry_run:
+            def fire_delete(stack):
+                stack_name = stack['StackName']
+                log.info(f"      DRY RUN - Would delete: Stack {stack_name}")
+                self._log_result('successful', {
+                    'type': 'cloudformation_stack',
+                    'id': stack_name,
+                    'region': region
+                }, 'total_deleted')
+                return None
+        else:
+            def fire_delete(stack):
+                stack_name = stack['StackName']
+                # Check if stack has termination protection (list_stacks
+                # summaries never include the flag, so inventories won't
+                # have it and this describe is the per-stack fallback)
+                protection = stack.get('EnableTerminationProtection')
+                if protection is None:
+                    stack_details = cfn.describe_stacks(StackName=stack_name)['Stacks'][0]
+                    protection = stack_details.get('EnableTerminationProtection', False)
+                if protection:
+                    cfn.update_termination_protection(
+                        StackName=stack_name,
+                        EnableTerminationProtection=False
+                    )
+                
+                cfn.delete_stack(StackName=stack_name)
+                log.info(f"      DELETING: Stack {stack_name}")
+                return stack_name
+        
+        def start_delete(stack):
+            """Kick off one stack's deletion; returns its name if started"""
             stack_name = stack['StackName']
             
             try:
-                tags = self.get_resource_tags(cfn, resource_id=stack_name, resource_type='cloudformation')
-                
-                if self.is_resource_preserved(stack_name, tags):
-                    print(f"      PRESERVED: Stack {stack_name}")
-                    self.deletion_log['deletions']['skipped_preserved'].append({
+                stack_arn = f"arn:aws:cloudformation:{region}:{self.account_id}:stack/{stack_name}"
+                if self._is_preserved(region, stack_arn, lambda: self.get_resource_tags(
+                        cfn, resource_id=stack_name, resource_type='cloudformation')):
+                    log.info(f"      PRESERVED: Stack {stack_name}")
+                    self._log_result('skipped_preserved', {
                         'type': 'cloudformation_stack',
                         'id': stack_name,
                         'region': region,
                         'reason': 'Tagged for preservation'
-                    })
-                    self.deletion_log['summary']['total_preserved'] += 1
-                else:
-                    if self.dry_run:
-                        print(f"      DRY RUN - Would delete: Stack {stack_name}")
-                    else:
-                        # Check if stack has termination protection
-                        stack_details = cfn.describe_stacks(StackName=stack_name)['Stacks'][0]
-                        if stack_details.get('EnableTerminationProtection', False):
-                            cfn.update_termination_protection(
-                                StackName=stack_name,
-                                EnableTerminationProtection=False
-                            )
-                        
-                        cfn.delete_stack(StackName=stack_name)
-                        print(f"      DELETING: Stack {stack_name}")
-                        
-                        # Wait for deletion to complete (with timeout)
-                        waiter = cfn.get_waiter('stack_delete_complete')
-                        try:
-                            waiter.wait(
-                                StackName=stack_name,
-                                WaiterConfig={'Delay': 30, 'MaxAttempts': 60}
-                            )
-                            print(f"      DELETED: Stack {stack_name}")
-                        except:
-                            print(f"      WARNING: Stack {stack_name} deletion still in progress")
-                            
-                    self.deletion_log['deletions']['successful'].append({
-                        'type': 'cloudformation_stack',
-                        'id': stack_name,
-                        'region': region
-                    })
-                    self.deletion_log['summary']['total_deleted'] += 1
-                    
+                    }, 'total_preserved')
+                    return None
+                
+                return fire_delete(stack)
+                
             except Exception as e:
-                print(f"      ERROR deleting stack {stack_name}: {e}")
-                self.deletion_log['deletions']['failed'].append({
+                log.info(f"      ERROR deleting stack {stack_name}: {e}")
+                self._log_result('failed', {
                     'type': 'cloudformation_stack',
                     'id': stack_name,
                     'region': region,
                     'error': str(e)
-                })
-                self.deletion_log['summary']['total_failed'] += 1
+                }, 'total_failed')
+                return None
+        
+        # Ordered so an in-progress record outranks stale history: deleted
+        # stacks keep DELETE_COMPLETE entries in list_stacks for 90 days
+        status_rank = {'DELETE_COMPLETE': 0, 'DELETE_FAILED': 1, 'DELETE_IN_PROGRESS': 2}
+        
+        def await_tier(stack_names, timeout=1800):
+            """Reconcile a tier's deletions with one list_stacks poll per tick.
+
+            Per-stack waiters each describe their stack every 30s, which at
+            tens of stacks in flight is the main throttling trigger; one
+            paginated list_stacks snapshot covers the whole pending set.
+            """
+            pending = set(stack_names)
+            deadline = time.time() + timeout
+            while pending and time.time() < deadline:
+                time.sleep(30)
+                status_by_name = {}
+                try:
+                    paginator = cfn.get_paginator('list_stacks')
+                    for page in paginator.paginate(StackStatusFilter=[
+                            'DELETE_IN_PROGRESS', 'DELETE_FAILED', 'DELETE_COMPLETE']):
+                        for summary in page['StackSummaries']:
+                            name = summary['StackName']
+                            status = summary['StackStatus']
+                            current = status_by_name.get(name)
+                            if current is None or status_rank[status] > status_rank[current]:
+                                status_by_name[name] = status
+                except Exception as e:
+                    log.info(f"      WARNING: stack status poll failed in {region}: {e}")
+                    continue
+                
+                for stack_name in list(pending):
+                    status = status_by_name.get(stack_name)
+                    if status == 'DELETE_FAILED':
+                        log.info(f"      ERROR: Stack {stack_name} deletion failed")
+                        pending.discard(stack_name)
+                        self._log_result('failed', {
+                            'type': 'cloudformation_stack',
+                            'id': stack_name,
+                            'region': region,
+                            'error': 'DELETE_FAILED'
+                        }, 'total_failed')
+                    elif status != 'DELETE_IN_PROGRESS':
+                        # DELETE_COMPLETE, or gone from history entirely
+                        log.info(f"      DELETED: Stack {stack_name}")
+                        pending.discard(stack_name)
+                        self._log_result('successful', {
+                            'type': 'cloudformation_stack',
+                            'id': stack_name,
+                            'region': region
+                        }, 'total_deleted')
+            
+            for stack_name in pending:
+                log.info(f"      WARNING: Stack {stack_name} deletion still in progress")
+                self._log_result('successful', {
+                    'type': 'cloudformation_stack',
+                    'id': stack_name,
+                    'region': region
+                }, 'total_deleted')
+        
+        # Fire every delete in a tier, then reconcile them together: region
+        # time becomes max(delete times) per tier rather than their sum.
+        # The tier barrier keeps CDK and Control Tower stacks from going
+        # down while stacks that depend on them are still deleting.
+        for tier in sorted(tiers):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(10, len(tiers[tier]))) as executor:
+                deleting = [name for name in executor.map(start_delete, tiers[tier]) if name]
+            await_tier(deleting)
     
     def delete_lambda_functions(self, region: str):
         """Delete Lambda functions not tagged for preservation"""
-        if 'lambda_functions' not in self.inventory['regions'].get(region, {}).get('resources', {}):
-            return
-            
-        print(f"    Processing Lambda functions in {region}...")
-        lambda_client = self.session.client('lambda', region_name=region)
+        log.info(f"    Processing Lambda functions in {region}...")
+        lambda_client = self._client('lambda', region)
+        
+        functions = self._iter_resources(region, 'lambda_functions')
         
-        functions = self.inventory['regions'][region]['resources']['lambda_functions'].get('resources', [])
-        for function in functions:
+        if self.dry_run:
+            def remove_function(function_name):
+                log.info(f"      DRY RUN - Would delete: Lambda function {function_name}")
+        else:
+            def remove_function(function_name):
+                lambda_client.delete_function(FunctionName=function_name)
+                log.info(f"      DELETED: Lambda function {function_name}")
+        
+        def process_function(function):
             function_name = function['FunctionName']
             
             try:
-                # Get function ARN for tagging
-                func_details = lambda_client.get_function(FunctionName=function_name)
-                function_arn = func_details['Configuration']['FunctionArn']
-                
-                tags = self.get_resource_tags(lambda_client, resource_arn=function_arn, resource_type='lambda')
+                function_arn = f"arn:aws:lambda:{region}:{self.account_id}:function:{function_name}"
                 
-                if self.is_resource_preserved(function_name, tags):
-                    print(f"      PRESERVED: Lambda function {function_name}")
-                    self.deletion_log['deletions']['skipped_preserved'].append({
+                if self._is_preserved(region, function_arn, lambda: self.get_resource_tags(
+                        lambda_client, resource_arn=function_arn, resource_type='lambda')):
+                    log.info(f"      PRESERVED: Lambda function {function_name}")
+                    self._log_result('skipped_preserved', {
                         'type': 'lambda_function',
                         'id': function_name,
                         'region': region,
                         'reason': 'Tagged for preservation'
-                    })
-                    self.deletion_log['summary']['total_preserved'] += 1
+                    }, 'total_preserved')
                 else:
-                    if self.dry_run:
-                        print(f"      DRY RUN - Would delete: Lambda function {function_name}")
-                    else:
-                        lambda_client.delete_function(FunctionName=function_name)
-                        print(f"      DELETED: Lambda function {function_name}")
-                        
-                    self.deletion_log['deletions']['successful'].append({
+                    remove_function(function_name)
+                    self._log_result('successful', {
                         'type': 'lambda_function',
                         'id': function_name,
                         'region': region
-                    })
-                    self.deletion_log['summary']['total_deleted'] += 1
+                    }, 'total_deleted')
                     
             except Exception as e:
-                print(f"      ERROR deleting Lambda function {function_name}: {e}")
-                self.deletion_log['deletions']['failed'].append({
+                log.info(f"      ERROR deleting Lambda function {function_name}: {e}")
+                self._log_result('failed', {
                     'type': 'lambda_function',
                     'id': function_name,
                     'region': region,
                     'error': str(e)
-                })
-                self.deletion_log['summary']['total_failed'] += 1
+                }, 'total_failed')
+        
+        self._for_each(process_function, functions)
     
     def delete_rds_resources(self, region: str):
         """Delete RDS resources not tagged for preservation"""
-        regional_resources = self.inventory['regions'].get(region, {}).get('resources', {})
+        log.info(f"    Processing RDS resources in {region}...")
+        rds = self._client('rds', region)
         
-        if not any(key.startswith('rds_') for key in regional_resources):
-            return
-            
-        print(f"    Processing RDS resources in {region}...")
-        rds = self.session.client('rds', region_name=region)
+        if self.dry_run:
+            def remove_db(db, db_id):
+                log.info(f"      DRY RUN - Would delete: RDS instance {db_id}")
+        else:
+            def remove_db(db, db_id):
+                # Disable deletion protection if enabled; newer
+                # inventories carry the flag, so the describe is only a
+                # fallback for older files
+                protection = db.get('DeletionProtection')
+                if protection is None:
+                    db_details = rds.describe_db_instances(DBInstanceIdentifier=db_id)['DBInstances'][0]
+                    protection = db_details.get('DeletionProtection', False)
+                if protection:
+                    rds.modify_db_instance(
+                        DBInstanceIdentifier=db_id,
+                        DeletionProtection=False,
+                        ApplyImmediately=True
+                    )
+                
+                # No fixed sleep after the modify: with ApplyImmediately
+                # the delete is safe once the modify returns, and if the
+                # instance is briefly still transitioning the error path
+                # retries instead of every instance paying 10s up front
+                for attempt in range(6):
+                    try:
+                        rds.delete_db_instance(
+                            DBInstanceIdentifier=db_id,
+                            SkipFinalSnapshot=True,
+                            DeleteAutomatedBackups=True
+                        )
+                        break
+                    except rds.exceptions.InvalidDBInstanceStateFault:
+                        if attempt == 5:
+                            raise
+                        time.sleep(5)
+                log.info(f"      DELETED: RDS instance {db_id}")
         
         # Delete DB instances
-        if 'rds_instances' in regional_resources:
-            for db in regional_resources['rds_instances'].get('resources', []):
-                db_id = db['DBInstanceIdentifier']
+        def process_db(db):
+            db_id = db['DBInstanceIdentifier']
+            
+            try:
+                db_arn = db.get('DBInstanceArn') or f"arn:aws:rds:{region}:{self.account_id}:db:{db_id}"
                 
-                try:
-                    db_details = rds.describe_db_instances(DBInstanceIdentifier=db_id)['DBInstances'][0]
-                    db_arn = db_details['DBInstanceArn']
-                    
-                    tags = self.get_resource_tags(rds, resource_arn=db_arn, resource_type='rds')
-                    
-                    if self.is_resource_preserved(db_id, tags):
-                        print(f"      PRESERVED: RDS instance {db_id}")
-                        self.deletion_log['deletions']['skipped_preserved'].append({
-                            'type': 'rds_instance',
-                            'id': db_id,
-                            'region': region,
-                            'reason': 'Tagged for preservation'
-                        })
-                        self.deletion_log['summary']['total_preserved'] += 1
-                    else:
-                        if self.dry_run:
-                            print(f"      DRY RUN - Would delete: RDS instance {db_id}")
-                        else:
-                            # Disable deletion protection if enabled
-                            if db_details.get('DeletionProtection', False):
-                                rds.modify_db_instance(
-                                    DBInstanceIdentifier=db_id,
-                                    DeletionProtection=False,
-                                    ApplyImmediately=True
-                                )
-                                time.sleep(10)  # Wait for modification
-                            
-                            rds.delete_db_instance(
-                                DBInstanceIdentifier=db_id,
-                                SkipFinalSnapshot=True,
-                                DeleteAutomatedBackups=True
-                            )
-                            print(f"      DELETED: RDS instance {db_id}")
-                            
-                        self.deletion_log['deletions']['successful'].append({
-                            'type': 'rds_instance',
-                            'id': db_id,
-                            'region': region
-                        })
-                        self.deletion_log['summary']['total_deleted'] += 1
-                        
-                except Exception as e:
-                    print(f"      ERROR deleting RDS instance {db_id}: {e}")
-                    self.deletion_log['deletions']['failed'].append({
+                if self._is_preserved(region, db_arn, lambda: self.get_resource_tags(
+                        rds, resource_arn=db_arn, resource_type='rds')):
+                    log.info(f"      PRESERVED: RDS instance {db_id}")
+                    self._log_result('skipped_preserved', {
                         'type': 'rds_instance',
                         'id': db_id,
                         'region': region,
-                        'error': str(e)
-                    })
-                    self.deletion_log['summary']['total_failed'] += 1
+                        'reason': 'Tagged for preservation'
+                    }, 'total_preserved')
+                else:
+                    remove_db(db, db_id)
+                    self._log_result('successful', {
+                        'type': 'rds_instance',
+                        'id': db_id,
+                        'region': region
+                    }, 'total_deleted')
+                    
+            except Exception as e:
+                log.info(f"      ERROR deleting RDS instance {db_id}: {e}")
+                self._log_result('failed', {
+                    'type': 'rds_instance',
+                    'id': db_id,
+                    'region': region,
+                    'error': str(e)
+                }, 'total_failed')
+        
+        self._for_each(process_db, self._iter_resources(region, 'rds_instances'))
     
     def delete_ec2_resources(self, region: str):
         """Delete EC2 resources not tagged for preservation"""
-        regional_resources = self.inventory['regions'].get(region, {}).get('resources', {})
+        log.info(f"    Processing EC2 resources in {region}...")
+        ec2 = self._client('ec2', region)
         
-        if not any(key in ['ec2_instances', 'vpcs', 'security_groups'] for key in regional_resources):
-            return
-            
-        print(f"    Processing EC2 resources in {region}...")
-        ec2 = self.session.client('ec2', region_name=region)
+        def preserved_instance_ids(instance_ids):
+            """Instance ids tagged for preservation, resolved in bulk.
+
+            The regional tagging-API set answers for free when it loaded;
+            otherwise one tag-filtered describe_instances replaces the
+            old describe_tags round-trip per instance. If even that
+            fails, every id counts as preserved — unknown means kept.
+            """
+            preserved = self._preserved_arns_for_region(region)
+            if preserved is not None:
+                arn_prefix = f"arn:aws:ec2:{region}:{self.account_id}:instance/"
+                return {iid for iid in instance_ids if arn_prefix + iid in preserved}
+            try:
+                found = set()
+                paginator = ec2.get_paginator('describe_instances')
+                for page in paginator.paginate(Filters=[
+                        {'Name': f'tag:{PRESERVE_TAG_KEY}',
+                         'Values': [PRESERVE_TAG_VALUE]}]):
+                    for reservation in page['Reservations']:
+                        for instance in reservation['Instances']:
+                            found.add(instance['InstanceId'])
+                return found & instance_ids
+            except Exception as e:
+                log.info(f"      Warning: preservation lookup failed in {region}, "
+                      f"keeping all instances: {e}")
+                return set(instance_ids)
         
         # Delete EC2 instances first
-        if 'ec2_instances' in regional_resources:
-            reservations = regional_resources['ec2_instances'].get('resources', [])
-            for reservation in reservations:
-                for instance in reservation.get('Instances', []):
-                    instance_id = instance['InstanceId']
-                    
+        def disarm_instance(instance_id):
+            """Clear termination protection; returns the id if it's ready"""
+            try:
+                # No batch API exists for instance attributes, so this
+                # stays one round-trip per instance, run across the pool
+                attrs = ec2.describe_instance_attribute(
+                    InstanceId=instance_id,
+                    Attribute='disableApiTermination'
+                )
+                if attrs.get('DisableApiTermination', {}).get('Value', False):
+                    ec2.modify_instance_attribute(
+                        InstanceId=instance_id,
+                        DisableApiTermination={'Value': False}
+                    )
+                return instance_id
+            except Exception as e:
+                log.info(f"      ERROR terminating EC2 instance {instance_id}: {e}")
+                self._log_result('failed', {
+                    'type': 'ec2_instance',
+                    'id': instance_id,
+                    'region': region,
+                    'error': str(e)
+                }, 'total_failed')
+                return None
+        
+        def _record_terminated(instance_id):
+            log.info(f"      TERMINATED: EC2 instance {instance_id}")
+            self._log_result('successful', {
+                'type': 'ec2_instance',
+                'id': instance_id,
+                'region': region
+            }, 'total_deleted')
+        
+        instance_ids = {
+            instance['InstanceId']
+            for reservation in self._iter_resources(region, 'ec2_instances')
+            for instance in reservation.get('Instances', [])
+        }
+        if not instance_ids:
+            return
+            
+        preserved_ids = preserved_instance_ids(instance_ids)
+        for instance_id in sorted(preserved_ids):
+            log.info(f"      PRESERVED: EC2 instance {instance_id}")
+            self._log_result('skipped_preserved', {
+                'type': 'ec2_instance',
+                'id': instance_id,
+                'region': region,
+                'reason': 'Tagged for preservation'
+            }, 'total_preserved')
+            
+        to_terminate = sorted(instance_ids - preserved_ids)
+        if not to_terminate:
+            return
+            
+        if self.dry_run:
+            for instance_id in to_terminate:
+                log.info(f"      DRY RUN - Would terminate: EC2 instance {instance_id}")
+                self._log_result('successful', {
+                    'type': 'ec2_instance',
+                    'id': instance_id,
+                    'region': region
+                }, 'total_deleted')
+            return
+            
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(to_terminate))) as executor:
+            armed = [iid for iid in executor.map(disarm_instance, to_terminate) if iid]
+            
+        # terminate_instances takes up to 1000 ids per call; batching
+        # collapses a round-trip per instance into one per thousand
+        for start in range(0, len(armed), 1000):
+            batch = armed[start:start + 1000]
+            try:
+                ec2.terminate_instances(InstanceIds=batch)
+            except Exception:
+                # One bad id (say, already terminated) fails the whole
+                # call; isolate it by retrying one instance at a time
+                for instance_id in batch:
                     try:
-                        tags = self.get_resource_tags(ec2, resource_id=instance_id, resource_type='ec2')
-                        
-                        if self.is_resource_preserved(instance_id, tags):
-                            print(f"      PRESERVED: EC2 instance {instance_id}")
-                            self.deletion_log['deletions']['skipped_preserved'].append({
-                                'type': 'ec2_instance',
-                                'id': instance_id,
-                                'region': region,
-                                'reason': 'Tagged for preservation'
-                            })
-                            self.deletion_log['summary']['total_preserved'] += 1
-                        else:
-                            if self.dry_run:
-                                print(f"      DRY RUN - Would terminate: EC2 instance {instance_id}")
-                            else:
-                                # Check if instance has termination protection
-                                attrs = ec2.describe_instance_attribute(
-                                    InstanceId=instance_id,
-                                    Attribute='disableApiTermination'
-                                )
-                                if attrs.get('DisableApiTermination', {}).get('Value', False):
-                                    ec2.modify_instance_attribute(
-                                        InstanceId=instance_id,
-                                        DisableApiTermination={'Value': False}
-                                    )
-                                
-                                ec2.terminate_instances(InstanceIds=[instance_id])
-                                print(f"      TERMINATED: EC2 instance {instance_id}")
-                                
-                            self.deletion_log['deletions']['successful'].append({
-                                'type': 'ec2_instance',
-                                'id': instance_id,
-                                'region': region
-                            })
-                            self.deletion_log['summary']['total_deleted'] += 1
-                            
+                        ec2.terminate_instances(InstanceIds=[instance_id])
                     except Exception as e:
-                        print(f"      ERROR terminating EC2 instance {instance_id}: {e}")
-                        self.deletion_log['deletions']['failed'].append({
+                        log.info(f"      ERROR terminating EC2 instance {instance_id}: {e}")
+                        self._log_result('failed', {
                             'type': 'ec2_instance',
                             'id': instance_id,
                             'region': region,
                             'error': str(e)
-                        })
-                        self.deletion_log['summary']['total_failed'] += 1
+                        }, 'total_failed')
+                        continue
+                    _record_terminated(instance_id)
+                continue
+            for instance_id in batch:
+                _record_terminated(instance_id)
     
     def sweep_account(self):
         """Main sweeping execution"""
-        print(f"\nSweeping account {self.account_id} ({self.profile_name})")
+        log.info(f"\nSweeping account {self.account_id} ({self.profile_name})")
         if self.dry_run:
-            print("*** DRY RUN MODE - No resources will be deleted ***")
+            log.info("*** DRY RUN MODE - No resources will be deleted ***")
         else:
-            print("*** LIVE MODE - Resources WILL be deleted ***")
+            log.info("*** LIVE MODE - Resources WILL be deleted ***")
             
         # Skip restricted accounts in live mode
         if not self.dry_run and self.profile_name in RESTRICTED_ACCOUNTS:
-            print(f"  SKIPPING {self.profile_name} - Service Control Policies prevent deletions")
+            log.info(f"  SKIPPING {self.profile_name} - Service Control Policies prevent deletions")
             self.deletion_log['summary']['skip_reason'] = 'Service Control Policies'
             return self.deletion_log
         
-        # Delete resources in order of dependency
+        # Resolve the work list in a single pass over the inventory index:
+        # (region, service) pairs with nothing to do never reach the
+        # pools, and the delete methods no longer re-scan the service
+        # keys on every call
+        compute_plan = []
+        cfn_regions = []
+        for region, services in self._services.items():
+            if 'lambda_functions' in services:
+                compute_plan.append((self.delete_lambda_functions, region))
+            if 'ec2_instances' in services:
+                compute_plan.append((self.delete_ec2_resources, region))
+            if 'rds_instances' in services:
+                compute_plan.append((self.delete_rds_resources, region))
+            if 'cloudformation_stacks' in services:
+                cfn_regions.append(region)
+        
+        # Delete resources in order of dependency; within each phase the
+        # (region, service) tasks are independent, so fan them out and only
+        # barrier between phases
+        
         # 1. First delete compute resources
-        for region in self.inventory.get('regions', {}):
-            self.delete_lambda_functions(region)
-            self.delete_ec2_resources(region)
-            self.delete_rds_resources(region)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            tasks = [executor.submit(method, region)
+                     for method, region in compute_plan]
+            for task in concurrent.futures.as_completed(tasks):
+                task.result()
         
         # 2. Delete storage resources
         self.delete_s3_buckets()
         
         # 3. Delete infrastructure resources
-        for region in self.inventory.get('regions', {}):
-            self.delete_cloudformation_stacks(region)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            tasks = [executor.submit(self.delete_cloudformation_stacks, region)
+                     for region in cfn_regions]
+            for task in concurrent.futures.as_completed(tasks):
+                task.result()
         
         self.deletion_log['end_time'] = datetime.utcnow().isoformat()
         
-        # Save results
-        output_dir = "/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/sweeper-account/results"
-        os.makedirs(output_dir, exist_ok=True)
-        
-        filename = f"{output_dir}/sweep_{self.account_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
+        # Per-resource events are already on disk; what remains to save
+        # is a small summary, where indent=2 is fine
+        self._events_fp.close()
+        with open(self.summary_path, 'w') as f:
             json.dump(self.deletion_log, f, indent=2)
         
-        print(f"\nSweep complete for account {self.account_id}")
-        print(f"  Resources deleted: {self.deletion_log['summary']['total_deleted']}")
-        print(f"  Resources preserved: {self.deletion_log['summary']['total_preserved']}")
-        print(f"  Failures: {self.deletion_log['summary']['total_failed']}")
-        print(f"  Results saved to: {filename}")
+        log.info(f"\nSweep complete for account {self.account_id}")
+        log.info(f"  Resources deleted: {self.deletion_log['summary']['total_deleted']}")
+        log.info(f"  Resources preserved: {self.deletion_log['summary']['total_preserved']}")
+        log.info(f"  Failures: {self.deletion_log['summary']['total_failed']}")
+        log.info(f"  Events saved to: {self.events_path}")
+        log.info(f"  Summary saved to: {self.summary_path}")
         
         return self.deletion_log
 
@@ -487,17 +837,17 @@ def main():
     
     dry_run = not args.live
     
-    print("AWS Account Sweeper Agent Starting...")
-    print(f"Mode: {'LIVE - RESOURCES WILL BE DELETED' if not dry_run else 'DRY RUN - No deletions'}")
-    print(f"Started at: {datetime.utcnow().isoformat()}")
+    log.info("AWS Account Sweeper Agent Starting...")
+    log.info(f"Mode: {'LIVE - RESOURCES WILL BE DELETED' if not dry_run else 'DRY RUN - No deletions'}")
+    log.info(f"Started at: {datetime.utcnow().isoformat()}")
     
     if not dry_run and not args.force:
         response = input("\n⚠️  WARNING: Live mode will DELETE resources! Type 'DELETE' to confirm: ")
         if response != 'DELETE':
-            print("Confirmation not received. Exiting.")
+            log.info("Confirmation not received. Exiting.")
             sys.exit(1)
     elif not dry_run and args.force:
-        print("\n⚠️  WARNING: Live mode with --force flag. Resources WILL BE DELETED!")
+        log.info("\n⚠️  WARNING: Live mode with --force flag. Resources WILL BE DELETED!")
     
     # Load consolidated inventory
     inventory_dir = "/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/inventory/results"
@@ -509,7 +859,7 @@ def main():
             break
     
     if not consolidated_file:
-        print("Error: No consolidated inventory found!")
+        log.info("Error: No consolidated inventory found!")
         sys.exit(1)
     
     with open(consolidated_file, 'r') as f:
@@ -522,17 +872,17 @@ def main():
     
     for profile in profiles_to_process:
         if profile not in consolidated['accounts']:
-            print(f"Error: Profile {profile} not found in inventory")
+            log.info(f"Error: Profile {profile} not found in inventory")
             continue
             
         try:
-            print(f"\nProcessing {profile}...")
+            log.info(f"\nProcessing {profile}...")
             account_data = consolidated['accounts'][profile]
             agent = AccountSweeperAgent(profile, account_data['inventory_file'], dry_run)
             results = agent.sweep_account()
             all_results[profile] = results
         except Exception as e:
-            print(f"Error processing {profile}: {e}")
+            log.info(f"Error processing {profile}: {e}")
             all_results[profile] = {'error': str(e)}
     
     # Generate summary report
@@ -564,12 +914,12 @@ def main():
     with open(summary_file, 'w') as f:
         json.dump(summary, f, indent=2)
     
-    print(f"\n\nAccount Sweeper Complete!")
-    print(f"Summary saved to: {summary_file}")
-    print(f"Mode: {summary['mode']}")
-    print(f"Total resources deleted: {summary['total_deleted']}")
-    print(f"Total resources preserved: {summary['total_preserved']}")
-    print(f"Total failures: {summary['total_failed']}")
+    log.info(f"\n\nAccount Sweeper Complete!")
+    log.info(f"Summary saved to: {summary_file}")
+    log.info(f"Mode: {summary['mode']}")
+    log.info(f"Total resources deleted: {summary['total_deleted']}")
+    log.info(f"Total resources preserved: {summary['total_preserved']}")
+    log.info(f"Total failures: {summary['total_failed']}")
 
 
 if __name__ == "__main__":
@@ -5,16 +5,54 @@ AWS Tagging Agent - Tags resources for preservation during decommissioning
 
 import json
 import boto3
+import atexit
+import collections
 import concurrent.futures
+import functools
+import glob
+import logging
+import logging.handlers
+import queue
+import re
+import threading
 from datetime import datetime
 import os
 import sys
 from typing import Dict, List, Any, Set
+from botocore.config import Config
+
+try:
+    import orjson  # C parser, several times faster on multi-MB inventories
+except ImportError:
+    orjson = None
 
 PRESERVE_TAG_KEY = "decom:preserve"
 PRESERVE_TAG_VALUE = "true"
 PRESERVE_REASON_KEY = "decom:reason"
 
+# All output funnels through one QueueListener thread: with accounts,
+# regions, and IAM resources tagging in parallel, per-line stdout writes
+# take the stdio lock and become a serialization point
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.INFO, format='%(message)s',
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# Keep adaptive-retry chatter out of the tagging output
+logging.getLogger('botocore').setLevel(logging.WARNING)
+logging.getLogger('urllib3').setLevel(logging.WARNING)
+log = logging.getLogger(__name__)
+
+# Bulk tagging across parallel accounts/regions/resources trips API
+# throttling quickly; adaptive mode rate-limits client-side and keeps
+# retrying throttles instead of recording them as tagging failures.
+# max_pool_connections must cover the stacked pools (16 accounts x 8
+# regions locally) so threads don't queue for an HTTPS connection slot
+RETRY_CFG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'},
+                   max_pool_connections=50)
+
 # Resources that should be preserved
 PRESERVE_PATTERNS = {
     'ControlTower': 'AWS Control Tower landing zone resource',
@@ -31,200 +69,381 @@ PRESERVE_PATTERNS = {
     'savings-plan': 'Savings Plan resource',
 }
 
+# The patterns are checked against every resource name; one precompiled
+# alternation does a single C-level scan instead of twelve Python-level
+# lower()-and-substring passes per name. Group index maps back to the
+# matching pattern's reason.
+_PRESERVE_RE = re.compile('|'.join(f'({re.escape(p.lower())})' for p in PRESERVE_PATTERNS))
+_PRESERVE_REASONS = list(PRESERVE_PATTERNS.values())
+
+# IAM types preserve unconditionally, so their check goes first — a
+# hashed lookup — and skips the name scan entirely
+_IAM_TYPES = frozenset({'AWS::IAM::Role', 'AWS::IAM::User', 'AWS::IAM::Policy'})
+
+def _write_json(path, obj):
+    """Serialize a results dict to disk in one buffer.
+
+    orjson writes into a single preallocated bytes buffer instead of
+    stdlib's token-at-a-time emit; the stdlib fallback drops indentation,
+    which alone roughly halves the bytes and the encoding work.
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, separators=(',', ':'))
+
+
 class AWSTaggingAgent:
     def __init__(self, profile_name: str, inventory_file: str):
         self.profile_name = profile_name
         self.session = boto3.Session(profile_name=profile_name)
+        # Clients memoized per (service, region): every Session.client()
+        # call re-parses service models and endpoint config
+        self._clients = {}
+        self._clients_lock = threading.Lock()
         self.account_id = self.get_account_id()
         self.inventory = self.load_inventory(inventory_file)
+        # Name -> reason for every name-classified resource, built in one
+        # pass; None marks names that didn't match
+        self._preserve_by_name = self._classify_inventory()
+        # Regions tag in parallel; result mutations share this lock
+        self._lock = threading.Lock()
+        # Per-region stack descriptions, one paginated fetch each
+        self._cfn_stack_cache = {}
         self.tagging_results = {
             'account_id': self.account_id,
             'profile_name': profile_name,
             'start_time': datetime.utcnow().isoformat(),
             'resources_tagged': 0,
             'resources_failed': 0,
-            'by_service': {},
-            'errors': []
+            'by_service': {}
         }
+        # A throttling storm can fail thousands of resources with
+        # near-identical messages; count by kind and keep a bounded
+        # sample instead of retaining every string until the end
+        self._errors_by_kind = collections.Counter()
+        self._error_sample = collections.deque(maxlen=100)
+        
+    def _client(self, service: str, region: str = None):
+        """Cached boto3 client for a (service, region) pair.
+
+        The lock serializes construction — Session.client() is not
+        thread-safe — but the common case is a plain dict hit.
+        """
+        key = (service, region)
+        client = self._clients.get(key)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = self.session.client(
+                        service, region_name=region, config=RETRY_CFG)
+        return client
+    
+    def _classify_inventory(self):
+        """Classify every name-checked resource in the inventory once.
+
+        Stacks, buckets, VPCs, and security groups are all judged purely
+        by name, and the same names recur across services (roles made by
+        a stack, buckets named after it); one pass over the inventory
+        replaces the per-service rescans with dict lookups. IAM keeps
+        the typed classifier, which short-circuits anyway.
+        """
+        by_name = {}
+        
+        def add(name):
+            if name not in by_name:
+                preserve, reason = self.should_preserve_resource(name)
+                by_name[name] = reason if preserve else None
         
+        for region_data in self.inventory.get('regions', {}).values():
+            resources = region_data.get('resources', {})
+            for stack in resources.get('cloudformation_stacks', {}).get('resources', []):
+                add(stack['StackName'])
+            for bucket in resources.get('s3_buckets', {}).get('resources', []):
+                add(bucket['Name'])
+            for vpc in resources.get('vpcs', {}).get('resources', []):
+                add(vpc.get('Tags', [{}])[0].get('Value', ''))
+            for sg in resources.get('security_groups', {}).get('resources', []):
+                add(sg['GroupName'])
+        return by_name
+    
+    def _record(self, tagged=0, failed=0, error=None, kind='Exception'):
+        """Fold one outcome into the shared results (thread-safe)"""
+        with self._lock:
+            self.tagging_results['resources_tagged'] += tagged
+            self.tagging_results['resources_failed'] += failed
+            if error:
+                self._errors_by_kind[kind] += 1
+                self._error_sample.append(error)
+    
     def get_account_id(self) -> str:
         try:
-            sts = self.session.client('sts')
+            sts = self._client('sts')
             return sts.get_caller_identity()['Account']
         except Exception as e:
-            print(f"Error getting account ID: {e}")
+            log.info(f"Error getting account ID: {e}")
             return "unknown"
     
     def load_inventory(self, inventory_file: str) -> Dict:
         """Load the inventory file for this account"""
+        if orjson is not None:
+            with open(inventory_file, 'rb') as f:
+                return orjson.loads(f.read())
         with open(inventory_file, 'r') as f:
             return json.load(f)
     
-    def should_preserve_resource(self, resource_name: str, resource_type: str = None) -> tuple[bool, str]:
-        """Determine if a resource should be preserved based on patterns"""
-        # Check resource name against patterns
-        for pattern, reason in PRESERVE_PATTERNS.items():
-            if pattern.lower() in resource_name.lower():
-                return True, reason
-        
-        # Check specific resource types
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def should_preserve_resource(resource_name: str, resource_type: str = None) -> tuple[bool, str]:
+        """Determine if a resource should be preserved based on patterns.
+
+        Cached: the same names and service-linked prefixes recur across
+        regions and accounts, and the classifier only reads module
+        constants, so repeats become a dict hit.
+        """
+        # Type checks first: IAM, Organizations, and Control Tower types
+        # preserve regardless of name, so the pattern scan would be
+        # wasted work for every one of them
         if resource_type:
-            if resource_type in ['AWS::IAM::Role', 'AWS::IAM::User', 'AWS::IAM::Policy']:
+            if resource_type in _IAM_TYPES:
                 return True, 'IAM resource - preserve all'
             if resource_type.startswith('AWS::Organizations::'):
                 return True, 'Organizations resource'
             if resource_type.startswith('AWS::ControlTower::'):
                 return True, 'Control Tower resource'
-            if resource_type.startswith('AWS::Route53::'):
-                if 'modulairhr.com' in resource_name.lower():
-                    return True, 'Company domain resource'
+        
+        # Check resource name against patterns
+        name_l = resource_name.lower()
+        match = _PRESERVE_RE.search(name_l)
+        if match:
+            return True, _PRESERVE_REASONS[match.lastindex - 1]
+        
+        if resource_type and resource_type.startswith('AWS::Route53::'):
+            if 'modulairhr.com' in name_l:
+                return True, 'Company domain resource'
         
         return False, ''
     
     def tag_iam_resources(self):
         """Tag IAM resources for preservation"""
-        print(f"  Tagging IAM resources...")
-        iam = self.session.client('iam')
+        log.info(f"  Tagging IAM resources...")
+        # One shared client: botocore clients are thread-safe for calls,
+        # and each worker makes exactly one tag_* round-trip
+        iam = self._client('iam')
         
-        # Tag IAM roles
-        if 'iam_roles' in self.inventory.get('global_resources', {}):
-            roles = self.inventory['global_resources']['iam_roles'].get('resources', [])
-            for role in roles:
-                try:
-                    preserve, reason = self.should_preserve_resource(role['RoleName'], 'AWS::IAM::Role')
-                    if preserve:
-                        iam.tag_role(
-                            RoleName=role['RoleName'],
-                            Tags=[
-                                {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
-                                {'Key': PRESERVE_REASON_KEY, 'Value': reason}
-                            ]
-                        )
-                        self.tagging_results['resources_tagged'] += 1
-                        print(f"    Tagged role: {role['RoleName']}")
-                except Exception as e:
-                    self.tagging_results['resources_failed'] += 1
-                    self.tagging_results['errors'].append(f"Failed to tag role {role['RoleName']}: {str(e)}")
+        def _already_preserved(existing_tags):
+            """True when the preserve flag is already set on the resource.
+
+            A list_*_tags read is far cheaper than tag-write churn: on
+            re-runs it turns every redundant tag_* mutation into a skip.
+            """
+            return any(t['Key'] == PRESERVE_TAG_KEY and t['Value'] == PRESERVE_TAG_VALUE
+                       for t in existing_tags)
         
-        # Tag IAM users
-        if 'iam_users' in self.inventory.get('global_resources', {}):
-            users = self.inventory['global_resources']['iam_users'].get('resources', [])
-            for user in users:
-                try:
-                    preserve, reason = self.should_preserve_resource(user['UserName'], 'AWS::IAM::User')
-                    if preserve:
-                        iam.tag_user(
-                            UserName=user['UserName'],
-                            Tags=[
-                                {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
-                                {'Key': PRESERVE_REASON_KEY, 'Value': reason}
-                            ]
-                        )
-                        self.tagging_results['resources_tagged'] += 1
-                        print(f"    Tagged user: {user['UserName']}")
-                except Exception as e:
-                    self.tagging_results['resources_failed'] += 1
-                    self.tagging_results['errors'].append(f"Failed to tag user {user['UserName']}: {str(e)}")
+        def _tag_one_role(role):
+            try:
+                preserve, reason = self.should_preserve_resource(role['RoleName'], 'AWS::IAM::Role')
+                if preserve:
+                    if _already_preserved(iam.list_role_tags(
+                            RoleName=role['RoleName']).get('Tags', [])):
+                        return
+                    iam.tag_role(
+                        RoleName=role['RoleName'],
+                        Tags=[
+                            {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
+                            {'Key': PRESERVE_REASON_KEY, 'Value': reason}
+                        ]
+                    )
+                    self._record(tagged=1)
+                    log.info(f"    Tagged role: {role['RoleName']}")
+            except Exception as e:
+                self._record(failed=1, kind=type(e).__name__,
+                             error=f"Failed to tag role {role['RoleName']}: {str(e)}")
         
-        # Tag IAM policies
-        if 'iam_policies' in self.inventory.get('global_resources', {}):
-            policies = self.inventory['global_resources']['iam_policies'].get('resources', [])
-            for policy in policies:
-                try:
-                    preserve, reason = self.should_preserve_resource(policy['PolicyName'], 'AWS::IAM::Policy')
-                    if preserve:
-                        iam.tag_policy(
-                            PolicyArn=policy['Arn'],
-                            Tags=[
-                                {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
-                                {'Key': PRESERVE_REASON_KEY, 'Value': reason}
-                            ]
-                        )
-                        self.tagging_results['resources_tagged'] += 1
-                        print(f"    Tagged policy: {policy['PolicyName']}")
-                except Exception as e:
-                    self.tagging_results['resources_failed'] += 1
-                    self.tagging_results['errors'].append(f"Failed to tag policy {policy['PolicyName']}: {str(e)}")
+        def _tag_one_user(user):
+            try:
+                preserve, reason = self.should_preserve_resource(user['UserName'], 'AWS::IAM::User')
+                if preserve:
+                    if _already_preserved(iam.list_user_tags(
+                            UserName=user['UserName']).get('Tags', [])):
+                        return
+                    iam.tag_user(
+                        UserName=user['UserName'],
+                        Tags=[
+                            {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
+                            {'Key': PRESERVE_REASON_KEY, 'Value': reason}
+                        ]
+                    )
+                    self._record(tagged=1)
+                    log.info(f"    Tagged user: {user['UserName']}")
+            except Exception as e:
+                self._record(failed=1, kind=type(e).__name__,
+                             error=f"Failed to tag user {user['UserName']}: {str(e)}")
+        
+        def _tag_one_policy(policy):
+            try:
+                preserve, reason = self.should_preserve_resource(policy['PolicyName'], 'AWS::IAM::Policy')
+                if preserve:
+                    if _already_preserved(iam.list_policy_tags(
+                            PolicyArn=policy['Arn']).get('Tags', [])):
+                        return
+                    iam.tag_policy(
+                        PolicyArn=policy['Arn'],
+                        Tags=[
+                            {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
+                            {'Key': PRESERVE_REASON_KEY, 'Value': reason}
+                        ]
+                    )
+                    self._record(tagged=1)
+                    log.info(f"    Tagged policy: {policy['PolicyName']}")
+            except Exception as e:
+                self._record(failed=1, kind=type(e).__name__,
+                             error=f"Failed to tag policy {policy['PolicyName']}: {str(e)}")
+        
+        # Hundreds of one-call workers, all network wait: run them across
+        # one pool instead of three serial loops
+        global_resources = self.inventory.get('global_resources', {})
+        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+            for worker, service in ((_tag_one_role, 'iam_roles'),
+                                    (_tag_one_user, 'iam_users'),
+                                    (_tag_one_policy, 'iam_policies')):
+                if service in global_resources:
+                    executor.map(worker, global_resources[service].get('resources', []))
     
     def tag_cloudformation_stacks(self, region: str):
         """Tag CloudFormation stacks for preservation"""
         if 'cloudformation_stacks' not in self.inventory['regions'].get(region, {}).get('resources', {}):
             return
             
-        print(f"    Tagging CloudFormation stacks in {region}...")
-        cfn = self.session.client('cloudformation', region_name=region)
-        
+        # Name classification is pure and cached, so run it before any
+        # client or API work and bail if the region has nothing to keep
         stacks = self.inventory['regions'][region]['resources']['cloudformation_stacks'].get('resources', [])
+        preservable = []
         for stack in stacks:
+            reason = self._preserve_by_name.get(stack['StackName'])
+            if reason is not None:
+                preservable.append((stack, reason))
+        if not preservable:
+            return
+        
+        log.info(f"    Tagging CloudFormation stacks in {region}...")
+        cfn = self._client('cloudformation', region)
+        
+        # One paginated describe_stacks covers every stack's current tags;
+        # the old per-stack describe was a round-trip per stack. None marks
+        # a failed fetch, in which case workers fall back per stack.
+        if region not in self._cfn_stack_cache:
             try:
-                preserve, reason = self.should_preserve_resource(stack['StackName'])
-                if preserve:
-                    # CloudFormation uses different tagging API
+                stacks_by_name = {}
+                paginator = cfn.get_paginator('describe_stacks')
+                for page in paginator.paginate():
+                    for described in page['Stacks']:
+                        stacks_by_name[described['StackName']] = described
+            except Exception as e:
+                log.info(f"      Warning: bulk stack describe failed in {region}: {e}")
+                stacks_by_name = None
+            self._cfn_stack_cache[region] = stacks_by_name
+        stacks_by_name = self._cfn_stack_cache[region]
+        
+        for stack, reason in preservable:
+            try:
+                # CloudFormation uses different tagging API
+                if stacks_by_name is not None:
+                    described = stacks_by_name.get(stack['StackName'], {})
+                    current_tags = described.get('Tags', [])
+                else:
                     current_tags = cfn.describe_stacks(StackName=stack['StackName'])['Stacks'][0].get('Tags', [])
-                    
-                    # Add our tags
-                    new_tags = current_tags + [
-                        {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
-                        {'Key': PRESERVE_REASON_KEY, 'Value': reason}
-                    ]
-                    
-                    # Update stack with new tags
-                    try:
-                        cfn.update_stack(
-                            StackName=stack['StackName'],
-                            UsePreviousTemplate=True,
-                            Tags=new_tags,
-                            Capabilities=['CAPABILITY_IAM', 'CAPABILITY_NAMED_IAM', 'CAPABILITY_AUTO_EXPAND']
-                        )
-                        self.tagging_results['resources_tagged'] += 1
-                        print(f"      Tagged stack: {stack['StackName']}")
-                    except Exception as e:
-                        if 'No updates are to be performed' in str(e):
-                            # Stack doesn't need updating, just tag it
-                            print(f"      Stack {stack['StackName']} already up to date")
-                        else:
-                            raise
-                            
+                
+                # Already carrying our tags? Skip the update_stack
+                # round-trip entirely: a no-op update still spins a
+                # full stack update cycle before CFN rejects it
+                current_map = {t['Key']: t['Value'] for t in current_tags}
+                if (current_map.get(PRESERVE_TAG_KEY) == PRESERVE_TAG_VALUE
+                        and current_map.get(PRESERVE_REASON_KEY) == reason):
+                    log.info(f"      Stack {stack['StackName']} already tagged")
+                    continue
+                
+                # Merge through the map so re-runs never stack duplicate
+                # decom keys (CFN caps stacks at 50 tags; blowing the cap
+                # fails the whole update)
+                current_map[PRESERVE_TAG_KEY] = PRESERVE_TAG_VALUE
+                current_map[PRESERVE_REASON_KEY] = reason
+                new_tags = [{'Key': k, 'Value': v} for k, v in current_map.items()]
+                
+                # Update stack with new tags
+                try:
+                    cfn.update_stack(
+                        StackName=stack['StackName'],
+                        UsePreviousTemplate=True,
+                        Tags=new_tags,
+                        Capabilities=['CAPABILITY_IAM', 'CAPABILITY_NAMED_IAM', 'CAPABILITY_AUTO_EXPAND']
+                    )
+                    self._record(tagged=1)
+                    log.info(f"      Tagged stack: {stack['StackName']}")
+                except Exception as e:
+                    if 'No updates are to be performed' in str(e):
+                        # Stack doesn't need updating, just tag it
+                        log.info(f"      Stack {stack['StackName']} already up to date")
+                    else:
+                        raise
+                        
             except Exception as e:
-                self.tagging_results['resources_failed'] += 1
-                self.tagging_results['errors'].append(f"Failed to tag stack {stack['StackName']}: {str(e)}")
+                self._record(failed=1, kind=type(e).__name__,
+                             error=f"Failed to tag stack {stack['StackName']}: {str(e)}")
     
     def tag_s3_buckets(self):
         """Tag S3 buckets for preservation"""
         if 's3_buckets' not in self.inventory['regions'].get('us-east-1', {}).get('resources', {}):
             return
             
-        print(f"  Tagging S3 buckets...")
-        s3 = self.session.client('s3')
-        
         buckets = self.inventory['regions']['us-east-1']['resources']['s3_buckets'].get('resources', [])
+        preservable = []
         for bucket in buckets:
+            reason = self._preserve_by_name.get(bucket['Name'])
+            if reason is not None:
+                preservable.append((bucket, reason))
+        if not preservable:
+            return
+        
+        log.info(f"  Tagging S3 buckets...")
+        s3 = self._client('s3')
+        
+        for bucket, reason in preservable:
             try:
-                preserve, reason = self.should_preserve_resource(bucket['Name'])
-                if preserve:
-                    # Get current tags
-                    try:
-                        current_tags = s3.get_bucket_tagging(Bucket=bucket['Name'])['TagSet']
-                    except:
-                        current_tags = []
-                    
-                    # Add our tags
-                    new_tags = current_tags + [
-                        {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
-                        {'Key': PRESERVE_REASON_KEY, 'Value': reason}
-                    ]
-                    
-                    # Apply tags
-                    s3.put_bucket_tagging(
-                        Bucket=bucket['Name'],
-                        Tagging={'TagSet': new_tags}
-                    )
-                    self.tagging_results['resources_tagged'] += 1
-                    print(f"    Tagged bucket: {bucket['Name']}")
-                    
+                # Get current tags
+                try:
+                    current_tags = s3.get_bucket_tagging(Bucket=bucket['Name'])['TagSet']
+                except:
+                    current_tags = []
+                
+                # The read already happened; skip the write when our tags
+                # are in place, mirroring the stack diff check
+                tag_map = {t['Key']: t['Value'] for t in current_tags}
+                if (tag_map.get(PRESERVE_TAG_KEY) == PRESERVE_TAG_VALUE
+                        and tag_map.get(PRESERVE_REASON_KEY) == reason):
+                    log.info(f"    Bucket {bucket['Name']} already tagged")
+                    continue
+                
+                # Merge by key so a re-run replaces our tags instead of
+                # appending duplicates (bucket TagSets reject repeat keys)
+                tag_map[PRESERVE_TAG_KEY] = PRESERVE_TAG_VALUE
+                tag_map[PRESERVE_REASON_KEY] = reason
+                new_tags = [{'Key': k, 'Value': v} for k, v in tag_map.items()]
+                
+                # Apply tags
+                s3.put_bucket_tagging(
+                    Bucket=bucket['Name'],
+                    Tagging={'TagSet': new_tags}
+                )
+                self._record(tagged=1)
+                log.info(f"    Tagged bucket: {bucket['Name']}")
+                
             except Exception as e:
-                self.tagging_results['resources_failed'] += 1
-                self.tagging_results['errors'].append(f"Failed to tag bucket {bucket['Name']}: {str(e)}")
+                self._record(failed=1, kind=type(e).__name__,
+                             error=f"Failed to tag bucket {bucket['Name']}: {str(e)}")
     
     def tag_ec2_resources(self, region: str):
         """Tag EC2 resources for preservation"""
@@ -232,121 +451,154 @@ class AWSTaggingAgent:
         if not any(key.startswith('ec2_') or key in ['vpcs', 'security_groups'] for key in regional_resources):
             return
             
-        print(f"    Tagging EC2 resources in {region}...")
-        ec2 = self.session.client('ec2', region_name=region)
-        
-        # Collect resource IDs to tag
-        resource_ids = []
+        # Classify everything first — the common case is a region with no
+        # preservable resources, which now costs zero client or API work
+        # Collect resource IDs to tag, grouped by reason so the reason tag
+        # stays specific instead of the old blanket 'Infrastructure resource'
+        ids_by_reason = {}
         
         # VPCs
         if 'vpcs' in regional_resources:
             for vpc in regional_resources['vpcs'].get('resources', []):
-                preserve, _ = self.should_preserve_resource(vpc.get('Tags', [{}])[0].get('Value', ''))
-                if preserve:
-                    resource_ids.append(vpc['VpcId'])
+                reason = self._preserve_by_name.get(vpc.get('Tags', [{}])[0].get('Value', ''))
+                if reason is not None:
+                    ids_by_reason.setdefault(reason, []).append(vpc['VpcId'])
         
         # Security Groups
         if 'security_groups' in regional_resources:
             for sg in regional_resources['security_groups'].get('resources', []):
-                preserve, _ = self.should_preserve_resource(sg['GroupName'])
-                if preserve:
-                    resource_ids.append(sg['GroupId'])
+                reason = self._preserve_by_name.get(sg['GroupName'])
+                if reason is not None:
+                    ids_by_reason.setdefault(reason, []).append(sg['GroupId'])
         
-        # Tag all collected resources
-        if resource_ids:
-            try:
-                ec2.create_tags(
-                    Resources=resource_ids,
-                    Tags=[
-                        {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
-                        {'Key': PRESERVE_REASON_KEY, 'Value': 'Infrastructure resource'}
-                    ]
-                )
-                self.tagging_results['resources_tagged'] += len(resource_ids)
-                print(f"      Tagged {len(resource_ids)} EC2 resources")
-            except Exception as e:
-                self.tagging_results['resources_failed'] += len(resource_ids)
-                self.tagging_results['errors'].append(f"Failed to tag EC2 resources in {region}: {str(e)}")
+        if not ids_by_reason:
+            return
+        
+        log.info(f"    Tagging EC2 resources in {region}...")
+        ec2 = self._client('ec2', region)
+        
+        # Tag all collected resources; create_tags caps at 1000 resources
+        # per call, so chunk rather than fail once a region outgrows it
+        for reason, resource_ids in ids_by_reason.items():
+            for start in range(0, len(resource_ids), 1000):
+                batch = resource_ids[start:start + 1000]
+                try:
+                    ec2.create_tags(
+                        Resources=batch,
+                        Tags=[
+                            {'Key': PRESERVE_TAG_KEY, 'Value': PRESERVE_TAG_VALUE},
+                            {'Key': PRESERVE_REASON_KEY, 'Value': reason}
+                        ]
+                    )
+                    self._record(tagged=len(batch))
+                    log.info(f"      Tagged {len(batch)} EC2 resources")
+                except Exception as e:
+                    self._record(failed=len(batch), kind=type(e).__name__,
+                                 error=f"Failed to tag EC2 resources in {region}: {str(e)}")
     
     def tag_resources(self):
         """Main tagging execution"""
-        print(f"\nTagging resources in account {self.account_id} ({self.profile_name})")
+        log.info(f"\nTagging resources in account {self.account_id} ({self.profile_name})")
         
         # Tag global resources
         try:
             self.tag_iam_resources()
         except Exception as e:
-            print(f"  Error tagging IAM resources: {e}")
+            log.info(f"  Error tagging IAM resources: {e}")
         
         try:
             self.tag_s3_buckets()
         except Exception as e:
-            print(f"  Error tagging S3 buckets: {e}")
+            log.info(f"  Error tagging S3 buckets: {e}")
         
-        # Tag regional resources
-        for region in self.inventory.get('regions', {}):
+        # Tag regional resources; regions are independent, so a pool turns
+        # the serial chain of describe/tag round-trips into one region's worth
+        def _tag_region(region):
             try:
                 self.tag_cloudformation_stacks(region)
                 self.tag_ec2_resources(region)
             except Exception as e:
-                print(f"  Error tagging resources in {region}: {e}")
+                log.info(f"  Error tagging resources in {region}: {e}")
         
-        self.tagging_results['end_time'] = datetime.utcnow().isoformat()
+        regions = list(self.inventory.get('regions', {}))
+        if regions:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(regions))) as executor:
+                list(executor.map(_tag_region, regions))
+        
+        # One timestamp marks the end of the run; derive both the field
+        # and the filename from it so they can't disagree
+        end_dt = datetime.utcnow()
+        self.tagging_results['end_time'] = end_dt.isoformat()
+        self.tagging_results['errors'] = {
+            'by_kind': dict(self._errors_by_kind),
+            'sample': list(self._error_sample)
+        }
         
         # Save results
         output_dir = "/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/tagging/results"
         os.makedirs(output_dir, exist_ok=True)
         
-        filename = f"{output_dir}/tagging_{self.account_id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(filename, 'w') as f:
-            json.dump(self.tagging_results, f, indent=2)
+        filename = f"{output_dir}/tagging_{self.account_id}_{end_dt.strftime('%Y%m%d_%H%M%S')}.json"
+        _write_json(filename, self.tagging_results)
         
-        print(f"\nTagging complete for account {self.account_id}")
-        print(f"  Resources tagged: {self.tagging_results['resources_tagged']}")
-        print(f"  Resources failed: {self.tagging_results['resources_failed']}")
-        print(f"  Results saved to: {filename}")
+        log.info(f"\nTagging complete for account {self.account_id}")
+        log.info(f"  Resources tagged: {self.tagging_results['resources_tagged']}")
+        log.info(f"  Resources failed: {self.tagging_results['resources_failed']}")
+        log.info(f"  Results saved to: {filename}")
         
         return self.tagging_results
 
 
 def main():
     """Main execution function"""
-    print("AWS Tagging Agent Starting...")
-    print(f"Started at: {datetime.utcnow().isoformat()}")
+    log.info("AWS Tagging Agent Starting...")
+    log.info(f"Started at: {datetime.utcnow().isoformat()}")
     
     # Load consolidated inventory to get account list
     inventory_dir = "/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/inventory/results"
-    consolidated_file = None
     
-    # Find the latest consolidated inventory
-    for file in os.listdir(inventory_dir):
-        if file.startswith('consolidated_inventory_'):
-            consolidated_file = os.path.join(inventory_dir, file)
-            break
+    # Newest consolidated inventory by mtime: the old listdir scan took
+    # the first match in directory order, which is arbitrary and could
+    # silently re-run tagging against a stale file
+    candidates = glob.glob(os.path.join(inventory_dir, 'consolidated_inventory_*'))
+    consolidated_file = max(candidates, key=os.path.getmtime) if candidates else None
     
     if not consolidated_file:
-        print("Error: No consolidated inventory found!")
+        log.info("Error: No consolidated inventory found!")
         sys.exit(1)
     
-    with open(consolidated_file, 'r') as f:
-        consolidated = json.load(f)
+    if orjson is not None:
+        with open(consolidated_file, 'rb') as f:
+            consolidated = orjson.loads(f.read())
+    else:
+        with open(consolidated_file, 'r') as f:
+            consolidated = json.load(f)
     
     all_results = {}
     
-    # Tag resources in each account
-    for profile, account_data in consolidated['accounts'].items():
-        try:
-            print(f"\nProcessing {profile}...")
-            agent = AWSTaggingAgent(profile, account_data['inventory_file'])
-            results = agent.tag_resources()
-            all_results[profile] = results
-        except Exception as e:
-            print(f"Error processing {profile}: {e}")
-            all_results[profile] = {'error': str(e)}
+    def _run_one(profile, account_data):
+        log.info(f"\nProcessing {profile}...")
+        agent = AWSTaggingAgent(profile, account_data['inventory_file'])
+        return agent.tag_resources()
+    
+    # Accounts are independent and the work is blocking API calls, so tag
+    # them concurrently; each agent owns its Session, so no state is shared
+    accounts = consolidated['accounts']
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(accounts))) as executor:
+        futures = {executor.submit(_run_one, profile, account_data): profile
+                   for profile, account_data in accounts.items()}
+        for future in concurrent.futures.as_completed(futures):
+            profile = futures[future]
+            try:
+                all_results[profile] = future.result()
+            except Exception as e:
+                log.info(f"Error processing {profile}: {e}")
+                all_results[profile] = {'error': str(e)}
     
     # Generate summary report
+    finished_dt = datetime.utcnow()
     summary = {
-        'execution_time': datetime.utcnow().isoformat(),
+        'execution_time': finished_dt.isoformat(),
         'accounts_processed': len(all_results),
         'total_tagged': sum(r.get('resources_tagged', 0) for r in all_results.values()),
         'total_failed': sum(r.get('resources_failed', 0) for r in all_results.values()),
@@ -361,19 +613,18 @@ def main():
                 'status': 'success',
                 'tagged': results.get('resources_tagged', 0),
                 'failed': results.get('resources_failed', 0),
-                'errors': len(results.get('errors', []))
+                'errors': sum(results.get('errors', {}).get('by_kind', {}).values())
             }
     
     # Save summary
     output_dir = "/Users/bc/Desktop/@modulairhr_aws/infra-decom-logs/agents/tagging/results"
-    summary_file = f"{output_dir}/tagging_summary_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    summary_file = f"{output_dir}/tagging_summary_{finished_dt.strftime('%Y%m%d_%H%M%S')}.json"
+    _write_json(summary_file, summary)
     
-    print(f"\n\nTagging Agent Complete!")
-    print(f"Summary saved to: {summary_file}")
-    print(f"Total resources tagged: {summary['total_tagged']}")
-    print(f"Total failures: {summary['total_failed']}")
+    log.info(f"\n\nTagging Agent Complete!")
+    log.info(f"Summary saved to: {summary_file}")
+    log.info(f"Total resources tagged: {summary['total_tagged']}")
+    log.info(f"Total failures: {summary['total_failed']}")
 
 
 if __name__ == "__main__":